@@ -26,6 +26,20 @@ env = environ.Env(
     SENTRY_DSN=(str, ""),
     SENTRY_TRACES_SAMPLE_RATE=(float, 0.0),
     ADMIN_ALLOWED_IPS=(list, []),
+    IDEMPOTENCY_KEY_TTL=(int, 60 * 60 * 24),
+    PRODUCT_CATALOG_CACHE_TTL=(int, 60 * 60),
+    POPULAR_SELLERS_REFRESH_WINDOW=(int, 60),
+    SELLER_DASHBOARD_CACHE_TTL=(int, 120),
+    PLATFORM_METRICS_REFRESH_INTERVAL=(int, 5 * 60),
+    EVENT_HANDLER_BACKEND=(str, "thread"),
+    EVENT_HANDLER_THREADS=(int, 4),
+    EVENT_HANDLER_SLOW_MS=(int, 250),
+    EVENT_OUTBOX_BATCH_SIZE=(int, 100),
+    EVENT_OUTBOX_MAX_ATTEMPTS=(int, 10),
+    EVENT_OUTBOX_RETRY_DELAY=(int, 30),
+    EVENT_OUTBOX_LEASE=(int, 5 * 60),
+    EVENT_OUTBOX_RELAY_INTERVAL=(int, 15),
+    EVENT_OUTBOX_RETENTION_DAYS=(int, 7),
 )
 
 environ.Env.read_env(env_file=BASE_DIR / ".env")
@@ -44,6 +58,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",
     # Third-party
     "rest_framework",
     "rest_framework.authtoken",
@@ -64,6 +79,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.metrics.RequestMetricsMiddleware",
+    "core.middleware.query_inspector.QueryInspectorMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -179,7 +196,7 @@ CORS_ALLOWED_ORIGINS = env.list(
 
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "BACKEND": "core.utils.cache.RedisCache",
         "LOCATION": env("REDIS_URL"),
     }
 }
@@ -198,11 +215,73 @@ DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", default="no-reply@yurtmarket.loca
 REDIS_URL = env("REDIS_URL")
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
+CELERY_BEAT_SCHEDULE = {
+    "analytics.refresh_dirty_popular_sellers": {
+        "task": "analytics.refresh_dirty_popular_sellers",
+        "schedule": env("POPULAR_SELLERS_REFRESH_WINDOW"),
+    },
+    "analytics.refresh_dirty_seller_dashboards": {
+        "task": "analytics.refresh_dirty_seller_dashboards",
+        "schedule": env("POPULAR_SELLERS_REFRESH_WINDOW"),
+    },
+    "analytics.refresh_platform_metrics": {
+        "task": "analytics.refresh_platform_metrics",
+        "schedule": env("PLATFORM_METRICS_REFRESH_INTERVAL"),
+    },
+    "core.events.relay_outbox": {
+        "task": "core.events.relay_outbox",
+        "schedule": env("EVENT_OUTBOX_RELAY_INTERVAL"),
+    },
+    "core.events.purge_outbox": {
+        "task": "core.events.purge_outbox",
+        "schedule": 60 * 60,
+    },
+    "orders.purge_idempotency_keys": {
+        "task": "orders.purge_idempotency_keys",
+        "schedule": 60 * 60,
+    },
+}
 
 PAYMENT_PROVIDER = env("PAYMENT_PROVIDER")
 PAYMENT_SUCCESS_URL = env("PAYMENT_SUCCESS_URL")
 PAYMENT_CANCEL_URL = env("PAYMENT_CANCEL_URL")
 ADMIN_ALLOWED_IPS = env.list("ADMIN_ALLOWED_IPS", default=[])
+# /metrics is open in DEBUG only. Elsewhere scrapers need the bearer token or a
+# REMOTE_ADDR in the allow list; behind a reverse proxy REMOTE_ADDR is the proxy,
+# so prefer the token there.
+METRICS_ALLOWED_IPS = env.list("METRICS_ALLOWED_IPS", default=[])
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+# N+1 detection (development/CI): flag SQL templates repeated more than the threshold
+# in one request and views over their declared query budget.
+QUERY_INSPECTOR_ENABLED = env.bool("QUERY_INSPECTOR_ENABLED", default=DEBUG)
+QUERY_INSPECTOR_STRICT = env.bool("QUERY_INSPECTOR_STRICT", default=False)
+QUERY_INSPECTOR_REPEAT_THRESHOLD = env.int("QUERY_INSPECTOR_REPEAT_THRESHOLD", default=5)
+# Budgets include up to 2 queries for session/token authentication.
+QUERY_BUDGETS = {
+    "healthcheck": 1,
+    "products-list": 4,
+    "product-detail": 6,
+    "GET orders-list": 5,
+    "seller-dashboard": 6,
+    "admin-orders": 4,
+    "admin-products": 4,
+    "admin-users": 3,
+}
+IDEMPOTENCY_KEY_TTL = env("IDEMPOTENCY_KEY_TTL")
+PRODUCT_CATALOG_CACHE_TTL = env("PRODUCT_CATALOG_CACHE_TTL")
+SELLER_DASHBOARD_CACHE_TTL = env("SELLER_DASHBOARD_CACHE_TTL")
+# Where deferred event handlers run: "thread" (local pool), "celery" or "sync".
+EVENT_HANDLER_BACKEND = env("EVENT_HANDLER_BACKEND")
+EVENT_HANDLER_THREADS = env("EVENT_HANDLER_THREADS")
+# Handler calls slower than this (milliseconds) are logged as event.handler_slow.
+EVENT_HANDLER_SLOW_MS = env("EVENT_HANDLER_SLOW_MS")
+# Outbox relay: rows per claim, delivery attempts before parking a row as FAILED,
+# base retry backoff and claim lease (seconds), and how long delivered rows are kept.
+EVENT_OUTBOX_BATCH_SIZE = env("EVENT_OUTBOX_BATCH_SIZE")
+EVENT_OUTBOX_MAX_ATTEMPTS = env("EVENT_OUTBOX_MAX_ATTEMPTS")
+EVENT_OUTBOX_RETRY_DELAY = env("EVENT_OUTBOX_RETRY_DELAY")
+EVENT_OUTBOX_LEASE = env("EVENT_OUTBOX_LEASE")
+EVENT_OUTBOX_RETENTION_DAYS = env("EVENT_OUTBOX_RETENTION_DAYS")
 
 STRUCTLOG_CONFIG = {
     "processors": [
@@ -27,6 +27,9 @@ except ImportError:
 
 INTERNAL_IPS = ["127.0.0.1"]
 
+# base.py derives the default from DJANGO_DEBUG before DEBUG is forced on above.
+QUERY_INSPECTOR_ENABLED = env.bool("QUERY_INSPECTOR_ENABLED", default=True)  # type: ignore[name-defined]
+
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
 
@@ -35,7 +38,7 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 # Development için Redis olmadan çalış (locmem cache kullan)
 CACHES = {  # type: ignore[name-defined]
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "BACKEND": "core.utils.cache.LocMemCache",
         "LOCATION": "unique-snowflake",
     }
 }
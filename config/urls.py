@@ -5,7 +5,7 @@ from django.http import JsonResponse
 from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
-from core.views import HealthCheckView
+from core.views import HealthCheckView, metrics_view
 
 def root_view(request):
     """Root endpoint with API information."""
@@ -34,6 +34,7 @@ def root_view(request):
 urlpatterns = [
     path("", root_view, name="root"),
     path("health/", HealthCheckView.as_view(), name="healthcheck"),
+    path("metrics", metrics_view, name="metrics"),
     path("admin/", admin.site.urls),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path("api/schema/swagger-ui/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import OutboxEvent
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ["id", "name", "status", "attempts", "available_at", "created_at", "delivered_at"]
+    list_filter = ["status", "name"]
+    readonly_fields = ["created_at", "delivered_at"]
+    ordering = ["-id"]
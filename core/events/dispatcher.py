@@ -1,28 +1,260 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Callable, DefaultDict, List, Protocol
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Type,
+    Union,
+)
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from core.utils.logging import get_logger
+from core.utils.metrics import registry
 
 from .base import BaseEvent
 
+logger = get_logger(__name__)
+
+HANDLER_LABELS = ("event", "handler")
+handler_duration = registry.histogram(
+    "event_handler_duration_seconds", "Wall time of one event handler call.", HANDLER_LABELS
+)
+handler_calls = registry.counter("event_handler_calls", "Event handler calls.", HANDLER_LABELS)
+handler_errors = registry.counter("event_handler_errors", "Event handler calls that raised.", HANDLER_LABELS)
+handler_slow = registry.counter(
+    "event_handler_slow", "Event handler calls over EVENT_HANDLER_SLOW_MS.", HANDLER_LABELS
+)
+
 
 class EventHandler(Protocol):
     def __call__(self, event: BaseEvent) -> None: ...
 
 
+class BatchEventHandler(Protocol):
+    def __call__(self, events: List[BaseEvent]) -> None: ...
+
+
+Handler = Union[EventHandler, BatchEventHandler]
+
+
+class Subscription(NamedTuple):
+    handler: Handler
+    batch: bool = False
+
+    def __call__(self, events: List[BaseEvent]) -> None:
+        if self.batch:
+            self.handler(events)
+            return
+        for event in events:
+            self.handler(event)
+
+
+def handler_id(handler: Callable) -> str:
+    """Stable name of a handler, identical in the web process and in Celery workers."""
+    owner = getattr(handler, "__self__", None)
+    qualname = getattr(handler, "__qualname__", type(handler).__qualname__)
+    if owner is not None and "." not in qualname:
+        qualname = f"{type(owner).__qualname__}.{qualname}"
+    return f"{handler.__module__}.{qualname}"
+
+
+def event_name(event: Union[str, Type[BaseEvent]]) -> str:
+    # Slotted dataclasses keep field defaults out of the class namespace, so
+    # ``OrderCreatedEvent.name`` is the slot descriptor rather than "order_created".
+    if isinstance(event, str):
+        return event
+    return event.__dataclass_fields__["name"].default
+
+
+def group_by_name(events: Iterable[BaseEvent]) -> Dict[str, List[int]]:
+    """Positions of ``events`` per event name, in order of first appearance."""
+    groups: Dict[str, List[int]] = {}
+    for index, event in enumerate(events):
+        groups.setdefault(event.name, []).append(index)
+    return groups
+
+
 class EventDispatcher:
-    """Simple in-memory dispatcher for domain events."""
+    """In-memory dispatcher for domain events.
+
+    Handlers subscribed with ``deferred=True`` never run inside the caller: they are
+    queued once the surrounding transaction commits (immediately in autocommit) and
+    executed according to ``settings.EVENT_HANDLER_BACKEND``:
+
+    * ``"thread"`` – on a local thread pool,
+    * ``"celery"`` – as a Celery task, published from the thread pool so the request
+      never waits on the broker,
+    * ``"sync"`` – inline at commit time (tests and management commands).
+
+    Handlers subscribed with ``batch=True`` receive every event of their type from a
+    ``dispatch_many``/``deliver_many`` call as one list instead of one call per event.
+
+    Every handler call is timed into the ``event_handler_*`` metrics. A raising handler
+    is logged and counted but never propagates into the code that dispatched the event.
+    Calls over ``EVENT_HANDLER_SLOW_MS`` are logged as ``event.handler_slow``.
+    """
 
     def __init__(self) -> None:
-        self._subscribers: DefaultDict[str, List[EventHandler]] = defaultdict(list)
+        self._subscribers: DefaultDict[str, List[Subscription]] = defaultdict(list)
+        self._deferred: DefaultDict[str, List[Subscription]] = defaultdict(list)
+        self._handlers: Dict[str, Subscription] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()
+
+    def subscribe(
+        self,
+        event: Union[str, Type[BaseEvent]],
+        handler: Handler,
+        *,
+        deferred: bool = False,
+        batch: bool = False,
+    ) -> None:
+        subscription = Subscription(handler, batch)
+        if deferred:
+            self._deferred[event_name(event)].append(subscription)
+            self._handlers[handler_id(handler)] = subscription
+        else:
+            self._subscribers[event_name(event)].append(subscription)
 
-    def subscribe(self, event_name: str, handler: EventHandler) -> None:
-        self._subscribers[event_name].append(handler)
+    def unsubscribe(self, event: Union[str, Type[BaseEvent]], handler: Handler) -> None:
+        name = event_name(event)
+        for subscriptions in (self._subscribers, self._deferred):
+            subscriptions[name] = [
+                subscription for subscription in subscriptions[name] if subscription.handler != handler
+            ]
 
     def dispatch(self, event: BaseEvent) -> None:
-        for handler in self._subscribers.get(event.name, []):
-            handler(event)
+        self.dispatch_many([event])
 
+    def dispatch_many(self, events: Sequence[BaseEvent]) -> None:
+        for name, positions in group_by_name(events).items():
+            group = [events[index] for index in positions]
+            for subscription in self._subscribers.get(name, []):
+                self._run_each(subscription, name, group)
+            for subscription in self._deferred.get(name, []):
+                transaction.on_commit(lambda handler=subscription.handler, group=group: self._enqueue(handler, group))
 
-event_dispatcher = EventDispatcher()
+    def deliver_many(self, events: Sequence[BaseEvent]) -> Dict[int, Exception]:
+        """Run every handler of ``events`` inline, deferred ones included.
+
+        Used by the outbox relay, which already runs outside the request. All handlers
+        get a chance to run; the result maps the position of each failed event to its
+        first error. A failing batch handler fails every event it was given.
+        """
+        errors: Dict[int, Exception] = {}
+        for name, positions in group_by_name(events).items():
+            for subscription in (*self._subscribers.get(name, []), *self._deferred.get(name, [])):
+                targets = [positions] if subscription.batch else [[index] for index in positions]
+                for target in targets:
+                    error = self._run(subscription, name, [events[index] for index in target])
+                    if error is not None:
+                        for index in target:
+                            errors.setdefault(index, error)
+        return errors
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> None:
+        """Run ``func(*args)`` on the handler thread pool, releasing its DB connection afterwards."""
+
+        def job() -> None:
+            try:
+                func(*args)
+            finally:
+                close_old_connections()
+
+        self._get_executor().submit(job)
+
+    def run_deferred(self, handler_name: str, events: List[BaseEvent]) -> None:
+        """Run a deferred handler by name; used by the Celery task and the thread pool."""
+        subscription = self._handlers.get(handler_name)
+        if subscription is None:
+            logger.error("event.handler_not_found", handler=handler_name, event_name=events[0].name)
+            return
+        self._run_each(subscription, events[0].name, events)
 
+    def _run_each(self, subscription: Subscription, name: str, events: List[BaseEvent]) -> None:
+        """Run a batch handler once, any other handler once per event so a failure skips only that event."""
+        for group in ([events] if subscription.batch else [[event] for event in events]):
+            self._run(subscription, name, group)
+
+    def _run(self, subscription: Subscription, name: str, events: List[BaseEvent]) -> Optional[Exception]:
+        """Call one subscription, timing it and isolating its failure from the caller and other handlers."""
+        handler = handler_id(subscription.handler)
+        started = perf_counter()
+        error: Optional[Exception] = None
+        try:
+            subscription(events)
+        except Exception as exc:
+            error = exc
+        elapsed = perf_counter() - started
+
+        handler_duration.observe(elapsed, event=name, handler=handler)
+        handler_calls.inc(event=name, handler=handler)
+        duration_ms = round(elapsed * 1000, 2)
+        if error is not None:
+            handler_errors.inc(event=name, handler=handler)
+            logger.error(
+                "event.handler_failed",
+                handler=handler,
+                event_name=name,
+                events=len(events),
+                duration_ms=duration_ms,
+                exc_info=error,
+            )
+        elif elapsed * 1000 > settings.EVENT_HANDLER_SLOW_MS:
+            handler_slow.inc(event=name, handler=handler)
+            logger.warning(
+                "event.handler_slow",
+                handler=handler,
+                event_name=name,
+                events=len(events),
+                duration_ms=duration_ms,
+                budget_ms=settings.EVENT_HANDLER_SLOW_MS,
+            )
+        else:
+            logger.debug("event.handler_completed", handler=handler, event_name=name, duration_ms=duration_ms)
+        return error
+
+    def _enqueue(self, handler: Handler, events: List[BaseEvent]) -> None:
+        backend = settings.EVENT_HANDLER_BACKEND
+        name = handler_id(handler)
+        if backend == "sync":
+            self.run_deferred(name, events)
+        elif backend == "celery":
+            self.submit(self._publish, name, events)
+        else:
+            self.submit(self.run_deferred, name, events)
+
+    def _publish(self, handler_name: str, events: List[BaseEvent]) -> None:
+        from .tasks import run_deferred_handler, serialize_events
+
+        try:
+            run_deferred_handler.apply_async((handler_name, serialize_events(events)), retry=False)
+        except Exception:
+            # Broker unreachable: run locally rather than drop the events.
+            logger.warning("event.publish_failed", handler=handler_name, event_name=events[0].name)
+            self.run_deferred(handler_name, events)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=settings.EVENT_HANDLER_THREADS, thread_name_prefix="event-handler"
+                )
+            return self._executor
+
+
+event_dispatcher = EventDispatcher()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+from threading import Event, Lock
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.models import OutboxEvent
+from core.utils.logging import get_logger
+
+from .base import BaseEvent
+from .dispatcher import EventDispatcher, event_dispatcher
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class OutboxRelay:
+    """Transactional outbox: ``publish`` inside the write, ``drain`` delivers afterwards.
+
+    Rows are claimed in batches by pushing ``available_at`` one lease into the future,
+    so a relay that dies mid-batch leaves them to be picked up again once the lease
+    runs out. Failed deliveries back off exponentially and are parked as ``FAILED``
+    after ``EVENT_OUTBOX_MAX_ATTEMPTS``. Handlers must therefore tolerate duplicates.
+    """
+
+    dispatcher: EventDispatcher = event_dispatcher
+    batch_size: Optional[int] = None
+    _kick_requested: Event = field(default_factory=Event, init=False, repr=False)
+    _drain_lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def publish(self, event: BaseEvent) -> OutboxEvent:
+        """Store ``event`` in the caller's transaction and relay it once that commits."""
+        row = OutboxEvent.objects.create(name=event.name, payload=event.payload, occurred_at=event.occurred_at)
+        transaction.on_commit(self._schedule)
+        return row
+
+    def publish_many(self, events: Iterable[BaseEvent]) -> List[OutboxEvent]:
+        rows = OutboxEvent.objects.bulk_create(
+            [OutboxEvent(name=event.name, payload=event.payload, occurred_at=event.occurred_at) for event in events]
+        )
+        if rows:
+            transaction.on_commit(self._schedule)
+        return rows
+
+    def drain(self, max_batches: Optional[int] = None) -> int:
+        """Relay batches until nothing is due (or ``max_batches`` ran); returns events delivered."""
+        delivered = batches = 0
+        while max_batches is None or batches < max_batches:
+            claimed = self._claim()
+            if not claimed:
+                break
+            delivered += self._deliver(claimed)
+            batches += 1
+        return delivered
+
+    def kick(self) -> None:
+        """Drain now unless another thread is already draining; that thread then goes round again."""
+        self._kick_requested.set()
+        while self._kick_requested.is_set() and self._drain_lock.acquire(blocking=False):
+            try:
+                self._kick_requested.clear()
+                self.drain()
+            except Exception:
+                logger.exception("outbox.drain_failed")
+            finally:
+                self._drain_lock.release()
+
+    def purge(self, older_than: timedelta) -> int:
+        deleted, _ = OutboxEvent.objects.filter(
+            status=OutboxEvent.Status.DELIVERED, delivered_at__lt=timezone.now() - older_than
+        ).delete()
+        return deleted
+
+    def _schedule(self) -> None:
+        backend = settings.EVENT_HANDLER_BACKEND
+        if backend == "sync":
+            self.kick()
+        elif backend == "celery":
+            self.dispatcher.submit(self._publish_relay)
+        else:
+            self.dispatcher.submit(self.kick)
+
+    def _publish_relay(self) -> None:
+        from .tasks import relay_outbox
+
+        try:
+            relay_outbox.apply_async(retry=False)
+        except Exception:
+            logger.warning("outbox.publish_failed")
+            self.kick()
+
+    def _claim(self) -> List[OutboxEvent]:
+        now = timezone.now()
+        batch_size = self.batch_size or settings.EVENT_OUTBOX_BATCH_SIZE
+        with transaction.atomic():
+            rows = list(
+                OutboxEvent.objects.select_for_update(skip_locked=True)
+                .filter(status=OutboxEvent.Status.PENDING, available_at__lte=now)
+                .order_by("available_at", "id")[:batch_size]
+            )
+            if rows:
+                OutboxEvent.objects.filter(id__in=[row.id for row in rows]).update(
+                    attempts=F("attempts") + 1,
+                    available_at=now + timedelta(seconds=settings.EVENT_OUTBOX_LEASE),
+                )
+        for row in rows:
+            row.attempts += 1
+        return rows
+
+    def _deliver(self, rows: List[OutboxEvent]) -> int:
+        delivered: List[int] = []
+        failed: List[OutboxEvent] = []
+        errors = self.dispatcher.deliver_many(
+            [BaseEvent(name=row.name, payload=row.payload, occurred_at=row.occurred_at) for row in rows]
+        )
+        for index, row in enumerate(rows):
+            if index in errors:
+                row.last_error = f"{type(errors[index]).__name__}: {errors[index]}"
+                failed.append(row)
+            else:
+                delivered.append(row.id)
+
+        now = timezone.now()
+        if delivered:
+            OutboxEvent.objects.filter(id__in=delivered).update(
+                status=OutboxEvent.Status.DELIVERED, delivered_at=now, last_error=""
+            )
+        for row in failed:
+            if row.attempts >= settings.EVENT_OUTBOX_MAX_ATTEMPTS:
+                row.status = OutboxEvent.Status.FAILED
+                logger.error("outbox.event_failed", outbox_id=row.id, event_name=row.name, attempts=row.attempts)
+            else:
+                delay = settings.EVENT_OUTBOX_RETRY_DELAY * 2 ** (row.attempts - 1)
+                row.available_at = now + timedelta(seconds=min(delay, 60 * 60))
+                logger.warning("outbox.event_retry", outbox_id=row.id, event_name=row.name, attempts=row.attempts)
+        if failed:
+            OutboxEvent.objects.bulk_update(failed, ["status", "available_at", "last_error"])
+        return len(delivered)
+
+
+outbox = OutboxRelay()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from celery import shared_task
+from django.conf import settings
+
+from .base import BaseEvent
+from .dispatcher import event_dispatcher
+
+
+def serialize_events(events: List[BaseEvent]) -> List[Dict[str, Any]]:
+    return [
+        {"name": event.name, "payload": event.payload, "occurred_at": event.occurred_at.isoformat()}
+        for event in events
+    ]
+
+
+@shared_task(name="core.events.run_deferred_handler", ignore_result=True)
+def run_deferred_handler(handler_name: str, events: List[Dict[str, Any]]) -> None:
+    event_dispatcher.run_deferred(
+        handler_name,
+        [
+            BaseEvent(name=data["name"], payload=data["payload"], occurred_at=datetime.fromisoformat(data["occurred_at"]))
+            for data in events
+        ],
+    )
+
+
+@shared_task(name="core.events.relay_outbox", ignore_result=True)
+def relay_outbox() -> None:
+    """Deliver due outbox events; also picks up retries and rows left behind by a crashed relay."""
+    from .outbox import outbox
+
+    outbox.kick()
+
+
+@shared_task(name="core.events.purge_outbox", ignore_result=True)
+def purge_outbox() -> None:
+    from .outbox import outbox
+
+    outbox.purge(timedelta(days=settings.EVENT_OUTBOX_RETENTION_DAYS))
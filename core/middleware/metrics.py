@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Optional
+
+from django.db import connection
+
+from core.utils.metrics import registry
+
+VIEW_LABELS = ("view", "method")
+
+requests_total = registry.counter(
+    "http_requests", "HTTP requests by view, method and status class.", (*VIEW_LABELS, "status")
+)
+request_duration = registry.histogram("http_request_duration_seconds", "Request wall time.", VIEW_LABELS)
+request_queries = registry.histogram(
+    "http_request_db_queries",
+    "Database queries issued per request.",
+    VIEW_LABELS,
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250),
+)
+request_db_duration = registry.histogram(
+    "http_request_db_duration_seconds", "Time spent in database queries per request.", VIEW_LABELS
+)
+response_size = registry.histogram(
+    "http_response_size_bytes",
+    "Size of non-streaming response bodies.",
+    VIEW_LABELS,
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+cache_lookups = registry.counter(
+    "http_request_cache_lookups", "Cache reads per view, by result.", ("view", "result")
+)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_time: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def time_query(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += perf_counter() - started
+            self.queries += 1
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def record_cache_lookups(*, hits: int = 0, misses: int = 0) -> None:
+    """Called by ``core.utils.cache`` backends; a no-op outside a request."""
+    stats = _current.get()
+    if stats is not None:
+        stats.cache_hits += hits
+        stats.cache_misses += misses
+
+
+class RequestMetricsMiddleware:
+    """Record per-view request, database, cache and response-size metrics.
+
+    Served from ``/metrics``. Keep it first in ``MIDDLEWARE`` so the latency covers the
+    whole stack. Queries run while a streaming response is being consumed are not
+    counted.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = perf_counter()
+        try:
+            with connection.execute_wrapper(stats.time_query):
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._record(request, response, stats, perf_counter() - started)
+        return response
+
+    def _record(self, request, response, stats: RequestStats, elapsed: float) -> None:
+        match = getattr(request, "resolver_match", None)
+        labels = {"view": match.view_name if match else "<unresolved>", "method": request.method}
+
+        requests_total.inc(**labels, status=f"{response.status_code // 100}xx")
+        request_duration.observe(elapsed, **labels)
+        request_queries.observe(stats.queries, **labels)
+        request_db_duration.observe(stats.db_time, **labels)
+        if not response.streaming:
+            response_size.observe(len(response.content), **labels)
+        if stats.cache_hits:
+            cache_lookups.inc(stats.cache_hits, view=labels["view"], result="hit")
+        if stats.cache_misses:
+            cache_lookups.inc(stats.cache_misses, view=labels["view"], result="miss")
@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from core.utils.logging import get_logger
+from core.utils.queries import QueryBudgetExceeded, QueryRecorder
+
+logger = get_logger(__name__)
+
+
+class QueryInspectorMiddleware:
+    """Flag N+1 query patterns and per-view query budget overruns (development and CI).
+
+    Every SQL template repeated more than ``QUERY_INSPECTOR_REPEAT_THRESHOLD`` times in
+    one request, and every view exceeding its ``QUERY_BUDGETS`` entry (keyed by URL name,
+    or ``"<METHOD> <URL name>"`` for a single method), is logged as
+    ``queries.inspection_failed``. With ``QUERY_INSPECTOR_STRICT`` the request raises
+    ``QueryBudgetExceeded`` instead, which fails the test that made it.
+    Disabled unless ``QUERY_INSPECTOR_ENABLED``.
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_INSPECTOR_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with QueryRecorder().record() as recorder:
+            response = self.get_response(request)
+
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match else None
+        budgets = settings.QUERY_BUDGETS
+        budget = budgets.get(f"{request.method} {view}", budgets.get(view))
+        problems = recorder.problems(budget, settings.QUERY_INSPECTOR_REPEAT_THRESHOLD)
+        response["X-Query-Count"] = str(recorder.total)
+        if problems:
+            logger.warning("queries.inspection_failed", view=view, path=request.path, problems=problems)
+            if settings.QUERY_INSPECTOR_STRICT:
+                raise QueryBudgetExceeded(f"{request.method} {request.path} ({view}): " + "; ".join(problems))
+        return response
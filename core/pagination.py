@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    """Keep datetimes at full precision; ``DjangoJSONEncoder`` truncates them to milliseconds,
+    which would make the seek filter skip rows sharing the boundary's millisecond."""
+
+    def default(self, o):
+        if isinstance(o, datetime):
+            return {"datetime": o.isoformat()}
+        return super().default(o)
+
+
+def _cursor_object_hook(obj: Dict[str, Any]) -> Any:
+    if obj.keys() == {"datetime"}:
+        return datetime.fromisoformat(obj["datetime"])
+    return obj
+
+
+class KeysetPagination(BasePagination):
+    """Seek-based pagination over a unique, non-null ordering.
+
+    The cursor stores the ordering values of the last row on the page, and the next
+    page is fetched with ``WHERE (a, b) < (x, y)`` style predicates. Unlike OFFSET
+    pagination, the cost of a page does not grow with how deep the client has scrolled.
+    The ordering must end with a unique column (usually ``id``) to be stable.
+    """
+
+    ordering: Sequence[str] = ("-created_at", "-id")
+    page_size: int = api_settings.PAGE_SIZE or 20
+    max_page_size: int = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Geçersiz sayfa imleci."
+
+    def __init__(self, ordering: Optional[Sequence[str]] = None) -> None:
+        if ordering is not None:
+            self.ordering = tuple(ordering)
+        self.request = None
+        self.next_position: Optional[List[Any]] = None
+
+    def get_page_size(self, request) -> int:
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw is None:
+            return self.page_size
+        try:
+            value = int(raw)
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(value, self.max_page_size))
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> List[Any]:
+        self.request = request
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self._seek_filter(position))
+
+        rows = list(queryset[: page_size + 1])
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        self.next_position = self._position_of(rows[-1]) if has_next else None
+        return rows
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_position is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    def get_paginated_response(self, data) -> Response:
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def encode_cursor(self, position: List[Any]) -> str:
+        raw = json.dumps(position, cls=_CursorEncoder).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    def decode_cursor(self, request) -> Optional[List[Any]]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(
+                base64.urlsafe_b64decode(encoded.encode()).decode(), object_hook=_cursor_object_hook
+            )
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message) from None
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def _position_of(self, row: Any) -> List[Any]:
+        position = []
+        for term in self.ordering:
+            value = row
+            for part in term.lstrip("-").split("__"):
+                value = value[part] if isinstance(value, dict) else getattr(value, part)
+            position.append(value)
+        return position
+
+    def _seek_filter(self, position: List[Any]) -> Q:
+        """Build ``(f1 > v1) OR (f1 = v1 AND f2 > v2) OR ...`` honouring each term's direction."""
+        condition = Q()
+        equal_prefix = Q()
+        for term, value in zip(self.ordering, position, strict=True):
+            field = term.lstrip("-")
+            lookup = "lt" if term.startswith("-") else "gt"
+            condition |= equal_prefix & Q(**{f"{field}__{lookup}": value})
+            equal_prefix &= Q(**{field: value})
+        return condition
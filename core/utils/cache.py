@@ -0,0 +1,32 @@
+"""Cache backends that report hits and misses to the request metrics."""
+
+from __future__ import annotations
+
+from django.core.cache.backends import locmem, redis
+
+from core.middleware.metrics import record_cache_lookups
+
+_MISSING = object()
+
+
+class InstrumentedCacheMixin:
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version=version)
+        if value is _MISSING:
+            record_cache_lookups(misses=1)
+            return default
+        record_cache_lookups(hits=1)
+        return value
+
+
+class LocMemCache(InstrumentedCacheMixin, locmem.LocMemCache):
+    # BaseCache.get_many() goes through get(), so lookups are already counted there.
+    pass
+
+
+class RedisCache(InstrumentedCacheMixin, redis.RedisCache):
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        found = super().get_many(keys, version=version)
+        record_cache_lookups(hits=len(found), misses=len(keys) - len(found))
+        return found
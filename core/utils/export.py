@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import csv
+import json
+from typing import Any, Dict, Iterable, Iterator, Sequence
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+class _Echo:
+    """File-like object whose ``write`` hands the line back to the caller instead of buffering it."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _ndjson_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+
+
+def _csv_lines(rows: Iterable[Dict[str, Any]], fields: Sequence[str]) -> Iterator[str]:
+    writer = csv.DictWriter(_Echo(), fieldnames=fields, extrasaction="ignore")
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def streaming_export(rows: Iterable[Dict[str, Any]], fields: Sequence[str], fmt: str, filename: str):
+    """Stream ``rows`` as NDJSON or CSV without materializing them.
+
+    Pair with ``QuerySet.values(...).iterator(chunk_size=...)`` so memory stays flat
+    regardless of the number of rows exported.
+    """
+    lines = _csv_lines(rows, fields) if fmt == "csv" else _ndjson_lines(rows)
+    response = StreamingHttpResponse(lines, content_type=EXPORT_FORMATS[fmt])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{fmt}"'
+    return response
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Callable
+
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+
+
+def make_etag(*parts) -> str:
+    """Build a quoted strong ETag from the given version components."""
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def conditional_response(request, etag: str, build: Callable[[], HttpResponseBase]) -> HttpResponseBase:
+    """Return 304 when ``If-None-Match`` matches ``etag``; otherwise build and tag the response.
+
+    ``build`` is only called on a miss, so serialization is skipped entirely for
+    clients that already hold the current representation.
+    """
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+    response = build()
+    response["ETag"] = etag
+    return response
@@ -0,0 +1,66 @@
+"""Record executed SQL grouped by template to spot N+1 patterns and query budget overruns."""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Iterator, List, Optional, Tuple
+
+from django.db import connection
+
+_SAVEPOINT = re.compile(r'SAVEPOINT "[^"]+"')
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w\"])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN \((?:\s*(?:%s|\?)\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse literals and ``IN`` lists so queries differing only in values share a template."""
+    sql = _SAVEPOINT.sub("SAVEPOINT ?", sql)
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when a request or test block runs more queries than it declared."""
+
+
+@dataclass
+class QueryRecorder:
+    """``connection.execute_wrapper`` callable counting queries per normalized template."""
+
+    templates: Counter = field(default_factory=Counter)
+    total: int = 0
+    duration: float = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += perf_counter() - started
+            self.total += 1
+            self.templates[normalize_sql(sql)] += 1
+
+    @contextmanager
+    def record(self, using=connection) -> Iterator["QueryRecorder"]:
+        with using.execute_wrapper(self):
+            yield self
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Templates executed more than ``threshold`` times, most frequent first."""
+        return [(sql, count) for sql, count in self.templates.most_common() if count > threshold]
+
+    def problems(self, budget: Optional[int], repeat_threshold: Optional[int]) -> List[str]:
+        problems = []
+        if budget is not None and self.total > budget:
+            problems.append(f"{self.total} queries, budget is {budget}")
+        if repeat_threshold is not None:
+            problems += [f"{count}x {sql}" for sql, count in self.repeated(repeat_threshold)]
+        return problems
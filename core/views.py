@@ -1,8 +1,14 @@
+import hmac
+
+from django.conf import settings
 from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
 from rest_framework import permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.utils.metrics import registry
+
 
 class HealthCheckView(APIView):
     """Lightweight health endpoint for load balancers/monitoring."""
@@ -24,3 +30,24 @@ class HealthCheckView(APIView):
             }
         )
 
+
+
+def _metrics_access_allowed(request) -> bool:
+    if settings.DEBUG:
+        return True
+    token = settings.METRICS_TOKEN
+    if token and hmac.compare_digest(request.META.get("HTTP_AUTHORIZATION", ""), f"Bearer {token}"):
+        return True
+    return request.META.get("REMOTE_ADDR") in settings.METRICS_ALLOWED_IPS
+
+
+def metrics_view(request):
+    """Prometheus scrape endpoint for this process's metrics.
+
+    Outside DEBUG it is closed unless the scraper sends ``Authorization: Bearer
+    <METRICS_TOKEN>`` or connects from an address in ``METRICS_ALLOWED_IPS``.
+    Behind a reverse proxy ``REMOTE_ADDR`` is the proxy itself, so use the token there.
+    """
+    if not _metrics_access_allowed(request):
+        return HttpResponseForbidden("Metrics access restricted.")
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
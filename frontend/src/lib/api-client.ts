@@ -1,6 +1,7 @@
 import axios from "axios";
 import { env } from "../config/env";
 import { authStore } from "../store/auth";
+import type { CursorPage } from "../types";
 
 const api = axios.create({
   baseURL: env.apiUrl,
@@ -47,5 +48,20 @@ api.interceptors.response.use(
   },
 );
 
-export { api };
+/** Fetch every page of a keyset-paginated endpoint by following `next` until it is null. */
+const fetchAllPages = async <T>(url: string, params?: Record<string, unknown>): Promise<T[]> => {
+  const results: T[] = [];
+  let next: string | null = url;
+  let pageParams = params;
+  while (next) {
+    const { data }: { data: CursorPage<T> } = await api.get<CursorPage<T>>(next, { params: pageParams });
+    results.push(...data.results);
+    next = data.next;
+    // `next` already carries the filters and the cursor.
+    pageParams = undefined;
+  }
+  return results;
+};
+
+export { api, fetchAllPages };
 
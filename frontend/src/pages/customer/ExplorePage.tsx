@@ -1,5 +1,5 @@
-import { useQuery } from "@tanstack/react-query";
-import { fetchDormProducts } from "../../services/products";
+import { useInfiniteQuery } from "@tanstack/react-query";
+import { CatalogSort, fetchDormProducts } from "../../services/products";
 import { authStore } from "../../store/auth";
 import { useMemo, useState } from "react";
 import { createOrder } from "../../services/orders";
@@ -10,9 +10,16 @@ import { toast } from "react-hot-toast";
 import { getErrorMessage } from "../../lib/errors";
 import { Search, ShoppingCart, User, Plus, Minus, X, ChevronUp, ChevronDown } from "lucide-react";
 import { Link, useNavigate } from "react-router-dom";
+import { Product } from "../../types";
 
 type SortOption = "newest" | "name" | "price_asc";
 
+const CATALOG_SORT: Record<SortOption, CatalogSort> = {
+  newest: "newest",
+  name: "name",
+  price_asc: "price",
+};
+
 // --- Alt Bileşen: Sepet İçeriği (Hem Mobilde Hem Masaüstünde Kullanılacak) ---
 const CartContent = ({
   cartItems,
@@ -120,15 +127,22 @@ export const ExplorePage = () => {
   const [selectedCategory, setSelectedCategory] = useState<string | null>(null);
   const [sortBy, setSortBy] = useState<SortOption>("newest");
   const [cart, setCart] = useState<Record<number, number>>({});
+  // Cart lines keep their product even when a re-sort reloads the catalog pages.
+  const [cartProducts, setCartProducts] = useState<Record<number, Product>>({});
   
   // Mobil Sepet State'i
   const [showMobileCart, setShowMobileCart] = useState(false);
 
-  const { data, isLoading } = useQuery({
-    queryKey: ["products", dormId],
-    queryFn: () => fetchDormProducts(dormId),
+  // The catalog is keyset-paginated and sorted server-side; pages load on demand.
+  const { data: pages, isLoading, hasNextPage, fetchNextPage, isFetchingNextPage } = useInfiniteQuery({
+    queryKey: ["products", dormId, sortBy],
+    queryFn: ({ pageParam }) => fetchDormProducts(dormId, { sort: CATALOG_SORT[sortBy], cursor: pageParam }),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next,
     enabled: Boolean(dormId),
   });
+  const data = useMemo(() => pages?.pages.flatMap((page) => page.results), [pages]);
+  const cartProductList = useMemo(() => Object.values(cartProducts), [cartProducts]);
 
   // ... (useMemo logicleri aynı kalıyor - categories, filteredProducts vb.)
   const categories = useMemo(() => {
@@ -155,15 +169,8 @@ export const ExplorePage = () => {
     if (selectedCategory) {
       filtered = filtered.filter((p) => p.category_name === selectedCategory);
     }
-    filtered.sort((a, b) => {
-      switch (sortBy) {
-        case "price_asc": return Number(a.price || 0) - Number(b.price || 0);
-        case "name": return a.name.localeCompare(b.name, "tr");
-        case "newest": default: return (b.id || 0) - (a.id || 0);
-      }
-    });
     return filtered;
-  }, [data, searchQuery, selectedCategory, sortBy]);
+  }, [data, searchQuery, selectedCategory]);
 
   // ... (Cart logicleri aynı)
   const addToCart = (productId: number) => {
@@ -172,6 +179,8 @@ export const ExplorePage = () => {
       toast.error("Bu mağaza kapalı.");
       return;
     }
+    if (!product) return;
+    setCartProducts((prev) => ({ ...prev, [productId]: product }));
     setCart((prev) => ({ ...prev, [productId]: (prev[productId] ?? 0) + 1 }));
     toast.success("Sepete eklendi");
   };
@@ -193,10 +202,9 @@ export const ExplorePage = () => {
   };
 
   const cartItems = useMemo(() => {
-    if (!data) return [];
     return Object.entries(cart)
       .map(([id, quantity]) => {
-        const product = data.find((p) => p.id === Number(id));
+        const product = cartProducts[Number(id)];
         return product
           ? {
               product_id: product.id,
@@ -208,7 +216,7 @@ export const ExplorePage = () => {
           : null;
       })
       .filter((item): item is NonNullable<typeof item> => item !== null);
-  }, [cart, data]);
+  }, [cart, cartProducts]);
 
   const cartTotal = useMemo(() => {
     return cartItems.reduce((sum, item) => sum + item.price * item.quantity, 0);
@@ -452,6 +460,18 @@ export const ExplorePage = () => {
               })}
             </div>
           )}
+
+          {hasNextPage && (
+            <div className="flex justify-center">
+              <button
+                onClick={() => fetchNextPage()}
+                disabled={isFetchingNextPage}
+                className="rounded-full border border-slate-200 bg-white px-6 py-2.5 text-sm font-semibold text-slate-700 transition-colors hover:bg-slate-50 disabled:cursor-not-allowed disabled:opacity-60"
+              >
+                {isFetchingNextPage ? "Yükleniyor..." : "Daha fazla ürün yükle"}
+              </button>
+            </div>
+          )}
         </div>
 
         {/* Right Column - Desktop Cart Sidebar (HIDDEN ON MOBILE) */}
@@ -459,7 +479,7 @@ export const ExplorePage = () => {
           <h2 className="text-xl font-bold text-slate-900">Sepetim</h2>
           <CartContent 
             cartItems={cartItems} 
-            data={data || []} 
+            data={cartProductList} 
             updateCartQuantity={updateCartQuantity} 
             cartTotal={cartTotal} 
             onCheckout={() => setShowOrderModal(true)}
@@ -513,7 +533,7 @@ export const ExplorePage = () => {
              <div className="flex-1 overflow-y-auto">
                <CartContent 
                 cartItems={cartItems} 
-                data={data || []} 
+                data={cartProductList} 
                 updateCartQuantity={updateCartQuantity} 
                 cartTotal={cartTotal} 
                 onCheckout={() => setShowOrderModal(true)}
@@ -533,9 +553,9 @@ export const ExplorePage = () => {
         onConfirm={handleOrderConfirm}
         isLoading={orderMutation.isPending}
         sellerInfo={
-            cartItems.length > 0 && data
+            cartItems.length > 0
               ? (() => {
-                  const firstProduct = data.find((p) => p.id === cartItems[0].product_id);
+                  const firstProduct = cartProductList.find((p) => p.id === cartItems[0].product_id);
                   return firstProduct
                     ? {
                         phone: firstProduct.seller_phone,
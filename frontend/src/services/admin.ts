@@ -1,4 +1,4 @@
-import { api } from "../lib/api-client";
+import { api, fetchAllPages } from "../lib/api-client";
 import { User, Product, Order } from "../types";
 
 export interface AdminDashboardStats {
@@ -13,6 +13,7 @@ export interface AdminDashboardStats {
   sales_last_month: number;
   active_now: number;
   active_now_change: number;
+  computed_at: string;
 }
 
 export interface RecentOrder {
@@ -36,18 +37,12 @@ export const fetchAdminRecentOrders = async (limit: number = 10) => {
   return data;
 };
 
-export const fetchAdminUsers = async () => {
-  const { data } = await api.get<User[]>("/api/admin/users");
-  return data;
-};
+export const fetchAdminUsers = () =>
+  fetchAllPages<User>("/api/admin/users", { page_size: 100 });
 
-export const fetchAdminProducts = async () => {
-  const { data } = await api.get<Product[]>("/api/admin/products");
-  return data;
-};
+export const fetchAdminProducts = () =>
+  fetchAllPages<Product>("/api/admin/products", { page_size: 100 });
 
-export const fetchAdminOrders = async () => {
-  const { data } = await api.get<Order[]>("/api/admin/orders");
-  return data;
-};
+export const fetchAdminOrders = () =>
+  fetchAllPages<Order>("/api/admin/orders", { page_size: 100 });
 
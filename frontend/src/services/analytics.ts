@@ -17,8 +17,11 @@ export interface SellerDashboardStats {
   customers_change: number;
 }
 
+export type RevenueGranularity = "day" | "week" | "month";
+
 export interface RevenueDataPoint {
   week: string;
+  date: string;
   revenue: number;
 }
 
@@ -35,6 +38,8 @@ export interface SellerDashboardResponse {
   revenue_over_time: RevenueDataPoint[];
   top_products: TopProduct[];
   date_range: number;
+  granularity: RevenueGranularity;
+  computed_at: string;
 }
 
 export const fetchPopularSellers = async (dormId: number) => {
@@ -42,8 +47,13 @@ export const fetchPopularSellers = async (dormId: number) => {
   return data;
 };
 
-export const fetchSellerDashboard = async (range: "7" | "30" | "365" = "30") => {
-  const { data } = await api.get<SellerDashboardResponse>(`/api/analytics/seller/dashboard?range=${range}`);
+export const fetchSellerDashboard = async (
+  range: "7" | "30" | "365" = "30",
+  granularity: RevenueGranularity = "week"
+) => {
+  const { data } = await api.get<SellerDashboardResponse>("/api/analytics/seller/dashboard", {
+    params: { range, granularity },
+  });
   return data;
 };
 
@@ -1,12 +1,8 @@
-import { api } from "../lib/api-client";
+import { api, fetchAllPages } from "../lib/api-client";
 import { Order } from "../types";
 
-export const fetchMyOrders = async (role: "customer" | "seller" = "customer") => {
-  const params = role === "seller" ? "?role=seller" : "";
-  const endpoint = params ? `/api/orders${params}` : "/api/orders";
-  const { data } = await api.get<Order[]>(endpoint);
-  return data;
-};
+export const fetchMyOrders = (role: "customer" | "seller" = "customer") =>
+  fetchAllPages<Order>("/api/orders", { role, page_size: 100 });
 
 export const createOrder = async (payload: {
   notes?: string;
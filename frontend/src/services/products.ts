@@ -1,5 +1,5 @@
 import { api } from "../lib/api-client";
-import { Product } from "../types";
+import { CursorPage, Product } from "../types";
 
 export interface Category {
   id: number;
@@ -7,8 +7,18 @@ export interface Category {
   slug: string;
 }
 
-export const fetchDormProducts = async (dormId?: number) => {
-  const { data } = await api.get<Product[]>(`/api/products?dorm=${dormId ?? ""}`);
+export type CatalogSort = "name" | "price" | "-price" | "newest" | "popularity";
+
+/** One catalog page; pass the previous page's `next` as `cursor` to load the following one. */
+export const fetchDormProducts = async (
+  dormId?: number,
+  { sort = "name", cursor = null }: { sort?: CatalogSort; cursor?: string | null } = {},
+) => {
+  // `next` already carries the dorm, sort and page size.
+  const { data } = await api.get<CursorPage<Product>>(
+    cursor ?? "/api/products",
+    cursor ? undefined : { params: { dorm: dormId, sort, page_size: 24 } },
+  );
   return data;
 };
 
@@ -83,3 +83,8 @@ export interface SubscriptionStatus {
   product_slots: number;
 }
 
+
+export interface CursorPage<T> {
+  next: string | null;
+  results: T[];
+}
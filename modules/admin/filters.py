@@ -0,0 +1,42 @@
+import django_filters
+from django.contrib.auth import get_user_model
+
+from modules.orders.filters import OrderFilter
+from modules.products.models import Product
+
+User = get_user_model()
+
+
+class AdminUserFilter(django_filters.FilterSet):
+    role = django_filters.ChoiceFilter(choices=User.Roles.choices)
+    dorm = django_filters.NumberFilter(field_name="dorm_id")
+    is_staff = django_filters.BooleanFilter()
+    joined_after = django_filters.IsoDateTimeFilter(field_name="date_joined", lookup_expr="gte")
+    joined_before = django_filters.IsoDateTimeFilter(field_name="date_joined", lookup_expr="lt")
+    q = django_filters.CharFilter(field_name="email", lookup_expr="icontains")
+
+    class Meta:
+        model = User
+        fields = ["role", "dorm", "is_staff", "joined_after", "joined_before", "q"]
+
+
+class AdminProductFilter(django_filters.FilterSet):
+    dorm = django_filters.NumberFilter(field_name="dorm_id")
+    seller = django_filters.NumberFilter(field_name="seller_id")
+    category = django_filters.NumberFilter(field_name="category_id")
+    is_active = django_filters.BooleanFilter()
+    is_out_of_stock = django_filters.BooleanFilter()
+    q = django_filters.CharFilter(field_name="name", lookup_expr="icontains")
+
+    class Meta:
+        model = Product
+        fields = ["dorm", "seller", "category", "is_active", "is_out_of_stock", "q"]
+
+
+class AdminOrderFilter(OrderFilter):
+    dorm = django_filters.NumberFilter(field_name="dorm_id")
+    seller = django_filters.NumberFilter(field_name="seller_id")
+    customer = django_filters.NumberFilter(field_name="customer_id")
+
+    class Meta(OrderFilter.Meta):
+        fields = OrderFilter.Meta.fields + ["dorm", "seller", "customer"]
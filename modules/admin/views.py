@@ -1,14 +1,18 @@
-from rest_framework import permissions, status
+from abc import ABCMeta, abstractmethod
+
+from django.db.models import Prefetch
+from rest_framework import permissions, serializers, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.db.models import Sum, Count, Q
-from django.utils import timezone
-from datetime import timedelta
 
-from modules.orders.models import Order
-from modules.users.models import User
+from core.pagination import KeysetPagination
+from core.utils.export import EXPORT_FORMATS, streaming_export
+from modules.analytics.services import PlatformMetricsService
+from modules.orders.models import Order, OrderItem
 from modules.products.models import Product
-from modules.subscription.models import SellerSubscription
+from modules.users.models import User
+
+from .filters import AdminOrderFilter, AdminProductFilter, AdminUserFilter
 
 
 class AdminDashboardView(APIView):
@@ -20,91 +24,8 @@ class AdminDashboardView(APIView):
         if not (request.user.is_staff or request.user.is_superuser):
             return Response({"detail": "Admin access required."}, status=status.HTTP_403_FORBIDDEN)
 
-        now = timezone.now()
-        last_month = now - timedelta(days=30)
-        last_hour = now - timedelta(hours=1)
-
-        # Total Revenue (all time)
-        total_revenue = Order.objects.filter(status=Order.Status.COMPLETED).aggregate(
-            total=Sum("total_amount")
-        )["total"] or 0
-
-        # Revenue last month
-        revenue_last_month = Order.objects.filter(
-            status=Order.Status.COMPLETED, created_at__gte=last_month
-        ).aggregate(total=Sum("total_amount"))["total"] or 0
-
-        # Revenue previous month (for comparison)
-        prev_month_start = last_month - timedelta(days=30)
-        revenue_prev_month = Order.objects.filter(
-            status=Order.Status.COMPLETED,
-            created_at__gte=prev_month_start,
-            created_at__lt=last_month,
-        ).aggregate(total=Sum("total_amount"))["total"] or 0
-
-        revenue_change = (
-            ((revenue_last_month - revenue_prev_month) / revenue_prev_month * 100)
-            if revenue_prev_month > 0
-            else (100 if revenue_last_month > 0 else 0)
-        )
-
-        # Subscriptions
-        total_subscriptions = SellerSubscription.objects.filter(is_active=True).count()
-        subscriptions_last_month = SellerSubscription.objects.filter(
-            created_at__gte=last_month, is_active=True
-        ).count()
-        subscriptions_prev_month = SellerSubscription.objects.filter(
-            created_at__gte=prev_month_start,
-            created_at__lt=last_month,
-            is_active=True,
-        ).count()
-
-        subscriptions_change = (
-            ((subscriptions_last_month - subscriptions_prev_month) / subscriptions_prev_month * 100)
-            if subscriptions_prev_month > 0
-            else (100 if subscriptions_last_month > 0 else 0)
-        )
-
-        # Sales (completed orders)
-        total_sales = Order.objects.filter(status=Order.Status.COMPLETED).count()
-        sales_last_month = Order.objects.filter(
-            status=Order.Status.COMPLETED, created_at__gte=last_month
-        ).count()
-        sales_prev_month = Order.objects.filter(
-            status=Order.Status.COMPLETED,
-            created_at__gte=prev_month_start,
-            created_at__lt=last_month,
-        ).count()
-
-        sales_change = (
-            ((sales_last_month - sales_prev_month) / sales_prev_month * 100)
-            if sales_prev_month > 0
-            else (100 if sales_last_month > 0 else 0)
-        )
-
-        # Active Now (users active in last hour)
-        active_users = User.objects.filter(last_login__gte=last_hour).count()
-        active_users_prev_hour = User.objects.filter(
-            last_login__gte=last_hour - timedelta(hours=1),
-            last_login__lt=last_hour,
-        ).count()
-        active_users_change = active_users - active_users_prev_hour
-
-        return Response(
-            {
-                "total_revenue": float(total_revenue),
-                "revenue_change": round(revenue_change, 1),
-                "revenue_last_month": float(revenue_last_month),
-                "subscriptions": total_subscriptions,
-                "subscriptions_change": round(subscriptions_change, 1),
-                "subscriptions_last_month": subscriptions_last_month,
-                "sales": total_sales,
-                "sales_change": round(sales_change, 1),
-                "sales_last_month": sales_last_month,
-                "active_now": active_users,
-                "active_now_change": active_users_change,
-            }
-        )
+        # Served from the periodically refreshed PlatformMetrics snapshot
+        return Response(PlatformMetricsService().dashboard())
 
 
 class AdminRecentOrdersView(APIView):
@@ -165,44 +86,149 @@ def check_admin_permission(user):
         raise PermissionDenied("Admin access required.")
 
 
-class AdminUsersView(APIView):
+class AdminListView(APIView, metaclass=ABCMeta):
+    """Keyset-paginated, filterable admin listing with a streaming ``?export=ndjson|csv`` mode.
+
+    ``?format=`` is taken by DRF's renderer negotiation, hence ``export``.
+    """
+
     permission_classes = [permissions.IsAuthenticated]
+    filterset_class = None
+    ordering = ("-created_at", "-id")
+    export_fields: tuple = ()
+    export_name = ""
+    export_chunk_size = 2000
+
+    @abstractmethod
+    def get_queryset(self):
+        """Base queryset the filterset narrows down."""
+
+    def with_relations(self, queryset):
+        """Load everything ``present`` touches for a page of rows."""
+        return queryset
+
+    @abstractmethod
+    def present(self, rows):
+        """Serialize one page of rows."""
 
     def get(self, request):
-        """List all users for admin."""
         check_admin_permission(request.user)
-        
-        users = User.objects.select_related("dorm").order_by("-date_joined")
-        
+
+        filterset = self.filterset_class(request.query_params, queryset=self.get_queryset())
+        if not filterset.is_valid():
+            raise serializers.ValidationError(filterset.errors)
+
+        export = request.query_params.get("export")
+        if export is not None:
+            if export not in EXPORT_FORMATS:
+                raise serializers.ValidationError({"export": [f"Desteklenen biçimler: {', '.join(EXPORT_FORMATS)}."]})
+            rows = (
+                filterset.qs.order_by(*self.ordering)
+                .values(*self.export_fields)
+                .iterator(chunk_size=self.export_chunk_size)
+            )
+            return streaming_export(rows, self.export_fields, export, self.export_name)
+
+        paginator = KeysetPagination(ordering=self.ordering)
+        page = paginator.paginate_queryset(self.with_relations(filterset.qs), request, view=self)
+        return paginator.get_paginated_response(self.present(page))
+
+
+class AdminUsersView(AdminListView):
+    """List all users for admin."""
+
+    filterset_class = AdminUserFilter
+    ordering = ("-date_joined", "-id")
+    export_fields = (
+        "id",
+        "email",
+        "role",
+        "dorm_id",
+        "date_joined",
+        "last_login",
+        "phone",
+        "room_number",
+        "block",
+        "is_staff",
+        "is_superuser",
+    )
+    export_name = "users"
+
+    def get_queryset(self):
+        return User.objects.all()
+
+    def with_relations(self, queryset):
+        return queryset.select_related("dorm", "seller_profile")
+
+    def present(self, rows):
         from modules.users.serializers import UserSerializer
-        serializer = UserSerializer(users, many=True)
-        return Response(serializer.data)
 
+        return UserSerializer(rows, many=True).data
 
-class AdminProductsView(APIView):
-    permission_classes = [permissions.IsAuthenticated]
 
-    def get(self, request):
-        """List all products for admin."""
-        check_admin_permission(request.user)
-        
-        products = Product.objects.select_related("seller", "category", "dorm", "stock").order_by("-created_at")
-        
-        from modules.products.serializers import ProductSerializer
-        serializer = ProductSerializer(products, many=True)
-        return Response(serializer.data)
+class AdminProductsView(AdminListView):
+    """List all products for admin."""
 
+    filterset_class = AdminProductFilter
+    export_fields = (
+        "id",
+        "name",
+        "dorm_id",
+        "seller_id",
+        "seller__email",
+        "category__name",
+        "price",
+        "stock__quantity",
+        "is_active",
+        "is_out_of_stock",
+        "created_at",
+    )
+    export_name = "products"
 
-class AdminOrdersView(APIView):
-    permission_classes = [permissions.IsAuthenticated]
+    def get_queryset(self):
+        return Product.objects.all()
 
-    def get(self, request):
-        """List all orders for admin."""
-        check_admin_permission(request.user)
-        
-        orders = Order.objects.select_related("customer", "seller", "dorm").prefetch_related("items").order_by("-created_at")
-        
-        from modules.orders.serializers import OrderSerializer
-        serializer = OrderSerializer(orders, many=True)
-        return Response(serializer.data)
+    def with_relations(self, queryset):
+        from modules.products.repositories import ProductImageRepository
+
+        return queryset.select_related("seller__seller_profile", "category", "dorm", "stock").prefetch_related(
+            ProductImageRepository().prefetch()
+        )
+
+    def present(self, rows):
+        from modules.products.presenters import ProductPresenter
+
+        return ProductPresenter().present_many(rows)
+
+
+class AdminOrdersView(AdminListView):
+    """List all orders for admin."""
+
+    filterset_class = AdminOrderFilter
+    export_fields = (
+        "id",
+        "status",
+        "dorm_id",
+        "customer_id",
+        "customer__email",
+        "seller_id",
+        "seller__email",
+        "total_amount",
+        "payment_method",
+        "delivery_type",
+        "created_at",
+    )
+    export_name = "orders"
+
+    def get_queryset(self):
+        return Order.objects.all()
+
+    def with_relations(self, queryset):
+        return queryset.select_related("customer__seller_profile", "seller__seller_profile", "dorm").prefetch_related(
+            Prefetch("items", queryset=OrderItem.objects.select_related("product").order_by("id"))
+        )
+
+    def present(self, rows):
+        from modules.orders.presenters import OrderPresenter
 
+        return OrderPresenter().present_many(rows)
@@ -5,11 +5,12 @@ from .models import PopularSellerRank, SellerSalesReport
 
 @admin.register(SellerSalesReport)
 class SellerSalesReportAdmin(admin.ModelAdmin):
-    list_display = ["seller", "dorm", "total_orders", "total_revenue", "created_at"]
-    list_filter = ["dorm", "created_at"]
+    list_display = ["seller", "dorm", "day", "total_orders", "total_revenue", "total_items", "distinct_customers"]
+    list_filter = ["dorm", "day"]
     search_fields = ["seller__email", "dorm__name"]
     raw_id_fields = ["seller", "dorm"]
     readonly_fields = ["created_at", "updated_at"]
+    ordering = ["-day"]
 
 
 @admin.register(PopularSellerRank)
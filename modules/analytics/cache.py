@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .services import AnalyticsService
+
+
+class SellerDashboardCache:
+    """Snapshots of the seller dashboard per (seller, range, granularity).
+
+    Reads are a single cache lookup. A snapshot is at most ``ttl`` seconds old. When a
+    seller's orders change state the seller is marked dirty, and the periodic
+    ``analytics.refresh_dirty_seller_dashboards`` task rebuilds the default-granularity
+    snapshot of every range ahead of the next read.
+    """
+
+    key_template = "seller_dashboard:{seller_id}:{days}:{granularity}"
+    dirty_key_template = "seller_dashboard:dirty:{seller_id}"
+    ranges = (7, 30, 365)
+    default_granularity = "week"
+
+    @property
+    def ttl(self) -> int:
+        return settings.SELLER_DASHBOARD_CACHE_TTL
+
+    def get(self, seller_id: int, days: int, granularity: str, fresh: bool = False) -> Dict[str, Any]:
+        if not fresh:
+            snapshot = cache.get(self._key(seller_id, days, granularity))
+            if snapshot is not None:
+                return snapshot
+        return self.build(seller_id, days, granularity)
+
+    def build(self, seller_id: int, days: int, granularity: str) -> Dict[str, Any]:
+        snapshot = AnalyticsService().get_seller_dashboard(seller_id, days, granularity)
+        snapshot["computed_at"] = timezone.now().isoformat()
+        cache.set(self._key(seller_id, days, granularity), snapshot, self.ttl)
+        return snapshot
+
+    def mark_dirty(self, seller_id: int) -> None:
+        cache.set(self.dirty_key_template.format(seller_id=seller_id), True, None)
+
+    def refresh_dirty(self, seller_ids: Iterable[int]) -> List[int]:
+        """Rebuild snapshots for the dirty sellers among ``seller_ids``; returns the rebuilt ids."""
+        keys = {self.dirty_key_template.format(seller_id=seller_id): seller_id for seller_id in seller_ids}
+        refreshed = []
+        for key in cache.get_many(list(keys)):
+            # Clear the flag first so changes made during the rebuild are picked up next time.
+            if not cache.delete(key):
+                continue
+            for days in self.ranges:
+                self.build(keys[key], days, self.default_granularity)
+            refreshed.append(keys[key])
+        return refreshed
+
+    def _key(self, seller_id: int, days: int, granularity: str) -> str:
+        return self.key_template.format(seller_id=seller_id, days=days, granularity=granularity)
+
+
+dashboard_cache = SellerDashboardCache()
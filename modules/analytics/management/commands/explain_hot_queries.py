@@ -0,0 +1,58 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from modules.orders.models import Order
+from modules.products.models import Product
+
+
+class Command(BaseCommand):
+    help = "Print EXPLAIN plans for the hot order/product queries to confirm they use the composite indexes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seller", type=int, help="Seller id to plan against (defaults to any seller).")
+        parser.add_argument("--dorm", type=int, help="Dorm id to plan against (defaults to any dorm).")
+        parser.add_argument("--customer", type=int, help="Customer id to plan against (defaults to any customer).")
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run EXPLAIN ANALYZE (PostgreSQL only; executes the queries).",
+        )
+
+    def handle(self, *args, **options):
+        sample = Order.objects.values("seller_id", "dorm_id", "customer_id").first() or {}
+        seller_id = options["seller"] or sample.get("seller_id") or 0
+        dorm_id = options["dorm"] or sample.get("dorm_id") or 0
+        customer_id = options["customer"] or sample.get("customer_id") or 0
+        since = timezone.now() - timedelta(days=30)
+
+        queries = {
+            "seller dashboard (seller, status, created_at)": Order.objects.filter(
+                seller_id=seller_id, status=Order.Status.COMPLETED, created_at__gte=since
+            ).values("total_amount"),
+            "popular sellers (dorm, status, created_at)": Order.objects.filter(
+                dorm_id=dorm_id, status=Order.Status.COMPLETED, created_at__gte=since
+            )
+            .values("seller_id")
+            .order_by(),
+            "customer orders (customer, created_at)": Order.objects.filter(customer_id=customer_id).order_by(
+                "-created_at", "-id"
+            )[:20],
+            "dorm catalog (dorm, is_active, name)": Product.objects.filter(dorm_id=dorm_id, is_active=True).order_by(
+                "name"
+            ),
+        }
+
+        explain_options = {}
+        if options["analyze"]:
+            if connection.vendor != "postgresql":
+                self.stderr.write(self.style.WARNING("--analyze is only supported on PostgreSQL; ignoring."))
+            else:
+                explain_options = {"analyze": True, "buffers": True}
+
+        for title, queryset in queries.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(title))
+            self.stdout.write(queryset.explain(**explain_options))
+            self.stdout.write("")
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from modules.analytics.services import SalesReportService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily seller sales rollup from completed orders."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seller", type=int, help="Only rebuild this seller's rows.")
+
+    def handle(self, *args, **options):
+        rows = SalesReportService().rebuild(seller_id=options["seller"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} sales report rows."))
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.db import migrations
+
+
+def drop_duplicate_ranks(apps, schema_editor):
+    """Keep only the most recently updated rank per (dorm, seller) so the constraint can be added."""
+    PopularSellerRank = apps.get_model("analytics", "PopularSellerRank")
+    seen = set()
+    stale = []
+    ranks = PopularSellerRank.objects.order_by("dorm_id", "seller_id", "-updated_at", "-id")
+    for rank_id, dorm_id, seller_id in ranks.values_list("id", "dorm_id", "seller_id").iterator():
+        if (dorm_id, seller_id) in seen:
+            stale.append(rank_id)
+        else:
+            seen.add((dorm_id, seller_id))
+    for start in range(0, len(stale), 1000):
+        PopularSellerRank.objects.filter(id__in=stale[start : start + 1000]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_seller_sales_rollup'),
+        ('dorms', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_ranks, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='popularsellerrank',
+            unique_together={('dorm', 'seller')},
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0004_popularsellerrank_unique_dorm_seller'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlatformMetrics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('revenue_last_month', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('revenue_prev_month', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('subscriptions', models.PositiveIntegerField(default=0)),
+                ('subscriptions_last_month', models.PositiveIntegerField(default=0)),
+                ('subscriptions_prev_month', models.PositiveIntegerField(default=0)),
+                ('sales', models.PositiveIntegerField(default=0)),
+                ('sales_last_month', models.PositiveIntegerField(default=0)),
+                ('sales_prev_month', models.PositiveIntegerField(default=0)),
+                ('active_now', models.PositiveIntegerField(default=0)),
+                ('active_prev_hour', models.PositiveIntegerField(default=0)),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name_plural': 'Platform metrics',
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+def backfill_sales_reports(apps, schema_editor):
+    from modules.analytics.services import SalesReportService
+
+    SalesReportService().rebuild(apps=apps)
+
+
+class Migration(migrations.Migration):
+    """Fill the seller sales rollup from the completed orders that predate it."""
+
+    dependencies = [
+        ("analytics", "0005_platformmetrics"),
+        ("orders", "0006_add_query_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_sales_reports, migrations.RunPython.noop),
+    ]
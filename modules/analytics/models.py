@@ -5,10 +5,37 @@ from core.mixins import TimestampedModel
 
 
 class SellerSalesReport(TimestampedModel):
+    """Daily rollup of a seller's completed orders, keyed by the order's local creation date."""
+
     seller = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="sales_reports")
     dorm = models.ForeignKey("dorms.Dorm", on_delete=models.CASCADE)
+    day = models.DateField()
     total_orders = models.PositiveIntegerField(default=0)
     total_revenue = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    total_items = models.PositiveIntegerField(default=0)
+    distinct_customers = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("seller", "dorm", "day")
+        indexes = [models.Index(fields=["seller", "day"], name="salesreport_seller_day")]
+
+
+class SellerCustomerActivity(TimestampedModel):
+    """Completed orders per customer behind a ``SellerSalesReport`` row.
+
+    Distinct customer counts are not additive across days, so multi-day windows count
+    these rows instead of summing ``distinct_customers``.
+    """
+
+    seller = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    dorm = models.ForeignKey("dorms.Dorm", on_delete=models.CASCADE, related_name="+")
+    customer = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    day = models.DateField()
+    orders = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("seller", "dorm", "day", "customer")
+        indexes = [models.Index(fields=["seller", "day"], name="customeractivity_seller_day")]
 
 
 class PopularSellerRank(TimestampedModel):
@@ -17,3 +44,31 @@ class PopularSellerRank(TimestampedModel):
     score = models.DecimalField(max_digits=8, decimal_places=2, default=0)
     rank = models.PositiveIntegerField(default=0)
 
+    class Meta:
+        unique_together = ("dorm", "seller")
+
+
+class PlatformMetrics(models.Model):
+    """Latest snapshot of the platform-wide counters shown on the admin dashboard.
+
+    A single row, rewritten by the ``analytics.refresh_platform_metrics`` task.
+    """
+
+    total_revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    revenue_last_month = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    revenue_prev_month = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    subscriptions = models.PositiveIntegerField(default=0)
+    subscriptions_last_month = models.PositiveIntegerField(default=0)
+    subscriptions_prev_month = models.PositiveIntegerField(default=0)
+    sales = models.PositiveIntegerField(default=0)
+    sales_last_month = models.PositiveIntegerField(default=0)
+    sales_prev_month = models.PositiveIntegerField(default=0)
+    active_now = models.PositiveIntegerField(default=0)
+    active_prev_hour = models.PositiveIntegerField(default=0)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name_plural = "Platform metrics"
+
+    def __str__(self) -> str:
+        return f"Platform metrics at {self.computed_at:%Y-%m-%d %H:%M}"
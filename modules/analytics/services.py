@@ -1,170 +1,236 @@
-from datetime import timedelta
+from collections import defaultdict
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from django.apps import apps as global_apps
 from django.core.cache import cache
-from django.db import models
-from django.db.models import Count, Sum, Avg, Q
+from django.db import models, transaction
+from django.db.models import Count, F, Q, Sum, Window
+from django.db.models.functions import Rank, TruncDate
 from django.utils import timezone
 
-from .models import PopularSellerRank
+from core.utils.logging import get_logger
+
+from .models import PlatformMetrics, PopularSellerRank, SellerCustomerActivity, SellerSalesReport
+
+logger = get_logger(__name__)
+
+
+MONTH_ABBREVIATIONS = ("Oca", "Şub", "Mar", "Nis", "May", "Haz", "Tem", "Ağu", "Eyl", "Eki", "Kas", "Ara")
+REVENUE_GRANULARITIES = ("day", "week", "month")
+POPULAR_SELLERS_CACHE_TTL = 300
+
+
+def _next_day(day: date, count: int) -> date:
+    return day + timedelta(days=count)
+
+
+def _next_month(day: date, count: int) -> date:
+    """Return the first day of the month ``count`` months after ``day``."""
+    month_index = day.year * 12 + day.month - 1 + count
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _day_label(day: date) -> str:
+    return f"{day.day} {MONTH_ABBREVIATIONS[day.month - 1]}"
+
+
+def _month_label(day: date) -> str:
+    return f"{MONTH_ABBREVIATIONS[day.month - 1]} {day.year}"
+
+
+def _rollup_window(days: int) -> Tuple[date, date]:
+    """First and last rollup day of a ``days``-long period ending today."""
+    end_day = timezone.localdate()
+    return end_day - timedelta(days=days - 1), end_day
+
+
+def _calendar_points(buckets, start_day: date, end_day: date, step, label) -> List[Dict]:
+    result = []
+    current = step(start_day, 0)
+    while current <= end_day:
+        result.append({
+            "week": label(current),
+            "date": current.isoformat(),
+            "revenue": float(buckets.get(current, 0)),
+        })
+        current = step(current, 1)
+    return result
+
+
+def _percent_change(current, previous):
+    if previous > 0:
+        return (current - previous) / previous * 100
+    return 100 if current > 0 else 0
 
 
 class AnalyticsService:
     def generate_popular_sellers(self, dorm_id: int):
+        """Rebuild the dorm's seller ranking in one transaction and refresh its cache entry."""
         from modules.orders.models import Order
 
         cutoff = timezone.now() - timedelta(days=30)
         aggregates = (
             Order.objects.filter(dorm_id=dorm_id, created_at__gte=cutoff, status=Order.Status.COMPLETED)
             .values("seller_id")
-            .annotate(total_orders=models.Count("id"), total_amount=models.Sum("total_amount"))
-            .order_by("-total_amount")
+            .annotate(
+                total_orders=models.Count("id"),
+                total_amount=models.Sum("total_amount"),
+                position=Window(expression=Rank(), order_by=F("total_amount").desc()),
+            )
+            .order_by("position", "seller_id")
         )
-        cache.delete(f"popular_sellers:{dorm_id}")
-        PopularSellerRank.objects.filter(dorm_id=dorm_id).delete()
-        for idx, aggregate in enumerate(aggregates, start=1):
-            PopularSellerRank.objects.create(
+        now = timezone.now()
+        ranks = [
+            PopularSellerRank(
                 dorm_id=dorm_id,
                 seller_id=aggregate["seller_id"],
                 score=aggregate["total_amount"] or 0,
-                rank=idx,
+                rank=aggregate["position"],
+                created_at=now,
+                updated_at=now,
             )
+            for aggregate in aggregates
+        ]
+
+        with transaction.atomic():
+            PopularSellerRank.objects.filter(dorm_id=dorm_id).exclude(
+                seller_id__in=[rank.seller_id for rank in ranks]
+            ).delete()
+            PopularSellerRank.objects.bulk_create(
+                ranks,
+                update_conflicts=True,
+                unique_fields=["dorm", "seller"],
+                update_fields=["score", "rank", "updated_at"],
+            )
+            # Write through instead of deleting, so readers never see a cold cache.
+            transaction.on_commit(lambda: self._cache_popular_sellers(dorm_id))
 
     def list_popular_sellers(self, dorm_id: int):
-        cache_key = f"popular_sellers:{dorm_id}"
+        cache_key = self._popular_sellers_key(dorm_id)
         cached = cache.get(cache_key)
         if cached is not None:
             return cached
-        rows = PopularSellerRank.objects.filter(dorm_id=dorm_id).values("seller_id", "score", "rank")[:10]
-        data = list(rows)
-        cache.set(cache_key, data, 300)
+        return self._cache_popular_sellers(dorm_id)
+
+    @staticmethod
+    def _popular_sellers_key(dorm_id: int) -> str:
+        return f"popular_sellers:{dorm_id}"
+
+    def _cache_popular_sellers(self, dorm_id: int) -> List[Dict]:
+        rows = PopularSellerRank.objects.filter(dorm_id=dorm_id).order_by("rank", "seller_id")
+        data = list(rows.values("seller_id", "score", "rank")[:10])
+        cache.set(self._popular_sellers_key(dorm_id), data, POPULAR_SELLERS_CACHE_TTL)
         return data
 
+    def get_seller_dashboard(self, seller_id: int, days: int = 30, granularity: str = "week") -> Dict:
+        """Everything the seller dashboard shows for one range."""
+        return {
+            "stats": self.get_seller_dashboard_stats(seller_id, days),
+            "revenue_over_time": self.get_revenue_over_time(seller_id, days, granularity),
+            "top_products": self.get_top_selling_products(seller_id, days, limit=5),
+            "date_range": days,
+            "granularity": granularity,
+        }
+
     def get_seller_dashboard_stats(
         self, seller_id: int, days: int = 30
     ) -> Dict:
-        """Get dashboard statistics for a seller within a date range."""
-        from modules.orders.models import Order
+        """Get dashboard statistics for a seller within a date range.
 
-        now = timezone.now()
-        start_date = now - timedelta(days=days)
-        
+        Reads the daily sales rollup: the last ``days`` days including today, compared
+        with the ``days`` days before them.
+        """
+        start_day, end_day = _rollup_window(days)
         # Previous period for comparison
-        prev_start_date = start_date - timedelta(days=days)
-        
-        # Current period orders
-        current_orders = Order.objects.filter(
-            seller_id=seller_id,
-            status=Order.Status.COMPLETED,
-            created_at__gte=start_date,
-            created_at__lte=now,
-        )
-        
-        # Previous period orders
-        previous_orders = Order.objects.filter(
-            seller_id=seller_id,
-            status=Order.Status.COMPLETED,
-            created_at__gte=prev_start_date,
-            created_at__lt=start_date,
-        )
-        
-        # Current period stats
-        current_revenue = current_orders.aggregate(total=Sum("total_amount"))["total"] or Decimal("0")
-        current_order_count = current_orders.count()
-        current_avg_order = (
-            current_orders.aggregate(avg=Avg("total_amount"))["avg"] or Decimal("0")
-        )
-        current_customers = current_orders.values("customer_id").distinct().count()
-        
-        # Previous period stats
-        prev_revenue = previous_orders.aggregate(total=Sum("total_amount"))["total"] or Decimal("0")
-        prev_order_count = previous_orders.count()
-        prev_avg_order = (
-            previous_orders.aggregate(avg=Avg("total_amount"))["avg"] or Decimal("0")
-        )
-        prev_customers = previous_orders.values("customer_id").distinct().count()
-        
-        # Calculate percentage changes
-        revenue_change = (
-            ((current_revenue - prev_revenue) / prev_revenue * 100)
-            if prev_revenue > 0
-            else (100 if current_revenue > 0 else 0)
-        )
-        orders_change = (
-            ((current_order_count - prev_order_count) / prev_order_count * 100)
-            if prev_order_count > 0
-            else (100 if current_order_count > 0 else 0)
-        )
-        avg_order_change = (
-            ((current_avg_order - prev_avg_order) / prev_avg_order * 100)
-            if prev_avg_order > 0
-            else (100 if current_avg_order > 0 else 0)
+        prev_start_day = start_day - timedelta(days=days)
+
+        current = Q(day__gte=start_day)
+        previous = Q(day__lt=start_day)
+        window = {"seller_id": seller_id, "day__gte": prev_start_day, "day__lte": end_day}
+        totals = SellerSalesReport.objects.filter(**window).aggregate(
+            current_revenue=Sum("total_revenue", filter=current),
+            current_order_count=Sum("total_orders", filter=current),
+            prev_revenue=Sum("total_revenue", filter=previous),
+            prev_order_count=Sum("total_orders", filter=previous),
         )
-        customers_change = (
-            ((current_customers - prev_customers) / prev_customers * 100)
-            if prev_customers > 0
-            else (100 if current_customers > 0 else 0)
+        # Distinct customers are not additive across days, so count them from the activity rows.
+        customers = SellerCustomerActivity.objects.filter(**window).aggregate(
+            current_customers=Count("customer_id", filter=current, distinct=True),
+            prev_customers=Count("customer_id", filter=previous, distinct=True),
         )
-        
+
+        current_revenue = totals["current_revenue"] or Decimal("0")
+        current_order_count = totals["current_order_count"] or 0
+        current_avg_order = current_revenue / current_order_count if current_order_count else Decimal("0")
+        current_customers = customers["current_customers"]
+        prev_revenue = totals["prev_revenue"] or Decimal("0")
+        prev_order_count = totals["prev_order_count"] or 0
+        prev_avg_order = prev_revenue / prev_order_count if prev_order_count else Decimal("0")
+        prev_customers = customers["prev_customers"]
+
+        revenue_change = _percent_change(current_revenue, prev_revenue)
+        orders_change = _percent_change(current_order_count, prev_order_count)
+        avg_order_change = _percent_change(current_avg_order, prev_avg_order)
+        customers_change = _percent_change(current_customers, prev_customers)
+
         return {
             "total_revenue": float(current_revenue),
             "revenue_change": round(revenue_change, 1),
             "total_orders": current_order_count,
             "orders_change": round(orders_change, 1),
-            "average_order_value": float(current_avg_order),
+            "average_order_value": float(round(current_avg_order, 2)),
             "avg_order_change": round(avg_order_change, 1),
             "new_customers": current_customers,
             "customers_change": round(customers_change, 1),
         }
 
-    def get_revenue_over_time(self, seller_id: int, days: int = 30) -> List[Dict]:
-        """Get revenue data grouped by weeks for the specified period."""
-        from modules.orders.models import Order
+    def get_revenue_over_time(self, seller_id: int, days: int = 30, granularity: str = "week") -> List[Dict]:
+        """Get revenue data grouped by day, week or month for the specified period.
 
-        now = timezone.now()
-        start_date = now - timedelta(days=days)
-        
-        # Get all orders in the period
-        orders = Order.objects.filter(
-            seller_id=seller_id,
-            status=Order.Status.COMPLETED,
-            created_at__gte=start_date,
-            created_at__lte=now,
-        ).order_by("created_at")
-        
-        # Group by weeks manually
-        week_data = {}
-        for order in orders:
-            days_since_start = (order.created_at - start_date).days
-            week_num = (days_since_start // 7) + 1
-            
-            if week_num not in week_data:
-                week_data[week_num] = Decimal("0")
-            week_data[week_num] += order.total_amount
-        
-        # Calculate expected weeks
+        Reads at most one rollup row per day of the period.
+        """
+        start_day, end_day = _rollup_window(days)
+        daily = dict(
+            SellerSalesReport.objects.filter(seller_id=seller_id, day__gte=start_day, day__lte=end_day)
+            .values("day")
+            .annotate(revenue=Sum("total_revenue"))
+            .values_list("day", "revenue")
+        )
+
+        if granularity == "day":
+            return _calendar_points(daily, start_day, end_day, _next_day, _day_label)
+        if granularity == "month":
+            monthly: Dict[date, Decimal] = defaultdict(Decimal)
+            for day, revenue in daily.items():
+                monthly[_next_month(day, 0)] += revenue
+            return _calendar_points(monthly, start_day, end_day, _next_month, _month_label)
+
+        # Weeks are counted in 7-day blocks from the start of the period.
         if days == 30:
             expected_weeks = 4
         elif days == 7:
             expected_weeks = 1
         else:
             expected_weeks = (days // 7) + 1
-        
-        # Format for chart
-        result = []
-        for week_num in range(1, expected_weeks + 1):
-            result.append({
+        week_data: Dict[int, Decimal] = defaultdict(Decimal)
+        for day, revenue in daily.items():
+            week_data[(day - start_day).days // 7 + 1] += revenue
+
+        return [
+            {
                 "week": f"Hafta {week_num}",
+                "date": (start_day + timedelta(days=7 * (week_num - 1))).isoformat(),
                 "revenue": float(week_data.get(week_num, 0)),
-            })
-        
-        return result
+            }
+            for week_num in range(1, expected_weeks + 1)
+        ]
 
     def get_top_selling_products(self, seller_id: int, days: int = 30, limit: int = 5) -> List[Dict]:
         """Get top selling products for a seller."""
         from modules.orders.models import Order, OrderItem
-        from modules.products.models import ProductImage
+        from modules.products.repositories import ProductImageRepository
 
         now = timezone.now()
         start_date = now - timedelta(days=days)
@@ -184,16 +250,13 @@ class AnalyticsService:
             .order_by("-units_sold")[:limit]
         )
         
+        order_items = list(order_items)
+        primary_images = ProductImageRepository().primary_for_products(item["product_id"] for item in order_items)
+
         result = []
         for item in order_items:
             product_id = item["product_id"]
-            
-            # Get first product image if available
-            first_image = (
-                ProductImage.objects.filter(product_id=product_id)
-                .order_by("created_at")
-                .first()
-            )
+            first_image = primary_images.get(product_id)
             image_url = first_image.image.url if first_image and first_image.image else None
             
             result.append({
@@ -206,3 +269,212 @@ class AnalyticsService:
         
         return result
 
+
+class PopularSellerRefreshScheduler:
+    """Coalesces popular-seller refresh requests into at most one rebuild per dorm per window.
+
+    Order transitions only set a per-dorm dirty flag in the cache, so the request path
+    never talks to the broker or recomputes anything. The periodic
+    ``analytics.refresh_dirty_popular_sellers`` task rebuilds every dirty dorm once.
+    """
+
+    dirty_key_template = "popular_sellers:dirty:{dorm_id}"
+
+    def mark_dirty(self, dorm_id: int) -> None:
+        cache.set(self.dirty_key_template.format(dorm_id=dorm_id), True, None)
+
+    def refresh(self, dorm_id: int) -> bool:
+        """Rebuild the dorm's ranking if it is dirty; returns whether a rebuild ran."""
+        # Clear the flag first so changes made during the rebuild are picked up next time.
+        if not cache.delete(self.dirty_key_template.format(dorm_id=dorm_id)):
+            return False
+        AnalyticsService().generate_popular_sellers(dorm_id)
+        return True
+
+    def refresh_dirty(self, dorm_ids: Iterable[int]) -> List[int]:
+        keys = {self.dirty_key_template.format(dorm_id=dorm_id): dorm_id for dorm_id in dorm_ids}
+        dirty = [keys[key] for key in cache.get_many(list(keys))]
+        return [dorm_id for dorm_id in dirty if self.refresh(dorm_id)]
+
+
+class PlatformMetricsService:
+    """Platform-wide counters for the admin dashboard, materialized in ``PlatformMetrics``.
+
+    The periodic ``analytics.refresh_platform_metrics`` task recomputes them; requests
+    read the cached row and only compute on a cold start.
+    """
+
+    cache_key = "platform_metrics"
+
+    def snapshot(self) -> PlatformMetrics:
+        metrics = cache.get(self.cache_key)
+        if metrics is None:
+            metrics = PlatformMetrics.objects.first()
+            if metrics is None:
+                return self.refresh()
+            cache.set(self.cache_key, metrics, None)
+        return metrics
+
+    def refresh(self) -> PlatformMetrics:
+        metrics, _ = PlatformMetrics.objects.update_or_create(pk=1, defaults=self.compute())
+        cache.set(self.cache_key, metrics, None)
+        return metrics
+
+    def compute(self) -> Dict:
+        """All counters in three conditional-aggregate queries."""
+        from modules.orders.models import Order
+        from modules.subscription.models import SellerSubscription
+        from modules.users.models import User
+
+        now = timezone.now()
+        last_month = now - timedelta(days=30)
+        prev_month_start = last_month - timedelta(days=30)
+        last_hour = now - timedelta(hours=1)
+        this_month = Q(created_at__gte=last_month)
+        previous_month = Q(created_at__gte=prev_month_start, created_at__lt=last_month)
+
+        orders = Order.objects.filter(status=Order.Status.COMPLETED).aggregate(
+            total_revenue=Sum("total_amount"),
+            revenue_last_month=Sum("total_amount", filter=this_month),
+            revenue_prev_month=Sum("total_amount", filter=previous_month),
+            sales=Count("id"),
+            sales_last_month=Count("id", filter=this_month),
+            sales_prev_month=Count("id", filter=previous_month),
+        )
+        subscriptions = SellerSubscription.objects.filter(is_active=True).aggregate(
+            subscriptions=Count("id"),
+            subscriptions_last_month=Count("id", filter=this_month),
+            subscriptions_prev_month=Count("id", filter=previous_month),
+        )
+        users = User.objects.filter(last_login__gte=last_hour - timedelta(hours=1)).aggregate(
+            active_now=Count("id", filter=Q(last_login__gte=last_hour)),
+            active_prev_hour=Count("id", filter=Q(last_login__lt=last_hour)),
+        )
+
+        counters = {**orders, **subscriptions, **users}
+        for key in ("total_revenue", "revenue_last_month", "revenue_prev_month"):
+            counters[key] = counters[key] or Decimal("0")
+        counters["computed_at"] = now
+        return counters
+
+    def dashboard(self) -> Dict:
+        metrics = self.snapshot()
+        return {
+            "total_revenue": float(metrics.total_revenue),
+            "revenue_change": round(_percent_change(metrics.revenue_last_month, metrics.revenue_prev_month), 1),
+            "revenue_last_month": float(metrics.revenue_last_month),
+            "subscriptions": metrics.subscriptions,
+            "subscriptions_change": round(
+                _percent_change(metrics.subscriptions_last_month, metrics.subscriptions_prev_month), 1
+            ),
+            "subscriptions_last_month": metrics.subscriptions_last_month,
+            "sales": metrics.sales,
+            "sales_change": round(_percent_change(metrics.sales_last_month, metrics.sales_prev_month), 1),
+            "sales_last_month": metrics.sales_last_month,
+            "active_now": metrics.active_now,
+            "active_now_change": metrics.active_now - metrics.active_prev_hour,
+            "computed_at": metrics.computed_at,
+        }
+
+
+class SalesReportService:
+    """Maintains the daily ``SellerSalesReport`` rollup as orders complete or are cancelled."""
+
+    def record_completed(self, order) -> None:
+        self._apply(order, sign=1)
+
+    def revert_completed(self, order) -> None:
+        self._apply(order, sign=-1)
+
+    def _apply(self, order, sign: int) -> None:
+        keys = {"seller_id": order.seller_id, "dorm_id": order.dorm_id, "day": timezone.localdate(order.created_at)}
+        items = order.items.aggregate(total=Sum("quantity"))["total"] or 0
+
+        with transaction.atomic():
+            if sign > 0:
+                activity, new_customer = SellerCustomerActivity.objects.get_or_create(
+                    **keys, customer_id=order.customer_id, defaults={"orders": 1}
+                )
+                if not new_customer:
+                    SellerCustomerActivity.objects.filter(pk=activity.pk).update(orders=F("orders") + 1)
+                report, _ = SellerSalesReport.objects.get_or_create(**keys)
+            else:
+                # Lock in the same order record_completed writes: activity first, then report.
+                activity = (
+                    SellerCustomerActivity.objects.select_for_update()
+                    .filter(**keys, customer_id=order.customer_id)
+                    .first()
+                )
+                report = SellerSalesReport.objects.select_for_update().filter(**keys).first()
+                if report is None or activity is None:
+                    # Completed before the rollup existed and never backfilled; nothing to undo.
+                    logger.warning("sales_report.revert_missing", order_id=order.id, **keys)
+                    return
+                new_customer = activity.orders <= 1
+                if new_customer:
+                    activity.delete()
+                else:
+                    SellerCustomerActivity.objects.filter(pk=activity.pk).update(orders=F("orders") - 1)
+
+            SellerSalesReport.objects.filter(pk=report.pk).update(
+                total_orders=F("total_orders") + sign,
+                total_revenue=F("total_revenue") + sign * order.total_amount,
+                total_items=F("total_items") + sign * items,
+                distinct_customers=F("distinct_customers") + (sign if new_customer else 0),
+                updated_at=timezone.now(),
+            )
+            if sign < 0:
+                SellerSalesReport.objects.filter(pk=report.pk, total_orders=0).delete()
+
+    def rebuild(self, seller_id: Optional[int] = None, apps=global_apps) -> int:
+        """Recompute the rollup from completed orders; returns the number of report rows.
+
+        ``apps`` lets data migrations run the rebuild against historical models.
+        """
+        Order = apps.get_model("orders", "Order")
+        OrderItem = apps.get_model("orders", "OrderItem")
+        SellerSalesReport = apps.get_model("analytics", "SellerSalesReport")
+        SellerCustomerActivity = apps.get_model("analytics", "SellerCustomerActivity")
+
+        orders = Order.objects.filter(status="COMPLETED")
+        reports = SellerSalesReport.objects.all()
+        activities = SellerCustomerActivity.objects.all()
+        if seller_id is not None:
+            orders = orders.filter(seller_id=seller_id)
+            reports = reports.filter(seller_id=seller_id)
+            activities = activities.filter(seller_id=seller_id)
+
+        group = ("seller_id", "dorm_id", "day")
+        daily = orders.annotate(day=TruncDate("created_at")).order_by()
+        items = {
+            (row["order__seller_id"], row["order__dorm_id"], row["day"]): row["total"]
+            for row in OrderItem.objects.filter(order__in=orders)
+            .annotate(day=TruncDate("order__created_at"))
+            .order_by()
+            .values("order__seller_id", "order__dorm_id", "day")
+            .annotate(total=Sum("quantity"))
+        }
+
+        with transaction.atomic():
+            reports.delete()
+            activities.delete()
+            SellerCustomerActivity.objects.bulk_create(
+                (
+                    SellerCustomerActivity(**row)
+                    for row in daily.values(*group, "customer_id").annotate(orders=Count("id"))
+                ),
+                batch_size=1000,
+            )
+            created = SellerSalesReport.objects.bulk_create(
+                (
+                    SellerSalesReport(**row, total_items=items.get(tuple(row[key] for key in group), 0))
+                    for row in daily.values(*group).annotate(
+                        total_orders=Count("id"),
+                        total_revenue=Sum("total_amount"),
+                        distinct_customers=Count("customer_id", distinct=True),
+                    )
+                ),
+                batch_size=1000,
+            )
+        logger.info("sales_report.rebuilt", seller_id=seller_id, rows=len(created))
+        return len(created)
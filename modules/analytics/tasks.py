@@ -2,10 +2,40 @@ from __future__ import annotations
 
 from celery import shared_task
 
-from .services import AnalyticsService
+from .services import AnalyticsService, PlatformMetricsService, PopularSellerRefreshScheduler
 
 
-@shared_task(name="analytics.refresh_popular_sellers")
+@shared_task(name="analytics.refresh_popular_sellers", ignore_result=True)
 def refresh_popular_sellers(dorm_id: int) -> None:
     AnalyticsService().generate_popular_sellers(dorm_id)
 
+
+@shared_task(name="analytics.refresh_dirty_popular_sellers", ignore_result=True)
+def refresh_dirty_popular_sellers() -> None:
+    """Rebuild the ranking of every dorm marked dirty since the previous run."""
+    from modules.dorms.models import Dorm
+
+    PopularSellerRefreshScheduler().refresh_dirty(Dorm.objects.values_list("id", flat=True))
+
+
+@shared_task(name="analytics.refresh_dirty_seller_dashboards", ignore_result=True)
+def refresh_dirty_seller_dashboards(chunk_size: int = 500) -> None:
+    """Rebuild dashboard snapshots of every seller marked dirty since the previous run."""
+    from modules.users.models import SellerProfile
+
+    from .cache import dashboard_cache
+
+    seller_ids = SellerProfile.objects.order_by("user_id").values_list("user_id", flat=True)
+    chunk = []
+    for seller_id in seller_ids.iterator(chunk_size=chunk_size):
+        chunk.append(seller_id)
+        if len(chunk) == chunk_size:
+            dashboard_cache.refresh_dirty(chunk)
+            chunk = []
+    if chunk:
+        dashboard_cache.refresh_dirty(chunk)
+
+
+@shared_task(name="analytics.refresh_platform_metrics", ignore_result=True)
+def refresh_platform_metrics() -> None:
+    PlatformMetricsService().refresh()
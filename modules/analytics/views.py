@@ -2,7 +2,8 @@ from rest_framework import permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .services import AnalyticsService
+from .cache import dashboard_cache
+from .services import REVENUE_GRANULARITIES, AnalyticsService
 
 
 class PopularSellersView(APIView):
@@ -25,9 +26,7 @@ class SellerDashboardView(APIView):
         """Get dashboard statistics for the authenticated seller."""
         if not hasattr(request.user, "seller_profile"):
             return Response({"detail": "User is not a seller."}, status=403)
-        
-        service = AnalyticsService()
-        
+
         # Get date range from query params (7, 30, or 365 for year)
         date_range = request.query_params.get("range", "30")
         if date_range == "7":
@@ -36,17 +35,13 @@ class SellerDashboardView(APIView):
             days = 365
         else:
             days = 30
+
+        # Chart bucket size: day, week (default) or month
+        granularity = request.query_params.get("granularity", "week")
+        if granularity not in REVENUE_GRANULARITIES:
+            granularity = "week"
         
-        seller_id = request.user.id
-        
-        stats = service.get_seller_dashboard_stats(seller_id, days)
-        revenue_over_time = service.get_revenue_over_time(seller_id, days)
-        top_products = service.get_top_selling_products(seller_id, days, limit=5)
-        
-        return Response({
-            "stats": stats,
-            "revenue_over_time": revenue_over_time,
-            "top_products": top_products,
-            "date_range": days,
-        })
+        # ?fresh=1 bypasses the cached snapshot (and replaces it)
+        fresh = request.query_params.get("fresh") == "1"
+        return Response(dashboard_cache.get(request.user.id, days, granularity, fresh=fresh))
 
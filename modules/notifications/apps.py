@@ -14,10 +14,13 @@ class NotificationsConfig(AppConfig):
 
         from .services import SMTPNotificationService
 
+        # Mail delivery is slow and must not hold the request or its transaction open.
         service = SMTPNotificationService()
-        event_dispatcher.subscribe(OrderCreatedEvent.name, service.handle_order_created)
-        event_dispatcher.subscribe(ProductOutOfStockEvent.name, service.handle_product_out_of_stock)
+        event_dispatcher.subscribe(OrderCreatedEvent, service.handle_order_created, deferred=True)
         event_dispatcher.subscribe(
-            SubscriptionActivatedEvent.name, service.handle_subscription_activated
+            ProductOutOfStockEvent, service.handle_products_out_of_stock, deferred=True, batch=True
+        )
+        event_dispatcher.subscribe(
+            SubscriptionActivatedEvent, service.handle_subscription_activated, deferred=True
         )
 
@@ -1,3 +1,6 @@
+from collections import defaultdict
+from typing import Dict, List
+
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.mail import send_mail
@@ -37,21 +40,32 @@ class SMTPNotificationService:
         body = f"Sipariş #{event.payload.get('order_id')} oluşturuldu."
         self._send_email(subject, body, recipient)
 
-    def handle_product_out_of_stock(self, event: BaseEvent) -> None:
-        product_id = event.payload.get("product_id")
-        if not product_id:
-            return
-        try:
-            product = Product.objects.select_related("seller").get(id=product_id)
-        except Product.DoesNotExist:
-            logger.warning("notification.product_not_found", product_id=product_id)
+    def handle_products_out_of_stock(self, events: List[BaseEvent]) -> None:
+        """Batch handler: one digest email per seller for every product that ran out."""
+        product_ids = {event.payload["product_id"] for event in events if event.payload.get("product_id")}
+        if not product_ids:
             return
+        products = Product.objects.select_related("seller__seller_profile").filter(id__in=product_ids).order_by("id")
 
-        seller = product.seller
-        recipient = getattr(seller.seller_profile, "notification_email", None) or seller.email
-        subject = "Ürününüz Tükendi"
-        body = f"{product.name} isimli ürününüzün stoğu tükendi. Lütfen stoğu güncelleyin."
-        self._send_email(subject, body, recipient)
+        by_seller: Dict[int, List[Product]] = defaultdict(list)
+        for product in products:
+            by_seller[product.seller_id].append(product)
+        missing = product_ids - {product.id for products in by_seller.values() for product in products}
+        if missing:
+            logger.warning("notification.product_not_found", product_ids=sorted(missing))
+
+        for seller_products in by_seller.values():
+            seller = seller_products[0].seller
+            profile = getattr(seller, "seller_profile", None)
+            recipient = getattr(profile, "notification_email", None) or seller.email
+            if len(seller_products) == 1:
+                subject = "Ürününüz Tükendi"
+                body = f"{seller_products[0].name} isimli ürününüzün stoğu tükendi. Lütfen stoğu güncelleyin."
+            else:
+                subject = f"{len(seller_products)} Ürününüz Tükendi"
+                names = "\n".join(f"- {product.name}" for product in seller_products)
+                body = f"Aşağıdaki ürünlerinizin stoğu tükendi. Lütfen stoğu güncelleyin.\n\n{names}"
+            self._send_email(subject, body, recipient)
 
     def handle_subscription_activated(self, event: BaseEvent) -> None:
         subscription_id = event.payload.get("subscription_id")
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+from core.utils.migrations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('dorms', '0001_initial'),
+        ('orders', '0005_orderidempotencykey'),
+        ('products', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['customer', '-created_at', '-id'], name='order_customer_created'),
+        ),
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['seller', '-created_at', '-id'], name='order_seller_created'),
+        ),
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(condition=models.Q(('status', 'COMPLETED')), fields=['seller', 'created_at'], name='order_seller_completed'),
+        ),
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(condition=models.Q(('status', 'COMPLETED')), fields=['dorm', 'created_at'], name='order_dorm_completed'),
+        ),
+        AddIndexConcurrently(
+            model_name='orderitem',
+            index=models.Index(fields=['order', 'product'], name='orderitem_order_product'),
+        ),
+    ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from decimal import Decimal
 
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
 from core.mixins import TimestampedModel
@@ -40,6 +41,23 @@ class Order(TimestampedModel):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Customer and seller order lists, keyset-paginated on (created_at, id) across all statuses.
+            models.Index(fields=["customer", "-created_at", "-id"], name="order_customer_created"),
+            models.Index(fields=["seller", "-created_at", "-id"], name="order_seller_created"),
+            # Seller dashboard and per-dorm popular seller ranking only ever
+            # aggregate completed orders.
+            models.Index(
+                fields=["seller", "created_at"],
+                condition=models.Q(status="COMPLETED"),
+                name="order_seller_completed",
+            ),
+            models.Index(
+                fields=["dorm", "created_at"],
+                condition=models.Q(status="COMPLETED"),
+                name="order_dorm_completed",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Order {self.id}"
@@ -57,6 +75,12 @@ class OrderItem(models.Model):
     quantity = models.PositiveIntegerField(validators=[positive_int_validator])
     unit_price = models.DecimalField(max_digits=8, decimal_places=2)
 
+    class Meta:
+        indexes = [
+            # Top-selling products join completed orders to their items grouped by product.
+            models.Index(fields=["order", "product"], name="orderitem_order_product"),
+        ]
+
 
 class OrderStatusLog(TimestampedModel):
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="status_logs")
@@ -77,3 +101,15 @@ class SellerCustomerChat(TimestampedModel):
     message = models.TextField()
 
 
+class OrderIdempotencyKey(TimestampedModel):
+    """Remembers the response of an order submission so client retries can be replayed."""
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="order_idempotency_keys")
+    key = models.CharField(max_length=255)
+    request_hash = models.CharField(max_length=64)
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="idempotency_keys")
+    response = models.JSONField(encoder=DjangoJSONEncoder)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        unique_together = ("user", "key")
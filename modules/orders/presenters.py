@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+from modules.users.contact_info import contact_resolver_for, related_user
+
+from .models import Order
+
+
+@lru_cache(maxsize=None)
+def _formatters():
+    """DRF field instances reused for scalar formatting, so output matches OrderSerializer."""
+    from .serializers import OrderItemSerializer, OrderSerializer
+
+    order_fields = OrderSerializer().fields
+    item_fields = OrderItemSerializer().fields
+    return {
+        "status": order_fields["status"].to_representation,
+        "payment_method": order_fields["payment_method"].to_representation,
+        "delivery_type": order_fields["delivery_type"].to_representation,
+        "total_amount": order_fields["total_amount"].to_representation,
+        "created_at": order_fields["created_at"].to_representation,
+        "unit_price": item_fields["unit_price"].to_representation,
+    }
+
+
+class OrderPresenter:
+    """Read-only, dict-building equivalent of ``OrderSerializer`` for hot list endpoints."""
+
+    def __init__(self, context: Optional[Dict[str, Any]] = None) -> None:
+        self.context = context if context is not None else {}
+        self.contacts = contact_resolver_for(self.context)
+        self.formatters = _formatters()
+
+    def present_many(self, orders: Iterable[Order]) -> List[Dict[str, Any]]:
+        orders = list(orders)
+        for order in orders:
+            self.contacts.prime([related_user(order, "customer"), related_user(order, "seller")])
+        return [self.present(order) for order in orders]
+
+    def present(self, order: Order) -> Dict[str, Any]:
+        fmt = self.formatters
+        customer = self.contacts.get(order.customer_id)
+        seller = self.contacts.get(order.seller_id)
+        return {
+            "id": order.id,
+            "status": fmt["status"](order.status),
+            "total_amount": fmt["total_amount"](order.total_amount),
+            "notes": order.notes,
+            "created_at": fmt["created_at"](order.created_at),
+            "seller_id": order.seller_id,
+            "customer_id": order.customer_id,
+            "items": [
+                {
+                    "id": item.id,
+                    "product_id": item.product_id,
+                    "product_name": item.product.name,
+                    "quantity": item.quantity,
+                    "unit_price": fmt["unit_price"](item.unit_price),
+                }
+                for item in order.items.all()
+            ],
+            "payment_method": fmt["payment_method"](order.payment_method),
+            "payment_method_display": order.get_payment_method_display(),
+            "delivery_type": fmt["delivery_type"](order.delivery_type),
+            "delivery_type_display": order.get_delivery_type_display(),
+            "delivery_address": order.delivery_address,
+            "delivery_phone": order.delivery_phone,
+            "customer_email": customer.email,
+            "customer_phone": customer.phone,
+            "customer_room": customer.room,
+            "seller_email": seller.email,
+            "seller_phone": seller.seller_phone,
+            "seller_room": seller.room,
+        }
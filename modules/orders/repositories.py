@@ -1,6 +1,8 @@
+from django.utils import timezone
+
 from core.repository import BaseRepository
 
-from .models import Order
+from .models import Order, OrderIdempotencyKey
 
 
 class OrderRepository(BaseRepository[Order]):
@@ -13,3 +15,14 @@ class OrderRepository(BaseRepository[Order]):
     def for_seller(self, seller_id: int):
         return self.filter(seller_id=seller_id)
 
+
+class OrderIdempotencyKeyRepository(BaseRepository[OrderIdempotencyKey]):
+    def __init__(self) -> None:
+        super().__init__(OrderIdempotencyKey)
+
+    def find_active(self, user_id: int, key: str):
+        return self.filter(user_id=user_id, key=key, expires_at__gt=timezone.now()).first()
+
+    def delete_expired(self) -> int:
+        deleted, _ = self.filter(expires_at__lt=timezone.now()).delete()
+        return deleted
@@ -1,5 +1,11 @@
 from rest_framework import serializers
 
+from modules.users.contact_info import (
+    ContactPrimingListSerializer,
+    contact_resolver_for,
+    related_user,
+)
+
 from .models import Order, OrderItem
 from .services import OrderItemDTO, OrderService
 
@@ -16,10 +22,10 @@ class OrderSerializer(serializers.ModelSerializer):
     items = OrderItemSerializer(many=True, read_only=True)
     payment_method_display = serializers.CharField(source="get_payment_method_display", read_only=True)
     delivery_type_display = serializers.CharField(source="get_delivery_type_display", read_only=True)
-    customer_email = serializers.CharField(source="customer.email", read_only=True)
-    customer_phone = serializers.CharField(source="customer.phone", read_only=True)
+    customer_email = serializers.SerializerMethodField()
+    customer_phone = serializers.SerializerMethodField()
     customer_room = serializers.SerializerMethodField()
-    seller_email = serializers.CharField(source="seller.email", read_only=True)
+    seller_email = serializers.SerializerMethodField()
     seller_phone = serializers.SerializerMethodField()
     seller_room = serializers.SerializerMethodField()
 
@@ -47,25 +53,31 @@ class OrderSerializer(serializers.ModelSerializer):
             "seller_phone",
             "seller_room",
         ]
+        list_serializer_class = ContactPrimingListSerializer
+
+    def contact_users(self, obj):
+        return [related_user(obj, "customer"), related_user(obj, "seller")]
+
+    def _contact(self, user_id):
+        return contact_resolver_for(self.context).get(user_id)
+
+    def get_customer_email(self, obj):
+        return self._contact(obj.customer_id).email
+
+    def get_customer_phone(self, obj):
+        return self._contact(obj.customer_id).phone
 
     def get_customer_room(self, obj):
-        if obj.customer.room_number and obj.customer.block:
-            return f"{obj.customer.block} Blok, {obj.customer.room_number} No"
-        elif obj.customer.room_number:
-            return f"{obj.customer.room_number} No"
-        return ""
+        return self._contact(obj.customer_id).room
+
+    def get_seller_email(self, obj):
+        return self._contact(obj.seller_id).email
 
     def get_seller_phone(self, obj):
-        if hasattr(obj.seller, "seller_profile"):
-            return obj.seller.seller_profile.phone
-        return obj.seller.phone or ""
+        return self._contact(obj.seller_id).seller_phone
 
     def get_seller_room(self, obj):
-        if obj.seller.room_number and obj.seller.block:
-            return f"{obj.seller.block} Blok, {obj.seller.room_number} No"
-        elif obj.seller.room_number:
-            return f"{obj.seller.room_number} No"
-        return ""
+        return self._contact(obj.seller_id).room
 
 
 class OrderCreateItemSerializer(serializers.Serializer):
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from collections import defaultdict
 from dataclasses import dataclass
+from datetime import timedelta
 from decimal import Decimal
-from typing import List
+from typing import Any, Dict, List, Optional
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
 
-from core.events import OrderCreatedEvent, event_dispatcher
+from core.events import OrderCreatedEvent
+from core.events.outbox import outbox
 from core.exceptions import PermissionDeniedError, ValidationError
 from core.utils.logging import get_logger
+from modules.products.cache import catalog_cache
 
 from .models import Order, OrderItem
-from .repositories import OrderRepository
+from .repositories import OrderIdempotencyKeyRepository, OrderRepository
 
 User = get_user_model()
 logger = get_logger(__name__)
@@ -27,12 +38,14 @@ class OrderItemDTO:
 @dataclass
 class OrderService:
     order_repo: OrderRepository = OrderRepository()
-    dispatcher = event_dispatcher
+    outbox = outbox
 
     def _load_products(self, product_ids: List[int]):
         from modules.products.models import Product
 
-        return Product.objects.filter(id__in=product_ids).select_related("stock", "seller", "dorm")
+        return Product.objects.filter(id__in=product_ids).select_related(
+            "stock", "seller", "seller__seller_profile", "dorm"
+        )
 
     def create_order(
         self,
@@ -79,8 +92,19 @@ class OrderService:
         if hasattr(seller, "seller_profile") and not seller.seller_profile.store_is_open:
             raise ValidationError("Mağaza şu anda kapalı. Lütfen daha sonra tekrar deneyin.")
 
+        quantities: Dict[int, int] = defaultdict(int)
+        for dto in items:
+            quantities[dto.product_id] += dto.quantity
+
         total = Decimal("0.00")
         with transaction.atomic():
+            try:
+                Stock.reserve_many(quantities)
+            except ValueError as e:
+                raise ValidationError(f"Stok hatası: {str(e)}") from e
+            except LookupError as e:
+                raise ValidationError("Bazı ürünler için stok bilgisi bulunamadı.") from e
+
             order = self.order_repo.create(
                 customer=customer,
                 seller=seller,
@@ -94,16 +118,6 @@ class OrderService:
             bulk_items = []
             for dto in items:
                 product = product_map[dto.product_id]
-                # Reload stock to ensure we have the latest quantity
-                product.stock.refresh_from_db()
-                
-                try:
-                    product.stock.decrease(dto.quantity)
-                except ValueError as e:
-                    raise ValidationError(f"Stok hatası: {str(e)}")
-                except AttributeError:
-                    raise ValidationError(f"Ürün '{product.name}' için stok bilgisi bulunamadı.")
-                
                 line_total = product.price * dto.quantity
                 total += line_total
                 bulk_items.append(
@@ -113,10 +127,10 @@ class OrderService:
             order.total_amount = total
             order.save(update_fields=["total_amount"])
             order.log_status(Order.Status.PENDING, customer.id)
+            self.outbox.publish(
+                OrderCreatedEvent(payload={"order_id": order.id, "seller_id": seller.id, "customer_id": customer.id})
+            )
 
-        self.dispatcher.dispatch(
-            OrderCreatedEvent(payload={"order_id": order.id, "seller_id": seller.id, "customer_id": customer.id})
-        )
         logger.info(
             "order.created",
             order_id=order.id,
@@ -138,7 +152,7 @@ class OrderService:
     def approve(self, order_id: int, seller: User) -> Order:
         order = self.order_repo.get(id=order_id, seller=seller)
         order = self._change_status(order=order, actor=seller, status=Order.Status.ONAY)
-        self._trigger_analytics_refresh(order.dorm_id)
+        self._trigger_analytics_refresh(order)
         return order
 
     def reject(self, order_id: int, seller: User, note: str = "") -> Order:
@@ -146,33 +160,130 @@ class OrderService:
         return self._change_status(order=order, actor=seller, status=Order.Status.RED, note=note)
 
     def cancel(self, order_id: int, actor: User, reason: str = "") -> Order:
-        order = self.order_repo.get(id=order_id)
-        order = self._change_status(order=order, actor=actor, status=Order.Status.IPTAL, note=reason)
+        with transaction.atomic():
+            # Lock the row so concurrent cancels cannot both see COMPLETED and revert the rollup twice.
+            order = self.order_repo.filter(id=order_id).select_for_update().get()
+            was_completed = order.status == Order.Status.COMPLETED
+            order = self._change_status(order=order, actor=actor, status=Order.Status.IPTAL, note=reason)
+            if was_completed:
+                self._sales_reports().revert_completed(order)
+                self._trigger_analytics_refresh(order)
+                # Units sold drive the catalog's popularity sort.
+                catalog_cache.bump(order.dorm_id)
         order.open_chat(message=reason or "Sipariş iptal edildi.", sender="seller")
         return order
 
     def complete(self, order_id: int, seller: User) -> Order:
         """Mark order as completed (delivered) by seller."""
-        order = self.order_repo.get(id=order_id, seller=seller)
-        if order.status != Order.Status.ONAY:
-            raise ValidationError("Sadece hazırlanıyor durumundaki siparişler tamamlanabilir.")
-        order = self._change_status(order=order, actor=seller, status=Order.Status.COMPLETED)
-        self._trigger_analytics_refresh(order.dorm_id)
+        with transaction.atomic():
+            # Same row lock as cancel: concurrent completes (or a racing cancel) see the committed status.
+            order = self.order_repo.filter(id=order_id, seller=seller).select_for_update().get()
+            if order.status != Order.Status.ONAY:
+                raise ValidationError("Sadece hazırlanıyor durumundaki siparişler tamamlanabilir.")
+            order = self._change_status(order=order, actor=seller, status=Order.Status.COMPLETED)
+            self._sales_reports().record_completed(order)
+            catalog_cache.bump(order.dorm_id)
+        self._trigger_analytics_refresh(order)
         return order
 
     def list_for_customer(self, customer: User):
-        return self.order_repo.for_customer(customer.id).select_related("seller")
+        return self._with_listing_relations(self.order_repo.for_customer(customer.id))
 
     def list_for_seller(self, seller: User):
-        return self.order_repo.for_seller(seller.id).select_related("customer")
+        return self._with_listing_relations(self.order_repo.for_seller(seller.id))
 
-    def _trigger_analytics_refresh(self, dorm_id: int) -> None:
-        try:
-            from modules.analytics.tasks import refresh_popular_sellers
+    def _with_listing_relations(self, queryset):
+        """Load everything OrderSerializer touches so listing costs a fixed number of queries."""
+        return queryset.select_related("customer", "seller", "seller__seller_profile").prefetch_related(
+            Prefetch("items", queryset=OrderItem.objects.select_related("product").order_by("id"))
+        )
+
+    def _sales_reports(self):
+        from modules.analytics.services import SalesReportService
+
+        return SalesReportService()
+
+    def _trigger_analytics_refresh(self, order: Order) -> None:
+        from modules.analytics.cache import dashboard_cache
+        from modules.analytics.services import PopularSellerRefreshScheduler
 
-            refresh_popular_sellers.delay(dorm_id)
-        except Exception:
-            from modules.analytics.services import AnalyticsService
+        dorm_id, seller_id = order.dorm_id, order.seller_id
+        transaction.on_commit(lambda: PopularSellerRefreshScheduler().mark_dirty(dorm_id))
+        transaction.on_commit(lambda: dashboard_cache.mark_dirty(seller_id))
 
-            AnalyticsService().generate_popular_sellers(dorm_id)
 
+
+@dataclass
+class StoredResponse:
+    request_hash: str
+    response: Dict[str, Any]
+
+
+@dataclass
+class IdempotencyService:
+    """Stores order submission responses per (user, Idempotency-Key) so retries can be replayed.
+
+    The cache is the primary store; the database table keeps keys alive across cache
+    evictions and restarts.
+    """
+
+    key_repo: OrderIdempotencyKeyRepository = OrderIdempotencyKeyRepository()
+    lock_timeout: int = 30
+
+    @property
+    def ttl(self) -> int:
+        return settings.IDEMPOTENCY_KEY_TTL
+
+    @staticmethod
+    def hash_payload(payload: Any) -> str:
+        encoded = json.dumps(payload, sort_keys=True, cls=DjangoJSONEncoder).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _cache_key(self, user_id: int, key: str) -> str:
+        return f"order_idempotency:{user_id}:{hashlib.sha256(key.encode()).hexdigest()}"
+
+    def lookup(self, *, user_id: int, key: str) -> Optional[StoredResponse]:
+        cached = cache.get(self._cache_key(user_id, key))
+        if cached is not None:
+            return StoredResponse(**cached)
+        record = self.key_repo.find_active(user_id, key)
+        if record is None:
+            return None
+        stored = StoredResponse(request_hash=record.request_hash, response=record.response)
+        remaining = int((record.expires_at - timezone.now()).total_seconds())
+        if remaining > 0:
+            cache.set(self._cache_key(user_id, key), stored.__dict__, remaining)
+        return stored
+
+    def acquire(self, *, user_id: int, key: str) -> bool:
+        """Guard against two in-flight requests sharing the same key."""
+        return cache.add(f"{self._cache_key(user_id, key)}:lock", 1, self.lock_timeout)
+
+    def release(self, *, user_id: int, key: str) -> None:
+        cache.delete(f"{self._cache_key(user_id, key)}:lock")
+
+    def purge_expired(self) -> int:
+        """Delete keys past their TTL; lookups already ignore them."""
+        deleted = self.key_repo.delete_expired()
+        logger.info("order_idempotency.purged", deleted=deleted)
+        return deleted
+
+    def store(
+        self, *, user_id: int, key: str, request_hash: str, order_id: int, response: Dict[str, Any]
+    ) -> None:
+        response = json.loads(json.dumps(response, cls=DjangoJSONEncoder))
+        self.key_repo.update_or_create(
+            defaults={
+                "request_hash": request_hash,
+                "order_id": order_id,
+                "response": response,
+                "expires_at": timezone.now() + timedelta(seconds=self.ttl),
+            },
+            user_id=user_id,
+            key=key,
+        )
+        cache.set(
+            self._cache_key(user_id, key),
+            {"request_hash": request_hash, "response": response},
+            self.ttl,
+        )
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from celery import shared_task
+
+from .services import IdempotencyService
+
+
+@shared_task(name="orders.purge_idempotency_keys", ignore_result=True)
+def purge_idempotency_keys() -> None:
+    IdempotencyService().purge_expired()
@@ -1,9 +1,13 @@
-from rest_framework import permissions, status, viewsets
+from rest_framework import permissions, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from core.pagination import KeysetPagination
+
+from .filters import OrderFilter
+from .presenters import OrderPresenter
 from .serializers import OrderCreateSerializer, OrderSerializer, OrderStatusSerializer
-from .services import OrderService
+from .services import IdempotencyService, OrderService
 
 
 class OrderViewSet(viewsets.ViewSet):
@@ -16,9 +20,61 @@ class OrderViewSet(viewsets.ViewSet):
             orders = service.list_for_seller(request.user)
         else:
             orders = service.list_for_customer(request.user)
-        return Response(OrderSerializer(orders, many=True).data)
+
+        filterset = OrderFilter(request.query_params, queryset=orders)
+        if not filterset.is_valid():
+            raise serializers.ValidationError(filterset.errors)
+
+        paginator = KeysetPagination(ordering=("-created_at", "-id"))
+        page = paginator.paginate_queryset(filterset.qs, request, view=self)
+        return paginator.get_paginated_response(OrderPresenter().present_many(page))
 
     def create(self, request):
+        idempotency_key = request.headers.get("Idempotency-Key")
+        if not idempotency_key:
+            return self._create_order(request)
+
+        if len(idempotency_key) > 255:
+            return Response({"detail": "Idempotency-Key en fazla 255 karakter olabilir."}, status=status.HTTP_400_BAD_REQUEST)
+
+        idempotency = IdempotencyService()
+        request_hash = idempotency.hash_payload(request.data)
+        stored = idempotency.lookup(user_id=request.user.id, key=idempotency_key)
+        if stored is not None:
+            return self._replay(stored, request_hash)
+
+        if not idempotency.acquire(user_id=request.user.id, key=idempotency_key):
+            return Response(
+                {"detail": "Bu Idempotency-Key ile bir istek zaten işleniyor."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        try:
+            # Re-check after taking the lock: a concurrent request may have just finished.
+            stored = idempotency.lookup(user_id=request.user.id, key=idempotency_key)
+            if stored is not None:
+                return self._replay(stored, request_hash)
+            response = self._create_order(request)
+            if response.status_code == status.HTTP_201_CREATED:
+                idempotency.store(
+                    user_id=request.user.id,
+                    key=idempotency_key,
+                    request_hash=request_hash,
+                    order_id=response.data["id"],
+                    response=response.data,
+                )
+            return response
+        finally:
+            idempotency.release(user_id=request.user.id, key=idempotency_key)
+
+    def _replay(self, stored, request_hash):
+        if stored.request_hash != request_hash:
+            return Response(
+                {"detail": "Idempotency-Key farklı bir istek gövdesi ile yeniden kullanılamaz."},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        return Response(stored.response, status=status.HTTP_201_CREATED, headers={"Idempotent-Replayed": "true"})
+
+    def _create_order(self, request):
         try:
             serializer = OrderCreateSerializer(data=request.data, context={"request": request})
             serializer.is_valid(raise_exception=True)
@@ -2,8 +2,10 @@ from dataclasses import dataclass
 from typing import Any, Dict, Literal
 
 from django.conf import settings
+from django.db import transaction
 
-from core.events import SubscriptionActivatedEvent, event_dispatcher
+from core.events import SubscriptionActivatedEvent
+from core.events.outbox import outbox
 from core.exceptions import ValidationError
 from core.utils.logging import get_logger
 
@@ -169,16 +171,27 @@ class PaymentService:
                 subscription_id=subscription.id,
             )
 
-        # Activate subscription
-        subscription.is_active = True
-        subscription.save(update_fields=["is_active"])
+        with transaction.atomic():
+            # Activate subscription
+            subscription.is_active = True
+            subscription.save(update_fields=["is_active"])
 
-        # Update usage tracking
-        service = SubscriptionService()
-        service.usage_repo.update_or_create(
-            seller=subscription.seller,
-            defaults={"product_slots": subscription.plan.max_products},
-        )
+            # Update usage tracking
+            service = SubscriptionService()
+            service.usage_repo.update_or_create(
+                seller=subscription.seller,
+                defaults={"product_slots": subscription.plan.max_products},
+            )
+
+            outbox.publish(
+                SubscriptionActivatedEvent(
+                    payload={
+                        "seller_id": subscription.seller_id,
+                        "plan_id": subscription.plan_id,
+                        "subscription_id": subscription.id,
+                    }
+                )
+            )
 
         logger.info(
             "payment.subscription_activated",
@@ -188,16 +201,6 @@ class PaymentService:
             session_id=session_id,
         )
 
-        event_dispatcher.dispatch(
-            SubscriptionActivatedEvent(
-                payload={
-                    "seller_id": subscription.seller_id,
-                    "plan_id": subscription.plan_id,
-                    "subscription_id": subscription.id,
-                }
-            )
-        )
-
         return subscription.id
 
     def _activate_subscription_by_id(self, subscription_id: int) -> None:
@@ -206,31 +209,32 @@ class PaymentService:
         from modules.subscription.services import SubscriptionService
 
         try:
-            subscription = SellerSubscription.objects.select_related("plan", "seller").get(id=subscription_id)
-            subscription.is_active = True
-            subscription.save(update_fields=["is_active"])
-
-            service = SubscriptionService()
-            service.usage_repo.update_or_create(
-                seller=subscription.seller,
-                defaults={"product_slots": subscription.plan.max_products},
-            )
+            with transaction.atomic():
+                subscription = SellerSubscription.objects.select_related("plan", "seller").get(id=subscription_id)
+                subscription.is_active = True
+                subscription.save(update_fields=["is_active"])
+
+                service = SubscriptionService()
+                service.usage_repo.update_or_create(
+                    seller=subscription.seller,
+                    defaults={"product_slots": subscription.plan.max_products},
+                )
 
-            logger.info(
-                "payment.subscription_activated_by_id",
-                subscription_id=subscription.id,
-                seller_id=subscription.seller_id,
-            )
+                logger.info(
+                    "payment.subscription_activated_by_id",
+                    subscription_id=subscription.id,
+                    seller_id=subscription.seller_id,
+                )
 
-            event_dispatcher.dispatch(
-                SubscriptionActivatedEvent(
-                    payload={
-                        "seller_id": subscription.seller_id,
-                        "plan_id": subscription.plan_id,
-                        "subscription_id": subscription.id,
-                    }
+                outbox.publish(
+                    SubscriptionActivatedEvent(
+                        payload={
+                            "seller_id": subscription.seller_id,
+                            "plan_id": subscription.plan_id,
+                            "subscription_id": subscription.id,
+                        }
+                    )
                 )
-            )
         except SellerSubscription.DoesNotExist:
             logger.error("payment.subscription_not_found_by_id", subscription_id=subscription_id)
             raise ValidationError(f"Subscription {subscription_id} not found")
@@ -11,6 +11,6 @@ class ProductsConfig(AppConfig):
 
         from .handlers import handle_product_out, handle_stock_decreased
 
-        event_dispatcher.subscribe(StockDecreasedEvent.name, handle_stock_decreased)
-        event_dispatcher.subscribe(ProductOutOfStockEvent.name, handle_product_out)
+        event_dispatcher.subscribe(StockDecreasedEvent, handle_stock_decreased, batch=True)
+        event_dispatcher.subscribe(ProductOutOfStockEvent, handle_product_out, batch=True)
 
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from core.utils.http import make_etag
+
+
+class ProductCatalogCache:
+    """Versioned cache of the serialized product catalog per dorm.
+
+    Every write that can change a dorm's catalog bumps the dorm's version counter,
+    which makes all previously cached payloads unreachable in O(1). Stale entries
+    simply expire with their TTL.
+    """
+
+    version_key_template = "catalog_version:{dorm_id}"
+    payload_key_template = "catalog:{dorm_id}:v{version}:{variant}"
+
+    @property
+    def ttl(self) -> int:
+        return settings.PRODUCT_CATALOG_CACHE_TTL
+
+    def version(self, dorm_id: int) -> int:
+        key = self.version_key_template.format(dorm_id=dorm_id)
+        version = cache.get(key)
+        if version is None:
+            # Seed from the clock so an evicted counter never restarts at a version
+            # whose payload is still cached.
+            cache.add(key, int(time.time() * 1000), None)
+            version = cache.get(key)
+        return version
+
+    def bump(self, dorm_id: Optional[int]) -> None:
+        """Invalidate the dorm's catalog once the current transaction commits."""
+        if dorm_id is None:
+            return
+        transaction.on_commit(lambda: self._increment(dorm_id))
+
+    def _increment(self, dorm_id: int) -> None:
+        key = self.version_key_template.format(dorm_id=dorm_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, int(time.time() * 1000), None)
+
+    def payload_key(self, dorm_id: int, variant: str = "") -> str:
+        variant_hash = hashlib.sha1(variant.encode()).hexdigest()
+        return self.payload_key_template.format(dorm_id=dorm_id, version=self.version(dorm_id), variant=variant_hash)
+
+    def etag(self, dorm_id: int, *parts) -> str:
+        return make_etag("catalog", dorm_id, self.version(dorm_id), *parts)
+
+    def get_or_build(self, dorm_id: int, builder: Callable[[], Any], variant: str = "") -> Any:
+        # Resolve the key once so a concurrent bump can't file a stale build under the new version.
+        key = self.payload_key(dorm_id, variant)
+        payload = cache.get(key)
+        if payload is None:
+            payload = builder()
+            cache.set(key, payload, self.ttl)
+        return payload
+
+
+catalog_cache = ProductCatalogCache()
@@ -0,0 +1,51 @@
+import django_filters
+from django.db import connection
+from django.db.models import Q
+
+from .models import Product
+
+SEARCH_CONFIG = "turkish"
+
+# Keyset orderings for the dorm catalog; each ends with ``id`` so the cursor is unique.
+CATALOG_ORDERINGS = {
+    "name": ("name", "id"),
+    "price": ("price", "id"),
+    "-price": ("-price", "-id"),
+    "newest": ("-created_at", "-id"),
+    "popularity": ("-popularity", "-id"),
+}
+
+
+class ProductCatalogFilter(django_filters.FilterSet):
+    category = django_filters.NumberFilter(field_name="category_id")
+    seller = django_filters.NumberFilter(field_name="seller_id")
+    min_price = django_filters.NumberFilter(field_name="price", lookup_expr="gte")
+    max_price = django_filters.NumberFilter(field_name="price", lookup_expr="lte")
+    in_stock = django_filters.BooleanFilter(method="filter_in_stock")
+    q = django_filters.CharFilter(method="filter_search")
+
+    class Meta:
+        model = Product
+        fields = ["category", "seller", "min_price", "max_price", "in_stock", "q"]
+
+    def filter_in_stock(self, queryset, name, value):
+        if value:
+            return queryset.filter(is_out_of_stock=False, stock__quantity__gt=0)
+        return queryset
+
+    def filter_search(self, queryset, name, value):
+        value = value.strip()
+        if not value:
+            return queryset
+        if connection.vendor == "postgresql":
+            from django.contrib.postgres.search import SearchQuery, SearchVector
+
+            # Full-text match on name/description, with trigram similarity on the name
+            # as a fallback for typos. Both are backed by GIN indexes (see migrations).
+            return queryset.annotate(
+                search=SearchVector("name", "description", config=SEARCH_CONFIG)
+            ).filter(
+                Q(search=SearchQuery(value, config=SEARCH_CONFIG, search_type="websearch"))
+                | Q(name__trigram_similar=value)
+            )
+        return queryset.filter(Q(name__icontains=value) | Q(description__icontains=value))
@@ -3,17 +3,18 @@ from core.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
-def handle_stock_decreased(event):
+def handle_stock_decreased(events):
     logger.info(
         "stock.decreased",
-        product_id=event.payload.get("product_id"),
-        quantity=event.payload.get("quantity"),
+        changes=[
+            {"product_id": event.payload.get("product_id"), "quantity": event.payload.get("quantity")}
+            for event in events
+        ],
     )
 
 
-def handle_product_out(event):
+def handle_product_out(events):
     logger.info(
         "product.out_of_stock",
-        product_id=event.payload.get("product_id"),
+        product_ids=[event.payload.get("product_id") for event in events],
     )
-
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+from core.utils.migrations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('dorms', '0001_initial'),
+        ('products', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['dorm', 'name'], name='product_dorm_active_only'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+SEARCH_INDEX = GinIndex(
+    SearchVector("name", "description", config="turkish"),
+    name="product_search_vector",
+)
+TRIGRAM_INDEX = GinIndex(fields=["name"], opclasses=["gin_trgm_ops"], name="product_name_trgm")
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Product = apps.get_model("products", "Product")
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.add_index(Product, SEARCH_INDEX)
+    schema_editor.add_index(Product, TRIGRAM_INDEX)
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Product = apps.get_model("products", "Product")
+    schema_editor.remove_index(Product, TRIGRAM_INDEX)
+    schema_editor.remove_index(Product, SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+    """Full-text and trigram indexes backing catalog search (PostgreSQL only)."""
+
+    dependencies = [
+        ("products", "0003_add_query_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from typing import Dict, Optional
 
 from django.conf import settings
 from django.core.validators import MinValueValidator
-from django.db import models, transaction
+from django.db import connection, models, transaction
+from django.db.models import Case, F, Q, When
+from django.utils import timezone
 
-from core.events import (
-    ProductOutOfStockEvent,
-    StockDecreasedEvent,
-    event_dispatcher,
-)
+from core.events import ProductOutOfStockEvent, StockDecreasedEvent
+from core.events.outbox import outbox
 from core.mixins import TimestampedModel
 
+from .cache import catalog_cache
+
 class Category(TimestampedModel):
     dorm = models.ForeignKey("dorms.Dorm", on_delete=models.CASCADE, related_name="categories")
     name = models.CharField(max_length=100)
@@ -38,6 +40,14 @@ class Product(TimestampedModel):
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            # Dorm catalog only lists active products, ordered by name.
+            models.Index(
+                fields=["dorm", "name"],
+                condition=models.Q(is_active=True),
+                name="product_dorm_active_only",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -60,22 +70,124 @@ class Stock(TimestampedModel):
         verbose_name_plural = "Stock"
 
     def decrease(self, amount: int) -> None:
+        if amount <= 0:
+            raise ValueError("Amount must be positive.")
+        remaining = type(self).decrement(self.product_id, amount)
+        if remaining is None:
+            raise ValueError("Insufficient stock.")
+        self.quantity = remaining
+        if remaining == 0 and Stock.product.is_cached(self):
+            self.product.is_out_of_stock = True
+            self.product.is_active = False
+
+    @classmethod
+    def decrement(cls, product_id: int, amount: int) -> Optional[int]:
+        """Atomically decrease a product's stock without loading the row.
+
+        Returns the new quantity, or ``None`` when the stock is insufficient. The
+        check and the write happen in a single conditional UPDATE, so concurrent
+        checkouts can never drive the quantity below zero.
+        """
         if amount <= 0:
             raise ValueError("Amount must be positive.")
         with transaction.atomic():
-            self.refresh_from_db()
-            if self.quantity < amount:
-                raise ValueError("Insufficient stock.")
-            self.quantity -= amount
-            self.save(update_fields=["quantity"])
-            event_dispatcher.dispatch(
-                StockDecreasedEvent(payload={"product_id": self.product_id, "quantity": self.quantity})
-            )
-            if self.quantity == 0:
-                self.product.is_out_of_stock = True
-                self.product.is_active = False
-                self.product.save(update_fields=["is_out_of_stock", "is_active"])
-                event_dispatcher.dispatch(
-                    ProductOutOfStockEvent(payload={"product_id": self.product_id})
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"UPDATE {cls._meta.db_table} AS s SET quantity = s.quantity - %s, updated_at = %s "
+                        f"FROM {Product._meta.db_table} AS p "
+                        "WHERE s.product_id = p.id AND s.product_id = %s AND s.quantity >= %s "
+                        "RETURNING s.quantity, p.dorm_id",
+                        [amount, timezone.now(), product_id, amount],
+                    )
+                    row = cursor.fetchone()
+            else:
+                updated = cls.objects.filter(product_id=product_id, quantity__gte=amount).update(
+                    quantity=F("quantity") - amount, updated_at=timezone.now()
+                )
+                row = (
+                    cls.objects.filter(product_id=product_id).values_list("quantity", "product__dorm_id").first()
+                    if updated
+                    else None
                 )
+            if row is None:
+                return None
+            remaining, dorm_id = row
+            cls._after_decrease({product_id: remaining}, {product_id: dorm_id})
+        return remaining
+
+    @classmethod
+    def reserve_many(cls, quantities: Dict[int, int]) -> Dict[int, int]:
+        """Decrease stock for several products at once and return the new quantities.
+
+        Rows are locked in id order to avoid deadlocks between concurrent checkouts,
+        then decremented with a single conditional UPDATE. Must be called inside a
+        transaction; raises ``ValueError`` if any product lacks enough stock.
+        """
+        if not quantities:
+            return {}
+        if any(amount <= 0 for amount in quantities.values()):
+            raise ValueError("Amount must be positive.")
+
+        rows = list(
+            cls.objects.select_for_update(of=("self",))
+            .filter(product_id__in=quantities.keys())
+            .order_by("id")
+            .values_list("product_id", "quantity", "product__dorm_id")
+        )
+        locked = {product_id: quantity for product_id, quantity, _ in rows}
+        dorm_ids = {product_id: dorm_id for product_id, _, dorm_id in rows}
+        missing = set(quantities) - set(locked)
+        if missing:
+            raise LookupError(f"Stock not found for products: {sorted(missing)}")
+        if any(locked[product_id] < amount for product_id, amount in quantities.items()):
+            raise ValueError("Insufficient stock.")
+
+        condition = Q()
+        for product_id, amount in quantities.items():
+            condition |= Q(product_id=product_id, quantity__gte=amount)
+        updated = cls.objects.filter(condition).update(
+            quantity=Case(
+                *[
+                    When(product_id=product_id, then=F("quantity") - amount)
+                    for product_id, amount in quantities.items()
+                ],
+                default=F("quantity"),
+                output_field=models.PositiveIntegerField(),
+            ),
+            updated_at=timezone.now(),
+        )
+        if updated != len(quantities):
+            raise ValueError("Insufficient stock.")
+
+        remaining = {product_id: locked[product_id] - amount for product_id, amount in quantities.items()}
+        cls._after_decrease(remaining, dorm_ids)
+        return remaining
+
+    @staticmethod
+    def _after_decrease(remaining: Dict[int, int], dorm_ids: Dict[int, int]) -> None:
+        """Deactivate depleted products, invalidate catalogs and publish stock events."""
+        depleted = [product_id for product_id, quantity in remaining.items() if quantity == 0]
+        if depleted:
+            Product.objects.filter(id__in=depleted).update(
+                is_out_of_stock=True, is_active=False, updated_at=timezone.now()
+            )
+
+        for dorm_id in set(dorm_ids.values()):
+            catalog_cache.bump(dorm_id)
+
+        outbox.publish_many(
+            [
+                *(
+                    StockDecreasedEvent(
+                        payload={"product_id": product_id, "quantity": quantity, "dorm_id": dorm_ids[product_id]}
+                    )
+                    for product_id, quantity in remaining.items()
+                ),
+                *(
+                    ProductOutOfStockEvent(payload={"product_id": product_id, "dorm_id": dorm_ids[product_id]})
+                    for product_id in depleted
+                ),
+            ]
+        )
 
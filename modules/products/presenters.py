@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import prefetch_related_objects
+
+from modules.users.contact_info import contact_resolver_for, related_user
+
+from .models import Product
+from .repositories import ProductImageRepository
+
+
+@lru_cache(maxsize=None)
+def _formatters():
+    """DRF field instances reused for scalar formatting, so output matches ProductSerializer."""
+    from .serializers import ProductImageSerializer, ProductSerializer
+
+    return {
+        "price": ProductSerializer().fields["price"].to_representation,
+        "image_created_at": ProductImageSerializer().fields["created_at"].to_representation,
+    }
+
+
+def _has_prefetched_images(product: Product) -> bool:
+    return "images" in getattr(product, "_prefetched_objects_cache", {})
+
+
+class ProductPresenter:
+    """Read-only, dict-building equivalent of ``ProductSerializer`` for hot list endpoints.
+
+    Emits exactly the same JSON as ``ProductSerializer(many=True).data`` but skips DRF's
+    per-field machinery (source resolution, SerializerMethodField dispatch, ReturnDict).
+    """
+
+    def __init__(self, context: Optional[Dict[str, Any]] = None) -> None:
+        self.context = context if context is not None else {}
+        self.request = self.context.get("request")
+        self.contacts = contact_resolver_for(self.context)
+        self.formatters = _formatters()
+
+    def present_many(self, products: Iterable[Product]) -> List[Dict[str, Any]]:
+        products = list(products)
+        unprefetched = [product for product in products if not _has_prefetched_images(product)]
+        if unprefetched:
+            prefetch_related_objects(unprefetched, ProductImageRepository().prefetch())
+        self.contacts.prime(related_user(product, "seller") for product in products)
+        return [self.present(product) for product in products]
+
+    def present(self, product: Product) -> Dict[str, Any]:
+        fmt = self.formatters
+        images = list(product.images.all())
+        if _has_prefetched_images(product):
+            first_image = images[0] if images else None
+        else:
+            first_image = product.images.order_by(*ProductImageRepository.primary_ordering).first()
+        try:
+            stock_quantity = product.stock.quantity
+        except ObjectDoesNotExist:
+            stock_quantity = None
+        seller = self.contacts.get(product.seller_id)
+
+        return {
+            "id": product.id,
+            "name": product.name,
+            "description": product.description,
+            "price": fmt["price"](product.price),
+            "is_active": product.is_active,
+            "is_out_of_stock": product.is_out_of_stock,
+            "stock_quantity": stock_quantity,
+            "category_id": product.category_id,
+            "category_name": product.category.name,
+            "seller_id": product.seller_id,
+            "seller_store_is_open": seller.store_is_open,
+            "seller_phone": seller.seller_phone,
+            "seller_room": seller.room,
+            "images": [
+                {
+                    "id": image.id,
+                    "image": self._image_url(image),
+                    "created_at": fmt["image_created_at"](image.created_at),
+                }
+                for image in images
+            ],
+            "image_url": self._image_url(first_image) if first_image is not None else None,
+        }
+
+    def _image_url(self, image) -> Optional[str]:
+        if not image.image:
+            return None
+        url = image.image.url
+        if self.request:
+            return self.request.build_absolute_uri(url)
+        return url
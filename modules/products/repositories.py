@@ -1,8 +1,11 @@
-from django.db.models import Count, QuerySet
+from typing import Dict, Iterable
+
+from django.db.models import Count, OuterRef, Prefetch, QuerySet, Subquery, Sum
+from django.db.models.functions import Coalesce
 
 from core.repository import BaseRepository
 
-from .models import Category, Product, Stock
+from .models import Category, Product, ProductImage, Stock
 
 
 class ProductRepository(BaseRepository[Product]):
@@ -21,6 +24,19 @@ class ProductRepository(BaseRepository[Product]):
     def annotate_with_stock(self) -> QuerySet[Product]:
         return self.model.objects.select_related("stock")
 
+    def annotate_popularity(self, queryset: QuerySet[Product]) -> QuerySet[Product]:
+        """Annotate units sold through completed orders as ``popularity``."""
+        from modules.orders.models import Order, OrderItem
+
+        units_sold = (
+            OrderItem.objects.filter(product_id=OuterRef("pk"), order__status=Order.Status.COMPLETED)
+            .order_by()
+            .values("product_id")
+            .annotate(total=Sum("quantity"))
+            .values("total")
+        )
+        return queryset.annotate(popularity=Coalesce(Subquery(units_sold), 0))
+
 
 class CategoryRepository(BaseRepository[Category]):
     def __init__(self) -> None:
@@ -31,3 +47,28 @@ class StockRepository(BaseRepository[Stock]):
     def __init__(self) -> None:
         super().__init__(Stock)
 
+
+
+class ProductImageRepository(BaseRepository[ProductImage]):
+    """A product's primary image is its oldest one; catalog and analytics agree on that."""
+
+    primary_ordering = ("created_at", "id")
+
+    def __init__(self) -> None:
+        super().__init__(ProductImage)
+
+    def ordered(self) -> QuerySet[ProductImage]:
+        return self.model.objects.order_by(*self.primary_ordering)
+
+    def prefetch(self, lookup: str = "images") -> Prefetch:
+        """Prefetch images in primary-first order, so ``images[0]`` is the primary image."""
+        return Prefetch(lookup, queryset=self.ordered())
+
+    def primary_for_products(self, product_ids: Iterable[int]) -> Dict[int, ProductImage]:
+        """Return the primary image of each product that has one, in a single query."""
+        product_ids = set(product_ids)
+        if not product_ids:
+            return {}
+        first_id = self.ordered().filter(product_id=OuterRef("product_id")).values("id")[:1]
+        images = self.model.objects.filter(product_id__in=product_ids, id=Subquery(first_id))
+        return {image.product_id: image for image in images}
@@ -1,6 +1,13 @@
 from rest_framework import serializers
 
+from modules.users.contact_info import (
+    ContactPrimingListSerializer,
+    contact_resolver_for,
+    related_user,
+)
+
 from .models import Product, ProductImage
+from .repositories import ProductImageRepository
 
 
 class ProductImageSerializer(serializers.ModelSerializer):
@@ -12,7 +19,7 @@ class ProductImageSerializer(serializers.ModelSerializer):
     
     def get_image(self, obj):
         if obj.image:
-            request = self.context.get('request')
+            request = self.context.get("request")
             if request:
                 return request.build_absolute_uri(obj.image.url)
             return obj.image.url
@@ -22,7 +29,7 @@ class ProductImageSerializer(serializers.ModelSerializer):
 class ProductSerializer(serializers.ModelSerializer):
     stock_quantity = serializers.IntegerField(source="stock.quantity", read_only=True)
     category_name = serializers.CharField(source="category.name", read_only=True)
-    seller_id = serializers.IntegerField(source="seller.id", read_only=True)
+    seller_id = serializers.IntegerField(read_only=True)
     seller_store_is_open = serializers.SerializerMethodField()
     seller_phone = serializers.SerializerMethodField()
     seller_room = serializers.SerializerMethodField()
@@ -48,40 +55,39 @@ class ProductSerializer(serializers.ModelSerializer):
             "images",
             "image_url",
         ]
+        list_serializer_class = ContactPrimingListSerializer
+
+    def contact_users(self, obj):
+        return [related_user(obj, "seller")]
+
+    def _seller_info(self, obj):
+        return contact_resolver_for(self.context).get(obj.seller_id)
 
     def get_image_url(self, obj):
         # Try to get first image from prefetched images or query
         first_image = None
-        if hasattr(obj, '_prefetched_objects_cache') and 'images' in obj._prefetched_objects_cache:
-            prefetched_images = obj._prefetched_objects_cache['images']
+        if hasattr(obj, "_prefetched_objects_cache") and "images" in obj._prefetched_objects_cache:
+            prefetched_images = obj._prefetched_objects_cache["images"]
             if prefetched_images:
                 first_image = prefetched_images[0]
         else:
-            first_image = obj.images.first()
+            first_image = obj.images.order_by(*ProductImageRepository.primary_ordering).first()
         
         if first_image and first_image.image:
-            request = self.context.get('request')
+            request = self.context.get("request")
             if request:
                 return request.build_absolute_uri(first_image.image.url)
             return first_image.image.url
         return None
 
     def get_seller_store_is_open(self, obj):
-        if hasattr(obj.seller, "seller_profile"):
-            return obj.seller.seller_profile.store_is_open
-        return True
+        return self._seller_info(obj).store_is_open
 
     def get_seller_phone(self, obj):
-        if hasattr(obj.seller, "seller_profile"):
-            return obj.seller.seller_profile.phone
-        return obj.seller.phone or ""
+        return self._seller_info(obj).seller_phone
 
     def get_seller_room(self, obj):
-        if obj.seller.room_number and obj.seller.block:
-            return f"{obj.seller.block} Blok, {obj.seller.room_number} No"
-        elif obj.seller.room_number:
-            return f"{obj.seller.room_number} No"
-        return ""
+        return self._seller_info(obj).room
 
 
 class ProductWriteSerializer(serializers.Serializer):
@@ -9,8 +9,9 @@ from django.db.models import ProtectedError
 from core.exceptions import PermissionDeniedError, ValidationError
 from core.utils.logging import get_logger
 
+from .cache import catalog_cache
 from .models import Product
-from .repositories import ProductRepository, StockRepository
+from .repositories import ProductImageRepository, ProductRepository, StockRepository
 
 User = get_user_model()
 logger = get_logger(__name__)
@@ -20,6 +21,7 @@ logger = get_logger(__name__)
 class ProductService:
     product_repo: ProductRepository = ProductRepository()
     stock_repo: StockRepository = StockRepository()
+    image_repo: ProductImageRepository = ProductImageRepository()
     max_free_products: int = 3
 
     def _ensure_product_owner(self, product: Product, seller: User) -> None:
@@ -64,6 +66,7 @@ class ProductService:
         )
         self.stock_repo.create(product=product, quantity=stock_quantity)
         self._sync_usage_slots(seller)
+        catalog_cache.bump(dorm_id)
         logger.info(
             "product.created",
             product_id=product.id,
@@ -107,7 +110,8 @@ class ProductService:
         
         if "is_active" in updated_field_names:
             self._sync_usage_slots(seller)
-            
+        catalog_cache.bump(product.dorm_id)
+
         logger.info(
             "product.updated",
             product_id=product.id,
@@ -127,11 +131,19 @@ class ProductService:
                 "Ürünü pasif yaparak gizleyebilirsiniz."
             )
         self._sync_usage_slots(seller)
+        catalog_cache.bump(product.dorm_id)
         logger.info("product.deleted", product_id=product_id, seller_id=seller.id)
 
     def list_for_dorm(self, dorm_id: int):
-        return self.product_repo.find_by_dorm(dorm_id).select_related("stock", "category", "seller", "seller__seller_profile").prefetch_related("images")
+        return self.product_repo.find_by_dorm(dorm_id).select_related("stock", "category", "seller", "seller__seller_profile").prefetch_related(self.image_repo.prefetch())
+
+    def catalog_for_dorm(self, dorm_id: int, sort: str = "name"):
+        """Dorm catalog queryset, annotated with whatever the requested sort needs."""
+        queryset = self.list_for_dorm(dorm_id)
+        if sort == "popularity":
+            queryset = self.product_repo.annotate_popularity(queryset)
+        return queryset
 
     def list_for_seller(self, seller: User):
-        return self.product_repo.find_by_seller(seller.id).select_related("stock", "category").prefetch_related("images")
+        return self.product_repo.find_by_seller(seller.id).select_related("stock", "category").prefetch_related(self.image_repo.prefetch())
 
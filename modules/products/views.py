@@ -1,11 +1,17 @@
-from rest_framework import permissions, status, viewsets
+from rest_framework import permissions, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from core.exceptions import PermissionDeniedError, NotFoundError
+from core.pagination import KeysetPagination
+from core.utils.http import conditional_response
+from .cache import catalog_cache
+from .filters import CATALOG_ORDERINGS, ProductCatalogFilter
 from .models import Category, Product, ProductImage
+from .presenters import ProductPresenter
+from .repositories import ProductImageRepository
 from .serializers import ProductSerializer, ProductWriteSerializer, ProductImageSerializer
 from .services import ProductService
 
@@ -15,23 +21,51 @@ class DormProductListView(APIView):
 
     def get(self, request):
         dorm_id = request.query_params.get("dorm")
-        dorm_id = dorm_id or request.user.dorm_id
-        products = ProductService().list_for_dorm(int(dorm_id))
-        serializer = ProductSerializer(products, many=True, context={'request': request})
-        return Response(serializer.data)
+        dorm_id = int(dorm_id or request.user.dorm_id)
+        sort = request.query_params.get("sort", "name")
+        if sort not in CATALOG_ORDERINGS:
+            raise serializers.ValidationError({"sort": f"Geçerli değerler: {', '.join(CATALOG_ORDERINGS)}"})
+        # Image URLs and page links are absolute, so cached payloads are keyed per full URL.
+        variant = request.build_absolute_uri()
+
+        def build():
+            products = ProductService().catalog_for_dorm(dorm_id, sort=sort)
+            filterset = ProductCatalogFilter(request.query_params, queryset=products)
+            if not filterset.is_valid():
+                raise serializers.ValidationError(filterset.errors)
+            paginator = KeysetPagination(ordering=CATALOG_ORDERINGS[sort])
+            page = paginator.paginate_queryset(filterset.qs, request, view=self)
+            data = ProductPresenter(context={'request': request}).present_many(page)
+            return {"next": paginator.get_next_link(), "results": data}
+
+        return conditional_response(
+            request,
+            catalog_cache.etag(dorm_id, variant),
+            lambda: Response(catalog_cache.get_or_build(dorm_id, build, variant=variant)),
+        )
 
 
 class ProductDetailView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, pk):
-        try:
-            product = Product.objects.select_related("stock", "category", "seller", "seller__seller_profile").prefetch_related("images").get(id=pk, is_active=True)
-        except Product.DoesNotExist:
+        dorm_id = Product.objects.filter(id=pk, is_active=True).values_list("dorm_id", flat=True).first()
+        if dorm_id is None:
             raise NotFoundError("Ürün bulunamadı")
-        
-        serializer = ProductSerializer(product, context={'request': request})
-        return Response(serializer.data)
+
+        def build():
+            product = (
+                Product.objects.select_related("stock", "category", "seller", "seller__seller_profile")
+                .prefetch_related(ProductImageRepository().prefetch())
+                .filter(id=pk, is_active=True)
+                .first()
+            )
+            if product is None:
+                raise NotFoundError("Ürün bulunamadı")
+            return Response(ProductSerializer(product, context={'request': request}).data)
+
+        etag = catalog_cache.etag(dorm_id, "product", pk, request.scheme, request.get_host())
+        return conditional_response(request, etag, build)
 
 
 class SellerProductViewSet(viewsets.ViewSet):
@@ -39,7 +73,7 @@ class SellerProductViewSet(viewsets.ViewSet):
 
     def list(self, request):
         products = ProductService().list_for_seller(request.user)
-        return Response(ProductSerializer(products, many=True, context={'request': request}).data)
+        return Response(ProductPresenter(context={'request': request}).present_many(products))
 
     def create(self, request):
         serializer = ProductWriteSerializer(data=request.data)
@@ -92,6 +126,7 @@ class SellerProductViewSet(viewsets.ViewSet):
         
         # Create new image
         product_image = ProductImage.objects.create(product=product, image=image_file)
+        catalog_cache.bump(product.dorm_id)
         
         return Response(ProductImageSerializer(product_image, context={'request': request}).data, status=status.HTTP_201_CREATED)
 
@@ -111,6 +146,7 @@ class SellerProductViewSet(viewsets.ViewSet):
             image.delete()
         except ProductImage.DoesNotExist:
             raise NotFoundError("Fotoğraf bulunamadı")
+        catalog_cache.bump(product.dorm_id)
         
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -126,6 +162,7 @@ class SellerProductViewSet(viewsets.ViewSet):
             raise PermissionDeniedError("Bu ürüne erişim izniniz yok")
         
         product.images.all().delete()
+        catalog_cache.bump(product.dorm_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -4,9 +4,11 @@ from dataclasses import dataclass
 from datetime import timedelta
 
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils import timezone
 
-from core.events import SubscriptionActivatedEvent, event_dispatcher
+from core.events import SubscriptionActivatedEvent
+from core.events.outbox import outbox
 from core.exceptions import ValidationError
 from core.utils.logging import get_logger
 
@@ -44,24 +46,25 @@ class SubscriptionService:
 
     def start_subscription(self, *, seller: User, plan_id: int):
         plan = self.plan_repo.get(id=plan_id)
-        subscription = self.subscription_repo.create(
-            seller=seller,
-            plan=plan,
-            expires_at=timezone.now() + timedelta(days=plan.duration_days),
-        )
-        self.usage_repo.update_or_create(
-            seller=seller,
-            defaults={"product_slots": plan.max_products},
-        )
-        event_dispatcher.dispatch(
-            SubscriptionActivatedEvent(
-                payload={
-                    "seller_id": seller.id,
-                    "plan_id": plan.id,
-                    "subscription_id": subscription.id,
-                }
+        with transaction.atomic():
+            subscription = self.subscription_repo.create(
+                seller=seller,
+                plan=plan,
+                expires_at=timezone.now() + timedelta(days=plan.duration_days),
+            )
+            self.usage_repo.update_or_create(
+                seller=seller,
+                defaults={"product_slots": plan.max_products},
+            )
+            outbox.publish(
+                SubscriptionActivatedEvent(
+                    payload={
+                        "seller_id": seller.id,
+                        "plan_id": plan.id,
+                        "subscription_id": subscription.id,
+                    }
+                )
             )
-        )
         logger.info(
             "subscription.activated",
             seller_id=seller.id,
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Set
+
+from django.db import models
+from rest_framework import serializers
+
+from .models import User
+
+
+def format_room(block: str, room_number: str) -> str:
+    if room_number and block:
+        return f"{block} Blok, {room_number} No"
+    elif room_number:
+        return f"{room_number} No"
+    return ""
+
+
+@dataclass(frozen=True)
+class ContactInfo:
+    """Contact details of a user as shown on product and order payloads."""
+
+    id: int
+    email: str
+    phone: str
+    room_number: str
+    block: str
+    has_seller_profile: bool = False
+    profile_phone: str = ""
+    store_is_open: bool = True
+
+    @classmethod
+    def from_user(cls, user: User) -> "ContactInfo":
+        profile = getattr(user, "seller_profile", None) if User.seller_profile.is_cached(user) else None
+        return cls(
+            id=user.id,
+            email=user.email,
+            phone=user.phone,
+            room_number=user.room_number,
+            block=user.block,
+            has_seller_profile=profile is not None,
+            profile_phone=profile.phone if profile is not None else "",
+            store_is_open=profile.store_is_open if profile is not None else True,
+        )
+
+    @property
+    def room(self) -> str:
+        return format_room(self.block, self.room_number)
+
+    @property
+    def seller_phone(self) -> str:
+        if self.has_seller_profile:
+            return self.profile_phone
+        return self.phone or ""
+
+
+class ContactInfoResolver:
+    """Loads contact info for every distinct user in a response with at most one query.
+
+    Users whose seller profile was already select_related are taken as-is; all other
+    ids are collected and fetched together on first access.
+    """
+
+    def __init__(self) -> None:
+        self._resolved: Dict[int, ContactInfo] = {}
+        self._pending: Set[int] = set()
+
+    def prime(self, users: Iterable[Any]) -> None:
+        """Register users (instances or ids) that will be resolved later."""
+        for user in users:
+            if user is None:
+                continue
+            if isinstance(user, User):
+                if user.id not in self._resolved and User.seller_profile.is_cached(user):
+                    self._resolved[user.id] = ContactInfo.from_user(user)
+                    continue
+                user = user.id
+            if user not in self._resolved:
+                self._pending.add(user)
+
+    def get(self, user_id: int) -> Optional[ContactInfo]:
+        if user_id not in self._resolved:
+            self._pending.add(user_id)
+            self._load()
+        return self._resolved.get(user_id)
+
+    def _load(self) -> None:
+        ids, self._pending = self._pending, set()
+        users = User.objects.filter(id__in=ids).select_related("seller_profile").only(
+            "id",
+            "email",
+            "phone",
+            "room_number",
+            "block",
+            "seller_profile__phone",
+            "seller_profile__store_is_open",
+        )
+        for user in users:
+            self._resolved[user.id] = ContactInfo.from_user(user)
+
+
+def related_user(instance: Any, field_name: str) -> Any:
+    """Return the related user if it is already loaded, otherwise just its id."""
+    descriptor = getattr(type(instance), field_name)
+    if descriptor.is_cached(instance):
+        return getattr(instance, field_name)
+    return getattr(instance, f"{field_name}_id")
+
+
+def contact_resolver_for(context: Dict[str, Any]) -> ContactInfoResolver:
+    """Return the resolver shared by every serializer rendering the current request."""
+    resolver = context.get("contact_resolver")
+    if resolver is None:
+        request = context.get("request")
+        resolver = getattr(request, "_contact_resolver", None)
+        if resolver is None:
+            resolver = ContactInfoResolver()
+            if request is not None:
+                request._contact_resolver = resolver
+        context["contact_resolver"] = resolver
+    return resolver
+
+
+class ContactPrimingListSerializer(serializers.ListSerializer):
+    """Primes the contact resolver with every row's users before rendering the rows."""
+
+    def to_representation(self, data):
+        rows = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        resolver = contact_resolver_for(self.context)
+        for row in rows:
+            resolver.prime(self.child.contact_users(row))
+        return super().to_representation(rows)
@@ -4,6 +4,8 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from modules.products.cache import catalog_cache
+
 from .serializers import RegisterSerializer, UserSerializer
 
 User = get_user_model()
@@ -67,6 +69,7 @@ class ToggleStoreStatusView(APIView):
         profile = request.user.seller_profile
         profile.store_is_open = not profile.store_is_open
         profile.save(update_fields=["store_is_open"])
+        catalog_cache.bump(request.user.dorm_id)
         
         return Response({
             "store_is_open": profile.store_is_open,
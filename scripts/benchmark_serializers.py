@@ -0,0 +1,106 @@
+"""Micro-benchmark of the list presenters against the DRF serializers they replace.
+
+Runs against a throwaway test database, so it never touches local data.
+Usage: python scripts/benchmark_serializers.py [rows] [repeat]
+"""
+
+import os
+import sys
+import timeit
+from decimal import Decimal
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+from modules.dorms.models import Dorm  # noqa: E402
+from modules.orders.models import Order, OrderItem  # noqa: E402
+from modules.orders.presenters import OrderPresenter  # noqa: E402
+from modules.orders.serializers import OrderSerializer  # noqa: E402
+from modules.products.models import Category, Product, Stock  # noqa: E402
+from modules.products.presenters import ProductPresenter  # noqa: E402
+from modules.products.serializers import ProductSerializer  # noqa: E402
+from modules.users.models import SellerProfile, User  # noqa: E402
+
+
+def seed(rows: int) -> None:
+    dorm = Dorm.objects.create(name="Benchmark Yurdu", code="benchmark")
+    seller = User.objects.create_user(
+        email="seller@bench.local", password="x", dorm=dorm, role=User.Roles.SELLER, room_number="12", block="A"
+    )
+    SellerProfile.objects.create(user=seller, dorm=dorm, phone="5550000000")
+    customer = User.objects.create_user(email="customer@bench.local", password="x", dorm=dorm, room_number="7")
+    category = Category.objects.create(dorm=dorm, name="Atıştırmalık", slug="atistirmalik")
+
+    products = Product.objects.bulk_create(
+        Product(seller=seller, dorm=dorm, category=category, name=f"Ürün {i}", price=Decimal("9.90"))
+        for i in range(rows)
+    )
+    Stock.objects.bulk_create(Stock(product=product, quantity=10) for product in products)
+
+    orders = Order.objects.bulk_create(
+        Order(customer=customer, seller=seller, dorm=dorm, total_amount=Decimal("19.80")) for _ in range(rows)
+    )
+    OrderItem.objects.bulk_create(
+        OrderItem(order=order, product=products[(i + j) % rows], quantity=1, unit_price=Decimal("9.90"))
+        for i, order in enumerate(orders)
+        for j in range(2)
+    )
+
+
+def bench(label: str, rows: list, serialize, present, repeat: int) -> None:
+    # Best of ``repeat`` runs, reported per row; rows are already loaded, so only rendering is timed.
+    serializer_time = min(timeit.repeat(lambda: serialize(rows), number=1, repeat=repeat)) / len(rows)
+    presenter_time = min(timeit.repeat(lambda: present(rows), number=1, repeat=repeat)) / len(rows)
+    print(
+        f"{label:<10} serializer {serializer_time * 1e6:8.1f} µs/row   "
+        f"presenter {presenter_time * 1e6:8.1f} µs/row   "
+        f"x{serializer_time / presenter_time:.1f}"
+    )
+
+
+def run(rows: int = 500, repeat: int = 5) -> None:
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        seed(rows)
+        products = list(
+            Product.objects.select_related("stock", "category", "seller", "seller__seller_profile")
+            .prefetch_related("images")
+            .order_by("id")
+        )
+        orders = list(
+            Order.objects.select_related("customer", "seller", "seller__seller_profile")
+            .prefetch_related("items__product")
+            .order_by("id")
+        )
+        bench(
+            "products",
+            products,
+            lambda data: ProductSerializer(data, many=True).data,
+            lambda data: ProductPresenter().present_many(data),
+            repeat,
+        )
+        bench(
+            "orders",
+            orders,
+            lambda data: OrderSerializer(data, many=True).data,
+            lambda data: OrderPresenter().present_many(data),
+            repeat,
+        )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    run(*args)
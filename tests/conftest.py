@@ -0,0 +1,88 @@
+from contextlib import contextmanager
+from decimal import Decimal
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+
+from core.utils.queries import QueryRecorder
+from modules.dorms.models import Dorm
+from modules.products.models import Category, Product, Stock
+from modules.users.models import SellerProfile, User
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hasher(settings):
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@pytest.fixture(autouse=True)
+def sync_event_handlers(settings):
+    settings.EVENT_HANDLER_BACKEND = "sync"
+
+
+@pytest.fixture(autouse=True)
+def strict_query_inspector(settings):
+    """Fail any test request with an N+1 pattern or over its view's ``QUERY_BUDGETS``."""
+    settings.QUERY_INSPECTOR_ENABLED = True
+    settings.QUERY_INSPECTOR_STRICT = True
+
+
+@pytest.fixture
+def query_budget():
+    """``with query_budget(3): ...`` fails the test if the block runs more than 3 queries
+    or repeats one SQL template more than ``QUERY_INSPECTOR_REPEAT_THRESHOLD`` times."""
+
+    @contextmanager
+    def _budget(max_queries=None, *, repeat_threshold=None):
+        threshold = settings.QUERY_INSPECTOR_REPEAT_THRESHOLD if repeat_threshold is None else repeat_threshold
+        with QueryRecorder().record() as recorder:
+            yield recorder
+        problems = recorder.problems(max_queries, threshold)
+        if problems:
+            pytest.fail("Query budget exceeded:\n" + "\n".join(problems), pytrace=False)
+
+    return _budget
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def dorm(db):
+    return Dorm.objects.create(name="Test Yurdu", code="test-yurdu")
+
+
+@pytest.fixture
+def seller(dorm):
+    user = User.objects.create_user(
+        email="seller@example.com", password="secret123", dorm=dorm, role=User.Roles.SELLER, room_number="12", block="A"
+    )
+    SellerProfile.objects.create(user=user, dorm=dorm, phone="5550000000")
+    return user
+
+
+@pytest.fixture
+def customer(dorm):
+    return User.objects.create_user(email="customer@example.com", password="secret123", dorm=dorm, room_number="7")
+
+
+@pytest.fixture
+def category(dorm):
+    return Category.objects.create(dorm=dorm, name="Atıştırmalık", slug="atistirmalik")
+
+
+@pytest.fixture
+def make_product(seller, category):
+    def _make(name="Çikolata", price="10.00", quantity=10, **extra):
+        product = Product.objects.create(
+            seller=seller, dorm=seller.dorm, category=category, name=name, price=Decimal(price), **extra
+        )
+        Stock.objects.create(product=product, quantity=quantity)
+        return product
+
+    return _make
@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+
+import pytest
+from rest_framework.test import APIClient
+
+from modules.orders.services import OrderItemDTO, OrderService
+from modules.users.models import User
+
+
+@pytest.fixture
+def admin_client(dorm):
+    admin = User.objects.create_user(email="admin@example.com", password="x", dorm=dorm, is_staff=True)
+    client = APIClient()
+    client.force_authenticate(admin)
+    return client
+
+
+@pytest.fixture
+def orders(customer, make_product):
+    products = [make_product(name=f"Ürün {i}") for i in range(3)]
+    service = OrderService()
+    return [
+        service.create_order(customer=customer, items=[OrderItemDTO(p.id, 1) for p in products[: i + 1]])
+        for i in range(5)
+    ]
+
+
+@pytest.mark.django_db
+def test_admin_orders_paginated_with_constant_queries(admin_client, orders, django_assert_max_num_queries):
+    seen = []
+    url = "/api/admin/orders?page_size=2"
+    while url:
+        # page + items (with products); users come from select_related
+        with django_assert_max_num_queries(2):
+            page = admin_client.get(url).json()
+        seen += [order["id"] for order in page["results"]]
+        assert all(item["product_name"] for order in page["results"] for item in order["items"])
+        url = page["next"]
+    assert seen == [order.id for order in reversed(orders)]
+
+    filtered = admin_client.get(f"/api/admin/orders?customer={orders[0].customer_id}&status=PENDING").json()
+    assert len(filtered["results"]) == 5
+    assert admin_client.get("/api/admin/orders?status=COMPLETED").json()["results"] == []
+
+
+@pytest.mark.django_db
+def test_admin_orders_export_streams(admin_client, orders):
+    response = admin_client.get("/api/admin/orders?export=ndjson")
+    assert response.streaming
+    rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+    assert [row["id"] for row in rows] == [order.id for order in reversed(orders)]
+    assert rows[0]["customer__email"] == "customer@example.com"
+
+    response = admin_client.get("/api/admin/products?export=csv&q=Ürün 1")
+    assert response["Content-Type"] == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+    assert [row["name"] for row in rows] == ["Ürün 1"]
+
+    assert admin_client.get("/api/admin/users?export=xml").status_code == 400
+
+
+@pytest.mark.django_db
+def test_admin_lists_require_staff(customer):
+    client = APIClient()
+    client.force_authenticate(customer)
+    assert client.get("/api/admin/users").status_code == 403
@@ -0,0 +1,321 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.exceptions import ValidationError
+from modules.analytics.cache import dashboard_cache
+from modules.analytics.models import PlatformMetrics, PopularSellerRank, SellerSalesReport
+from modules.analytics.services import (
+    AnalyticsService,
+    PlatformMetricsService,
+    PopularSellerRefreshScheduler,
+    SalesReportService,
+)
+from modules.orders.models import Order, OrderItem
+from modules.orders.services import OrderItemDTO, OrderService
+from modules.products.models import ProductImage
+from modules.products.repositories import ProductImageRepository
+from modules.users.models import User
+
+
+@pytest.fixture
+def make_order(seller, customer):
+    def _make(total, days_ago, status=Order.Status.COMPLETED, buyer=None):
+        order = Order.objects.create(
+            customer=buyer or customer, seller=seller, dorm=seller.dorm, status=status, total_amount=Decimal(total)
+        )
+        Order.objects.filter(id=order.id).update(created_at=timezone.now() - timedelta(days=days_ago))
+        order.refresh_from_db()
+        if status == Order.Status.COMPLETED:
+            SalesReportService().record_completed(order)
+        return order
+
+    return _make
+
+
+@pytest.mark.django_db
+def test_dashboard_stats_read_rollup(django_assert_num_queries, seller, dorm, make_order):
+    other = User.objects.create_user(email="other@example.com", password="x", dorm=dorm)
+    make_order("30.00", days_ago=1)
+    make_order("10.00", days_ago=2, buyer=other)
+    make_order("20.00", days_ago=3)
+    make_order("99.00", days_ago=4, status=Order.Status.IPTAL)
+    make_order("20.00", days_ago=10)
+    make_order("50.00", days_ago=40)
+
+    with django_assert_num_queries(2):
+        stats = AnalyticsService().get_seller_dashboard_stats(seller.id, days=7)
+
+    assert stats == {
+        "total_revenue": 60.0,
+        "revenue_change": Decimal("200.0"),
+        "total_orders": 3,
+        "orders_change": 200.0,
+        "average_order_value": 20.0,
+        "avg_order_change": Decimal("0.0"),
+        "new_customers": 2,
+        "customers_change": 100.0,
+    }
+
+
+@pytest.mark.django_db
+def test_dashboard_stats_without_orders(seller):
+    stats = AnalyticsService().get_seller_dashboard_stats(seller.id)
+    assert stats["total_revenue"] == 0.0
+    assert stats["total_orders"] == 0
+    assert stats["revenue_change"] == 0
+    assert stats["new_customers"] == 0
+
+
+@pytest.mark.django_db
+def test_revenue_over_time_weekly_buckets(django_assert_num_queries, seller, make_order):
+    # Weeks are 7-day blocks from the start of the range; the last two days of a 30-day
+    # range fall outside the four charted weeks, as before.
+    make_order("10.00", days_ago=1)
+    make_order("15.00", days_ago=2)
+    make_order("20.00", days_ago=9)
+    make_order("40.00", days_ago=29)
+    make_order("99.00", days_ago=3, status=Order.Status.IPTAL)
+
+    with django_assert_num_queries(1):
+        points = AnalyticsService().get_revenue_over_time(seller.id, days=30)
+
+    assert [(point["week"], point["revenue"]) for point in points] == [
+        ("Hafta 1", 40.0),
+        ("Hafta 2", 0.0),
+        ("Hafta 3", 20.0),
+        ("Hafta 4", 15.0),
+    ]
+
+
+@pytest.mark.django_db
+def test_revenue_over_time_daily_and_monthly(seller, make_order):
+    make_order("10.00", days_ago=0)
+    make_order("15.00", days_ago=0)
+    make_order("20.00", days_ago=3)
+    service = AnalyticsService()
+
+    daily = service.get_revenue_over_time(seller.id, days=7, granularity="day")
+    assert len(daily) == 7
+    assert daily[-1]["date"] == timezone.localdate().isoformat()
+    assert daily[-1]["revenue"] == 25.0
+    assert daily[-4]["revenue"] == 20.0
+    assert daily[0]["date"] == (timezone.localdate() - timedelta(days=6)).isoformat()
+    assert sum(point["revenue"] for point in daily) == 45.0
+
+    monthly = service.get_revenue_over_time(seller.id, days=365, granularity="month")
+    assert len(monthly) == 13
+    assert monthly[-1]["date"] == timezone.localdate().replace(day=1).isoformat()
+    assert sum(point["revenue"] for point in monthly) == 45.0
+
+
+@pytest.mark.django_db
+def test_top_products_resolve_images_in_one_query(
+    django_assert_num_queries, settings, tmp_path, make_order, make_product
+):
+    settings.MEDIA_ROOT = tmp_path
+    products = [make_product(name=f"Ürün {i}") for i in range(3)]
+    for product in products[:2]:
+        for name in ("first.gif", "second.gif"):
+            ProductImage.objects.create(product=product, image=SimpleUploadedFile(name, b"GIF89a"))
+    order = make_order("30.00", days_ago=1)
+    for units, product in enumerate(products, start=1):
+        OrderItem.objects.create(order=order, product=product, quantity=units, unit_price=Decimal("10.00"))
+
+    with django_assert_num_queries(2):
+        top = AnalyticsService().get_top_selling_products(order.seller_id)
+
+    expected = ProductImageRepository().primary_for_products(p.id for p in products)
+    assert [row["product_id"] for row in top] == [p.id for p in reversed(products)]
+    assert top[0]["image"] is None
+    assert top[1]["image"] == expected[products[1].id].image.url
+    assert "first" in top[2]["image"]
+
+
+def report_rows(seller):
+    return list(
+        SellerSalesReport.objects.filter(seller=seller)
+        .order_by("day")
+        .values("day", "total_orders", "total_revenue", "total_items", "distinct_customers")
+    )
+
+
+@pytest.mark.django_db
+def test_sales_report_follows_complete_and_cancel(seller, customer, dorm, make_product):
+    other = User.objects.create_user(email="other@example.com", password="x", dorm=dorm)
+    product = make_product(price="5.00", quantity=20)
+    service = OrderService()
+    orders = [
+        service.create_order(customer=buyer, items=[OrderItemDTO(product.id, quantity)])
+        for buyer, quantity in ((customer, 2), (customer, 1), (other, 3))
+    ]
+    for order in orders:
+        service.approve(order.id, seller)
+        service.complete(order.id, seller)
+
+    assert report_rows(seller) == [
+        {
+            "day": timezone.localdate(),
+            "total_orders": 3,
+            "total_revenue": Decimal("30.00"),
+            "total_items": 6,
+            "distinct_customers": 2,
+        }
+    ]
+
+    # A repeated complete sees the locked, already completed row and is rejected.
+    completed = report_rows(seller)
+    with pytest.raises(ValidationError):
+        service.complete(orders[0].id, seller)
+    assert report_rows(seller) == completed
+
+    service.cancel(orders[2].id, seller)
+    [row] = report_rows(seller)
+    assert (row["total_orders"], row["total_revenue"], row["total_items"], row["distinct_customers"]) == (
+        2,
+        Decimal("15.00"),
+        3,
+        1,
+    )
+    incremental = report_rows(seller)
+
+    # A repeated cancel sees the locked, already cancelled row and leaves the rollup alone.
+    service.cancel(orders[2].id, seller)
+    assert report_rows(seller) == incremental
+
+    assert SalesReportService().rebuild() == 1
+    assert report_rows(seller) == incremental
+
+    # The backfill migration runs the same rebuild against historical models.
+    historical_apps = MigrationExecutor(connection).loader.project_state().apps
+    assert SalesReportService().rebuild(apps=historical_apps) == 1
+    assert report_rows(seller) == incremental
+
+    service.cancel(orders[0].id, seller)
+    service.cancel(orders[1].id, seller)
+    assert report_rows(seller) == []
+
+
+@pytest.mark.django_db
+def test_generate_popular_sellers_ranks_and_warms_cache(
+    django_capture_on_commit_callbacks, seller, dorm, customer, make_order
+):
+    rival = User.objects.create_user(email="rival@example.com", password="x", dorm=dorm)
+    tied = User.objects.create_user(email="tied@example.com", password="x", dorm=dorm)
+    gone = User.objects.create_user(email="gone@example.com", password="x", dorm=dorm)
+    make_order("50.00", days_ago=1)
+    for other, total in ((rival, "80.00"), (tied, "50.00")):
+        Order.objects.create(
+            customer=customer, seller=other, dorm=dorm, status=Order.Status.COMPLETED, total_amount=Decimal(total)
+        )
+    PopularSellerRank.objects.create(dorm=dorm, seller=gone, score=1, rank=1)
+    cache.set(f"popular_sellers:{dorm.id}", ["stale"])
+    service = AnalyticsService()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        service.generate_popular_sellers(dorm.id)
+
+    expected = [
+        {"seller_id": rival.id, "score": Decimal("80.00"), "rank": 1},
+        {"seller_id": seller.id, "score": Decimal("50.00"), "rank": 2},
+        {"seller_id": tied.id, "score": Decimal("50.00"), "rank": 2},
+    ]
+    assert cache.get(f"popular_sellers:{dorm.id}") == expected
+    assert not PopularSellerRank.objects.filter(seller=gone).exists()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        service.generate_popular_sellers(dorm.id)
+    assert PopularSellerRank.objects.filter(dorm=dorm).count() == 3
+    assert service.list_popular_sellers(dorm.id) == expected
+
+
+@pytest.mark.django_db
+def test_popular_seller_refresh_is_coalesced(
+    django_capture_on_commit_callbacks, seller, dorm, customer, make_product
+):
+    product = make_product(quantity=20)
+    service = OrderService()
+    orders = [service.create_order(customer=customer, items=[OrderItemDTO(product.id, 1)]) for _ in range(3)]
+    scheduler = PopularSellerRefreshScheduler()
+
+    with patch.object(AnalyticsService, "generate_popular_sellers") as generate:
+        with django_capture_on_commit_callbacks(execute=True):
+            for order in orders:
+                service.approve(order.id, seller)
+        generate.assert_not_called()
+
+        assert scheduler.refresh_dirty([dorm.id, dorm.id + 1]) == [dorm.id]
+        assert scheduler.refresh_dirty([dorm.id]) == []
+    generate.assert_called_once_with(dorm.id)
+
+
+@pytest.mark.django_db
+def test_seller_dashboard_served_from_snapshot(django_assert_num_queries, seller, make_order):
+    client = APIClient()
+    client.force_authenticate(seller)
+    url = "/api/analytics/seller/dashboard?range=7"
+    make_order("30.00", days_ago=1)
+
+    first = client.get(url).json()
+    assert first["stats"]["total_revenue"] == 30.0
+    assert "computed_at" in first
+
+    make_order("20.00", days_ago=1)
+    with django_assert_num_queries(0):
+        assert client.get(url).json() == first
+
+    assert client.get(url + "&fresh=1").json()["stats"]["total_revenue"] == 50.0
+    assert client.get(url).json()["stats"]["total_revenue"] == 50.0
+
+
+@pytest.mark.django_db
+def test_dirty_seller_dashboards_are_rebuilt(seller, make_order):
+    make_order("30.00", days_ago=1)
+    assert dashboard_cache.refresh_dirty([seller.id]) == []
+
+    dashboard_cache.mark_dirty(seller.id)
+    assert dashboard_cache.refresh_dirty([seller.id]) == [seller.id]
+    for days in dashboard_cache.ranges:
+        snapshot = cache.get(f"seller_dashboard:{seller.id}:{days}:week")
+        assert snapshot["stats"]["total_revenue"] == 30.0
+    assert dashboard_cache.refresh_dirty([seller.id]) == []
+
+
+@pytest.mark.django_db
+def test_platform_metrics_snapshot(django_assert_num_queries, dorm, make_order):
+    make_order("30.00", days_ago=1)
+    make_order("20.00", days_ago=40)
+    make_order("99.00", days_ago=1, status=Order.Status.PENDING)
+    admin = User.objects.create_user(email="admin@example.com", password="x", dorm=dorm, is_staff=True)
+    User.objects.filter(id=admin.id).update(last_login=timezone.now())
+    service = PlatformMetricsService()
+
+    with django_assert_num_queries(3):
+        counters = service.compute()
+    assert counters["total_revenue"] == Decimal("50.00")
+    assert (counters["sales"], counters["sales_last_month"], counters["sales_prev_month"]) == (2, 1, 1)
+    assert counters["active_now"] == 1
+
+    service.refresh()
+    client = APIClient()
+    client.force_authenticate(admin)
+    make_order("70.00", days_ago=1)
+    with django_assert_num_queries(0):
+        data = client.get("/api/admin/dashboard").json()
+    assert data["total_revenue"] == 50.0
+    assert data["sales_change"] == 0
+    assert data["active_now"] == 1
+    assert data["computed_at"]
+
+    cache.clear()
+    assert service.snapshot().total_revenue == Decimal("50.00")
+    assert service.refresh().total_revenue == Decimal("120.00")
+    assert PlatformMetrics.objects.count() == 1
@@ -0,0 +1,188 @@
+import threading
+from collections import defaultdict
+
+import pytest
+from django.core import mail
+from django.db import transaction
+
+from core.events import (
+    EventDispatcher,
+    OrderCreatedEvent,
+    ProductOutOfStockEvent,
+    StockDecreasedEvent,
+)
+from core.events.dispatcher import (
+    event_dispatcher,
+    handler_calls,
+    handler_duration,
+    handler_errors,
+    handler_id,
+    handler_slow,
+)
+from core.events.outbox import OutboxRelay
+from core.models import OutboxEvent
+from core.utils.metrics import registry
+from modules.notifications.services import SMTPNotificationService
+from modules.orders.services import OrderItemDTO, OrderService
+
+
+def test_deferred_handlers_wait_for_commit(transactional_db):
+    dispatcher = EventDispatcher()
+    calls = []
+    dispatcher.subscribe(OrderCreatedEvent, lambda event: calls.append(("sync", event.payload)))
+    dispatcher.subscribe(OrderCreatedEvent, lambda event: calls.append(("deferred", event.payload)), deferred=True)
+
+    with transaction.atomic():
+        dispatcher.dispatch(OrderCreatedEvent(payload={"order_id": 1}))
+        assert calls == [("sync", {"order_id": 1})]
+    assert calls[-1] == ("deferred", {"order_id": 1})
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            dispatcher.dispatch(OrderCreatedEvent(payload={"order_id": 2}))
+            raise RuntimeError
+    assert ("deferred", {"order_id": 2}) not in calls
+
+
+def test_thread_backend_runs_off_the_request_thread(settings, transactional_db):
+    settings.EVENT_HANDLER_BACKEND = "thread"
+    dispatcher = EventDispatcher()
+    done = threading.Event()
+    threads = []
+
+    def handler(event):
+        threads.append(threading.current_thread().name)
+        done.set()
+
+    def failing(event):
+        raise ValueError("boom")
+
+    dispatcher.subscribe(OrderCreatedEvent, failing, deferred=True)
+    dispatcher.subscribe(OrderCreatedEvent, handler, deferred=True)
+    dispatcher.dispatch(OrderCreatedEvent(payload={"order_id": 1}))
+
+    assert done.wait(5)
+    assert threads[0].startswith("event-handler")
+
+
+@pytest.mark.django_db
+def test_order_mail_sent_after_commit(customer, make_product, django_capture_on_commit_callbacks):
+    product = make_product()
+    with django_capture_on_commit_callbacks(execute=False):
+        OrderService().create_order(customer=customer, items=[OrderItemDTO(product.id, 1)])
+    assert mail.outbox == []
+
+    assert OutboxEvent.objects.filter(name="order_created", status=OutboxEvent.Status.PENDING).count() == 1
+
+    # The next relay run also picks up the event whose commit hook never fired.
+    with django_capture_on_commit_callbacks(execute=True):
+        OrderService().create_order(customer=customer, items=[OrderItemDTO(product.id, 1)])
+    assert [message.subject for message in mail.outbox] == ["Yeni siparişiniz var"] * 2
+    assert not OutboxEvent.objects.filter(name="order_created").exclude(status=OutboxEvent.Status.DELIVERED).exists()
+
+
+@pytest.mark.django_db
+def test_outbox_relay_retries_then_parks_failed_events(settings):
+    settings.EVENT_OUTBOX_MAX_ATTEMPTS = 2
+    dispatcher = EventDispatcher()
+    delivered = []
+    dispatcher.subscribe(OrderCreatedEvent, lambda event: delivered.append(event.payload["order_id"]))
+
+    def flaky(event):
+        if event.payload["order_id"] == 2:
+            raise RuntimeError("smtp down")
+
+    dispatcher.subscribe(OrderCreatedEvent, flaky, deferred=True)
+    relay = OutboxRelay(dispatcher=dispatcher, batch_size=2)
+    relay.publish_many(OrderCreatedEvent(payload={"order_id": order_id}) for order_id in (1, 2, 3))
+
+    assert relay.drain() == 2
+    assert delivered == [1, 2, 3]
+    failed = OutboxEvent.objects.get(payload__order_id=2)
+    assert (failed.status, failed.attempts, failed.last_error) == ("PENDING", 1, "RuntimeError: smtp down")
+
+    OutboxEvent.objects.filter(id=failed.id).update(available_at=failed.created_at)
+    assert relay.drain() == 0
+    failed.refresh_from_db()
+    assert (failed.status, failed.attempts) == ("FAILED", 2)
+    assert delivered == [1, 2, 3, 2]
+
+
+def test_dispatch_many_groups_events_for_batch_handlers():
+    dispatcher = EventDispatcher()
+    batches, singles = [], []
+    dispatcher.subscribe(StockDecreasedEvent, lambda events: batches.append(events), batch=True)
+    dispatcher.subscribe(StockDecreasedEvent, lambda event: singles.append(event))
+
+    events = [StockDecreasedEvent(payload={"product_id": product_id}) for product_id in (1, 2, 3)]
+    dispatcher.dispatch_many([*events, OrderCreatedEvent(payload={"order_id": 1})])
+
+    assert batches == [events]
+    assert singles == events
+
+
+def test_failing_event_does_not_skip_the_rest_of_the_group():
+    received = []
+
+    def picky_handler(event):
+        if event.payload["product_id"] == 1:
+            raise RuntimeError("bad event")
+        received.append(event.payload["product_id"])
+
+    events = [StockDecreasedEvent(payload={"product_id": product_id}) for product_id in (1, 2, 3)]
+    inline, deferred = EventDispatcher(), EventDispatcher()
+    inline.subscribe(StockDecreasedEvent, picky_handler)
+    deferred.subscribe(StockDecreasedEvent, picky_handler, deferred=True)
+
+    inline.dispatch_many(events)
+    deferred.run_deferred(handler_id(picky_handler), events)
+
+    assert received == [2, 3, 2, 3]
+    labels = {"event": "stock_decreased", "handler": handler_id(picky_handler)}
+    assert handler_errors.value(**labels) == 2
+
+
+@pytest.mark.django_db
+def test_out_of_stock_digest_per_seller(
+    customer, make_product, django_capture_on_commit_callbacks, django_assert_num_queries
+):
+    products = [make_product(name=f"Ürün {i}", quantity=1) for i in range(3)]
+    events = [ProductOutOfStockEvent(payload={"product_id": product.id}) for product in products]
+
+    with django_assert_num_queries(1):
+        SMTPNotificationService().handle_products_out_of_stock(events)
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].subject == "3 Ürününüz Tükendi"
+    assert all(product.name in mail.outbox[0].body for product in products)
+
+    mail.outbox.clear()
+    with django_capture_on_commit_callbacks(execute=True):
+        OrderService().create_order(customer=customer, items=[OrderItemDTO(product.id, 1) for product in products])
+    assert sorted(message.subject for message in mail.outbox) == ["3 Ürününüz Tükendi", "Yeni siparişiniz var"]
+
+
+@pytest.mark.django_db
+def test_failing_handler_is_isolated_and_measured(settings, customer, make_product, monkeypatch):
+    settings.EVENT_HANDLER_SLOW_MS = 0
+    product = make_product()
+
+    def broken_notifier(event):
+        raise RuntimeError("smtp down")
+
+    calls = []
+    monkeypatch.setattr(event_dispatcher, "_subscribers", defaultdict(list, event_dispatcher._subscribers))
+    event_dispatcher.subscribe(OrderCreatedEvent, broken_notifier)
+    event_dispatcher.subscribe(OrderCreatedEvent, calls.append)
+
+    order = OrderService().create_order(customer=customer, items=[OrderItemDTO(product.id, 1)])
+    event_dispatcher.dispatch(OrderCreatedEvent(payload={"order_id": order.id}))
+
+    assert len(calls) == 1
+    labels = {"event": "order_created", "handler": handler_id(broken_notifier)}
+    assert handler_calls.value(**labels) == 1
+    assert handler_errors.value(**labels) == 1
+    assert handler_duration.count(**labels) == 1
+    ok_labels = {"event": "order_created", "handler": handler_id(calls.append)}
+    assert handler_errors.value(**ok_labels) == 0
+    assert handler_slow.value(**ok_labels) >= 1
+    assert 'event_handler_errors_total{event="order_created",handler="tests.test_events.' in registry.render()
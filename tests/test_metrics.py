@@ -0,0 +1,72 @@
+import pytest
+from rest_framework.test import APIClient
+
+from core.middleware.metrics import cache_lookups, request_queries, requests_total, response_size
+from core.utils.metrics import MetricsRegistry
+from core.views import metrics_view
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    registry.counter("jobs", "Jobs run.", ("queue",)).inc(queue="mail")
+    histogram = registry.histogram("job_seconds", "Job time.", buckets=(0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+
+    assert registry.render().splitlines() == [
+        "# HELP job_seconds Job time.",
+        "# TYPE job_seconds histogram",
+        'job_seconds_bucket{le="0.1"} 1',
+        'job_seconds_bucket{le="1"} 2',
+        'job_seconds_bucket{le="+Inf"} 2',
+        "job_seconds_count 2",
+        "job_seconds_sum 0.55",
+        "# HELP jobs_total Jobs run.",
+        "# TYPE jobs_total counter",
+        'jobs_total{queue="mail"} 1',
+    ]
+
+
+@pytest.mark.django_db
+def test_requests_are_measured_per_view(customer, make_product, settings):
+    settings.METRICS_ALLOWED_IPS = ["127.0.0.1"]
+    make_product()
+    client = APIClient()
+    client.force_authenticate(customer)
+    labels = {"view": "products-list", "method": "GET"}
+    requests_before = requests_total.value(**labels, status="2xx")
+    queries_before = request_queries.sum(**labels)
+    hits_before = cache_lookups.value(view="products-list", result="hit")
+
+    assert client.get("/api/products/").status_code == 200
+    assert client.get("/api/products/").status_code == 200
+
+    assert requests_total.value(**labels, status="2xx") == requests_before + 2
+    assert request_queries.sum(**labels) > queries_before
+    assert response_size.count(**labels) >= 2
+    # The second request is served from the catalog cache.
+    assert cache_lookups.value(view="products-list", result="hit") > hits_before
+
+    response = client.get("/metrics")
+    assert response["Content-Type"].startswith("text/plain")
+    assert 'http_requests_total{view="products-list",method="GET",status="2xx"}' in response.content.decode()
+
+
+def test_metrics_endpoint_is_closed_by_default_outside_debug(rf, settings):
+    settings.METRICS_ALLOWED_IPS = []
+    settings.METRICS_TOKEN = ""
+    settings.DEBUG = False
+    assert metrics_view(rf.get("/metrics")).status_code == 403
+
+    settings.DEBUG = True
+    assert metrics_view(rf.get("/metrics")).status_code == 200
+
+
+def test_metrics_endpoint_accepts_allowed_ips_or_token(client, settings):
+    settings.DEBUG = False
+    settings.METRICS_ALLOWED_IPS = ["10.0.0.1"]
+    settings.METRICS_TOKEN = "s3cret"
+    assert client.get("/metrics").status_code == 403
+    assert client.get("/metrics", REMOTE_ADDR="10.0.0.1").status_code == 200
+    assert client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code == 403
+    assert client.get("/metrics", HTTP_AUTHORIZATION="Bearer s3cret").status_code == 200
@@ -0,0 +1,150 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from core.exceptions import ValidationError
+from modules.orders.models import OrderIdempotencyKey
+from modules.orders.services import OrderItemDTO, OrderService
+from modules.orders.tasks import purge_idempotency_keys
+from modules.products.models import Product, Stock
+
+
+@pytest.mark.django_db
+def test_create_order_reserves_stock_for_every_line(customer, make_product):
+    chips = make_product(name="Cips", quantity=5)
+    cola = make_product(name="Kola", quantity=2)
+
+    order = OrderService().create_order(
+        customer=customer,
+        items=[OrderItemDTO(chips.id, 2), OrderItemDTO(cola.id, 2), OrderItemDTO(chips.id, 1)],
+    )
+
+    assert order.items.count() == 3
+    assert Stock.objects.get(product=chips).quantity == 2
+    assert Stock.objects.get(product=cola).quantity == 0
+    cola.refresh_from_db()
+    assert cola.is_out_of_stock is True
+    assert cola.is_active is False
+
+
+@pytest.mark.django_db
+def test_create_order_rejects_insufficient_stock_atomically(customer, make_product):
+    chips = make_product(name="Cips", quantity=5)
+    cola = make_product(name="Kola", quantity=1)
+
+    with pytest.raises(ValidationError):
+        OrderService().create_order(
+            customer=customer,
+            items=[OrderItemDTO(chips.id, 2), OrderItemDTO(cola.id, 3)],
+        )
+
+    assert Stock.objects.get(product=chips).quantity == 5
+    assert not Product.objects.get(id=cola.id).is_out_of_stock
+
+
+@pytest.mark.django_db
+def test_create_order_query_count_is_independent_of_cart_size(
+    customer, make_product, django_assert_max_num_queries
+):
+    small = [make_product(name=f"Küçük {i}") for i in range(2)]
+    large = [make_product(name=f"Büyük {i}") for i in range(10)]
+
+    with django_assert_max_num_queries(12) as small_ctx:
+        OrderService().create_order(customer=customer, items=[OrderItemDTO(p.id, 1) for p in small])
+    with django_assert_max_num_queries(len(small_ctx.captured_queries)):
+        OrderService().create_order(customer=customer, items=[OrderItemDTO(p.id, 1) for p in large])
+
+
+@pytest.fixture
+def customer_client(customer):
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+    client.force_authenticate(customer)
+    return client
+
+
+@pytest.mark.django_db
+def test_order_submission_is_replayed_for_same_idempotency_key(customer_client, make_product):
+    product = make_product(quantity=5)
+    payload = {
+        "items": [{"product_id": product.id, "quantity": 2}],
+        "delivery_address": "A Blok 7",
+        "delivery_phone": "5551112233",
+    }
+
+    first = customer_client.post("/api/orders/", payload, format="json", HTTP_IDEMPOTENCY_KEY="retry-1")
+    second = customer_client.post("/api/orders/", payload, format="json", HTTP_IDEMPOTENCY_KEY="retry-1")
+
+    assert first.status_code == second.status_code == 201
+    assert second.json() == first.json()
+    assert second["Idempotent-Replayed"] == "true"
+    assert Stock.objects.get(product=product).quantity == 3
+
+    payload["items"][0]["quantity"] = 1
+    mismatch = customer_client.post("/api/orders/", payload, format="json", HTTP_IDEMPOTENCY_KEY="retry-1")
+    assert mismatch.status_code == 422
+
+
+@pytest.mark.django_db
+def test_idempotency_key_survives_cache_eviction(customer_client, make_product):
+    from django.core.cache import cache
+
+    product = make_product(quantity=5)
+    payload = {
+        "items": [{"product_id": product.id, "quantity": 1}],
+        "delivery_address": "A Blok 7",
+        "delivery_phone": "5551112233",
+    }
+
+    first = customer_client.post("/api/orders/", payload, format="json", HTTP_IDEMPOTENCY_KEY="retry-2")
+    cache.clear()
+    second = customer_client.post("/api/orders/", payload, format="json", HTTP_IDEMPOTENCY_KEY="retry-2")
+
+    assert second.status_code == 201
+    assert second.json()["id"] == first.json()["id"]
+    assert Stock.objects.get(product=product).quantity == 4
+
+
+@pytest.mark.django_db
+def test_expired_idempotency_keys_are_purged(customer_client, make_product):
+    product = make_product(quantity=5)
+    payload = {
+        "items": [{"product_id": product.id, "quantity": 1}],
+        "delivery_address": "A Blok 7",
+        "delivery_phone": "5551112233",
+    }
+    for key in ("old", "fresh"):
+        customer_client.post("/api/orders/", payload, format="json", HTTP_IDEMPOTENCY_KEY=key)
+    OrderIdempotencyKey.objects.filter(key="old").update(expires_at=timezone.now() - timedelta(seconds=1))
+
+    purge_idempotency_keys()
+
+    assert list(OrderIdempotencyKey.objects.values_list("key", flat=True)) == ["fresh"]
+
+
+@pytest.mark.django_db
+def test_order_list_is_keyset_paginated_with_constant_queries(
+    customer, customer_client, make_product, django_assert_max_num_queries
+):
+    products = [make_product(name=f"Ürün {i}", quantity=50) for i in range(3)]
+    service = OrderService()
+    for i in range(7):
+        service.create_order(customer=customer, items=[OrderItemDTO(p.id, 1) for p in products[: 1 + i % 3]])
+
+    seen = []
+    url = "/api/orders/?page_size=3"
+    while url:
+        with django_assert_max_num_queries(5):
+            response = customer_client.get(url)
+        assert response.status_code == 200
+        body = response.json()
+        seen.extend(order["id"] for order in body["results"])
+        url = body["next"]
+
+    assert seen == sorted(seen, reverse=True)
+    assert len(seen) == len(set(seen)) == 7
+
+    filtered = customer_client.get("/api/orders/", {"status": "COMPLETED"}).json()
+    assert filtered["results"] == []
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+
+from modules.orders.models import Order
+from modules.orders.presenters import OrderPresenter
+from modules.orders.serializers import OrderSerializer
+from modules.orders.services import OrderItemDTO, OrderService
+from modules.products.models import Product, ProductImage
+from modules.products.presenters import ProductPresenter
+from modules.products.serializers import ProductSerializer
+from modules.users.models import User
+
+
+def as_json(data):
+    return json.loads(JSONRenderer().render(data))
+
+
+@pytest.fixture
+def catalog(settings, tmp_path, dorm, category, make_product):
+    settings.MEDIA_ROOT = tmp_path
+    with_images = make_product(name="Resimli", price="7.50")
+    for name in ("a.gif", "b.gif"):
+        ProductImage.objects.create(product=with_images, image=SimpleUploadedFile(name, b"GIF89a"))
+    make_product(name="Resimsiz", price="3")
+    plain_seller = User.objects.create_user(email="plain@example.com", password="x", dorm=dorm, phone="123")
+    Product.objects.create(seller=plain_seller, dorm=dorm, category=category, name="Stoksuz", price="1.25")
+    return Product.objects.order_by("id")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("with_request", [False, True])
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_product_presenter_matches_serializer(catalog, with_request, prefetch):
+    context = {"request": RequestFactory().get("/api/products/")} if with_request else {}
+    products = catalog.select_related("stock", "category", "seller")
+    if prefetch:
+        products = products.prefetch_related("images")
+
+    expected = as_json(ProductSerializer(list(products), many=True, context=dict(context)).data)
+    actual = as_json(ProductPresenter(context=dict(context)).present_many(list(products)))
+
+    assert actual == expected
+    assert any(row["images"] for row in actual)
+    assert any(row["stock_quantity"] is None for row in actual)
+
+
+@pytest.mark.django_db
+def test_order_presenter_matches_serializer(customer, make_product):
+    products = [make_product(name=f"Ürün {i}", price=f"{i + 1}.10") for i in range(3)]
+    service = OrderService()
+    service.create_order(customer=customer, items=[OrderItemDTO(p.id, 2) for p in products])
+    order = service.create_order(customer=customer, items=[OrderItemDTO(products[0].id, 1)])
+    Order.objects.filter(id=order.id).update(status=Order.Status.ONAY)
+
+    orders = list(service.list_for_customer(customer))
+    assert as_json(OrderPresenter().present_many(orders)) == as_json(OrderSerializer(orders, many=True).data)
+
+    bare = list(Order.objects.order_by("id"))
+    assert as_json(OrderPresenter().present_many(bare)) == as_json(OrderSerializer(bare, many=True).data)
+
+
+@pytest.mark.django_db
+def test_product_presenter_batches_unprefetched_images(django_assert_num_queries, catalog):
+    products = list(catalog.select_related("stock", "category", "seller__seller_profile"))
+    # Sellers come from select_related, so the only query is the batched image fetch.
+    with django_assert_num_queries(1):
+        rows = ProductPresenter().present_many(products)
+    assert rows[0]["image_url"].endswith(".gif")
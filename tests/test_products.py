@@ -0,0 +1,152 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from modules.orders.services import OrderItemDTO, OrderService
+from modules.products.models import Product, Stock
+from modules.products.services import ProductService
+
+
+@pytest.fixture
+def api_client(customer):
+    client = APIClient()
+    client.force_authenticate(customer)
+    return client
+
+
+@pytest.mark.django_db
+def test_dorm_catalog_is_cached_until_a_write_bumps_the_version(
+    api_client, seller, make_product, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        product = make_product(name="Simit", quantity=3)
+    first = api_client.get("/api/products/").json()
+    assert [p["name"] for p in first["results"]] == ["Simit"]
+
+    with django_assert_num_queries(0):
+        assert api_client.get("/api/products/").json() == first
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ProductService().update_product(product_id=product.id, seller=seller, name="Poğaça")
+    assert [p["name"] for p in api_client.get("/api/products/").json()["results"]] == ["Poğaça"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Stock.decrement(product.id, 1)
+    assert api_client.get("/api/products/").json()["results"][0]["stock_quantity"] == 2
+
+
+@pytest.mark.django_db
+def test_catalog_and_detail_honour_if_none_match(
+    api_client, seller, make_product, django_assert_max_num_queries, django_capture_on_commit_callbacks
+):
+    product = make_product(name="Simit", quantity=3)
+
+    catalog = api_client.get("/api/products/")
+    detail = api_client.get(f"/api/products/{product.id}")
+    assert catalog.status_code == detail.status_code == 200
+
+    with django_assert_max_num_queries(0):
+        assert api_client.get("/api/products/", HTTP_IF_NONE_MATCH=catalog["ETag"]).status_code == 304
+    with django_assert_max_num_queries(1):
+        assert api_client.get(f"/api/products/{product.id}", HTTP_IF_NONE_MATCH=detail["ETag"]).status_code == 304
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ProductService().update_product(product_id=product.id, seller=seller, price="12.50")
+    refreshed = api_client.get(f"/api/products/{product.id}", HTTP_IF_NONE_MATCH=detail["ETag"])
+    assert refreshed.status_code == 200
+    assert refreshed.json()["price"] == "12.50"
+    assert api_client.get("/api/products/", HTTP_IF_NONE_MATCH=catalog["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_popularity_ranking_revalidates_after_complete_and_cancel(
+    api_client, customer, seller, make_product, django_capture_on_commit_callbacks
+):
+    pogaca, _ = make_product(name="Poğaça", quantity=5), make_product(name="Simit", quantity=5)
+    service = OrderService()
+    with django_capture_on_commit_callbacks(execute=True):
+        order = service.create_order(customer=customer, items=[OrderItemDTO(pogaca.id, 2)])
+        service.approve(order.id, seller)
+
+    url = "/api/products/?sort=popularity"
+    before = api_client.get(url)
+    assert [p["name"] for p in before.json()["results"]] == ["Simit", "Poğaça"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        service.complete(order.id, seller)
+    after = api_client.get(url, HTTP_IF_NONE_MATCH=before["ETag"])
+    assert after.status_code == 200
+    assert [p["name"] for p in after.json()["results"]] == ["Poğaça", "Simit"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        service.cancel(order.id, seller)
+    assert api_client.get(url, HTTP_IF_NONE_MATCH=after["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_catalog_filters_search_and_pages(api_client, make_product):
+    make_product(name="Elma", price="5.00", quantity=0)
+    make_product(name="Armut", price="8.00", quantity=4, description="taze meyve")
+    make_product(name="Muz", price="12.00", quantity=2)
+    make_product(name="Kiraz", price="20.00", quantity=1)
+
+    names = lambda response: [p["name"] for p in response.json()["results"]]  # noqa: E731
+
+    assert names(api_client.get("/api/products/", {"min_price": "6", "max_price": "15"})) == ["Armut", "Muz"]
+    assert names(api_client.get("/api/products/", {"in_stock": "true", "sort": "-price"})) == ["Kiraz", "Muz", "Armut"]
+    assert names(api_client.get("/api/products/", {"q": "meyve"})) == ["Armut"]
+    assert len(names(api_client.get("/api/products/", {"sort": "popularity"}))) == 4
+    assert api_client.get("/api/products/", {"sort": "random"}).status_code == 400
+
+    pages = []
+    url = "/api/products/?sort=price&page_size=3"
+    while url:
+        body = api_client.get(url).json()
+        pages.append([p["name"] for p in body["results"]])
+        url = body["next"]
+    assert pages == [["Elma", "Armut", "Muz"], ["Kiraz"]]
+
+
+@pytest.mark.django_db
+def test_newest_catalog_pages_keep_rows_sharing_a_millisecond(api_client, make_product):
+    base = timezone.now().replace(microsecond=0)
+    for name, micros in (("Elma", 123400), ("Armut", 123456), ("Muz", 100000)):
+        product = make_product(name=name)
+        Product.objects.filter(id=product.id).update(created_at=base + timedelta(microseconds=micros))
+
+    names, url = [], "/api/products/?sort=newest&page_size=1"
+    while url:
+        body = api_client.get(url).json()
+        names += [p["name"] for p in body["results"]]
+        url = body["next"]
+    assert names == ["Armut", "Elma", "Muz"]
+
+
+@pytest.mark.django_db
+def test_seller_contact_fields_cost_one_query_per_response(
+    dorm, category, make_product, django_assert_num_queries
+):
+    from modules.products.models import Product
+    from modules.products.serializers import ProductSerializer
+    from modules.users.models import SellerProfile, User
+
+    make_product(name="İlk")
+    for i in range(3):
+        other = User.objects.create_user(email=f"s{i}@example.com", password="x", dorm=dorm, role=User.Roles.SELLER)
+        SellerProfile.objects.create(user=other, dorm=dorm, phone=f"555000{i}", store_is_open=bool(i % 2))
+        for j in range(2):
+            product = Product.objects.create(seller=other, dorm=dorm, category=category, name=f"Ürün {i}{j}", price=1)
+            Stock.objects.create(product=product, quantity=1)
+
+    products = list(Product.objects.select_related("stock", "category").prefetch_related("images"))
+    with django_assert_num_queries(1):
+        data = ProductSerializer(products, many=True).data
+
+    by_name = {row["name"]: row for row in data}
+    assert by_name["İlk"]["seller_phone"] == "5550000000"
+    assert by_name["İlk"]["seller_room"] == "A Blok, 12 No"
+    assert by_name["Ürün 10"]["seller_phone"] == "5550001"
+    assert by_name["Ürün 10"]["seller_store_is_open"] is True
+    assert by_name["Ürün 00"]["seller_store_is_open"] is False
@@ -0,0 +1,44 @@
+import pytest
+from rest_framework.test import APIClient
+
+from core.utils.queries import QueryBudgetExceeded, QueryRecorder, normalize_sql
+from modules.products.models import Product
+from modules.products.presenters import ProductPresenter
+from modules.products.serializers import ProductSerializer
+
+
+def test_normalize_sql_groups_queries_differing_only_in_values():
+    assert normalize_sql('SELECT * FROM "t" WHERE "t"."id" IN (%s, %s)  LIMIT 21') == normalize_sql(
+        'SELECT * FROM "t" WHERE "t"."id" IN (%s) LIMIT 1'
+    )
+    assert normalize_sql("SELECT 'a', 10 FROM t") == "SELECT ?, ? FROM t"
+    assert normalize_sql('SAVEPOINT "s1_x3"') == normalize_sql('SAVEPOINT "s1_x4"')
+
+
+@pytest.mark.django_db
+def test_recorder_flags_per_row_queries(make_product, query_budget):
+    for i in range(6):
+        make_product(name=f"Ürün {i}")
+    products = list(Product.objects.select_related("stock", "category", "seller__seller_profile"))
+
+    with QueryRecorder().record() as recorder:
+        data = ProductSerializer(products, many=True).data
+    assert len(data) == 6
+    repeated = recorder.repeated(threshold=5)
+    assert repeated
+    assert all(count == 6 and '"products_productimage"' in template for template, count in repeated)
+
+    with query_budget(1):
+        ProductPresenter().present_many(products)
+
+
+@pytest.mark.django_db
+def test_middleware_enforces_view_budget(customer, make_product, settings):
+    product = make_product()
+    client = APIClient()
+    client.force_authenticate(customer)
+    assert client.get("/api/products/")["X-Query-Count"] == "2"
+
+    settings.QUERY_BUDGETS = {"products-list": 1}
+    with pytest.raises(QueryBudgetExceeded, match="2 queries, budget is 1"):
+        client.get(f"/api/products/?dorm={product.dorm_id}")
@@ -0,0 +1,56 @@
+import pytest
+
+from core.events import event_dispatcher
+from modules.products.models import Product, Stock
+
+
+@pytest.fixture
+def captured_events():
+    events = []
+
+    def _capture(event):
+        events.append(event)
+
+    event_dispatcher.subscribe("stock_decreased", _capture)
+    event_dispatcher.subscribe("product_out_of_stock", _capture)
+    yield events
+    event_dispatcher.unsubscribe("stock_decreased", _capture)
+    event_dispatcher.unsubscribe("product_out_of_stock", _capture)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_decrement_returns_new_quantity(make_product, captured_events):
+    product = make_product(quantity=5)
+
+    assert Stock.decrement(product.id, 2) == 3
+    assert Stock.objects.get(product=product).quantity == 3
+    assert [(e.name, e.payload) for e in captured_events] == [
+        ("stock_decreased", {"product_id": product.id, "quantity": 3, "dorm_id": product.dorm_id})
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_decrement_reports_insufficient_stock(make_product, captured_events):
+    product = make_product(quantity=1)
+
+    assert Stock.decrement(product.id, 2) is None
+    assert Stock.objects.get(product=product).quantity == 1
+    assert captured_events == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_decrease_to_zero_marks_product_out_of_stock(make_product, captured_events):
+    product = make_product(quantity=2)
+    stock = Stock.objects.select_related("product").get(product=product)
+
+    stock.decrease(2)
+
+    assert stock.quantity == 0
+    assert stock.product.is_out_of_stock is True
+    product.refresh_from_db()
+    assert product.is_out_of_stock is True
+    assert product.is_active is False
+    assert [e.name for e in captured_events] == ["stock_decreased", "product_out_of_stock"]
+    with pytest.raises(ValueError):
+        stock.decrease(1)
+    assert Product.objects.get(id=product.id).stock.quantity == 0